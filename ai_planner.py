@@ -0,0 +1,328 @@
+"""
+Snake Game - 멀티 프로세스 AI 계획
+GIL 때문에 스레드로는 AI 방향 계산을 나눠 돌릴 수 없으므로, 워커 프로세스들이 공유 메모리의 월드를 읽고
+AI 뱀들을 나눠 맡아 방향을 계산한다.
+
+공유 메모리 (multiprocessing.shared_memory)
+    - 점유 격자: Arena의 층 배열(몸통/음식/투사체 칸 개수) 자체를 공유 메모리에 둠.
+      월드가 평소처럼 격자를 갱신하면 워커도 같은 메모리를 읽으므로 틱마다 복사하지 않는다.
+    - 개체 표: 뱀마다 한 줄 (살아 있음, 머리 칸 x, 머리 칸 y, 길이). 계획을 보내기 직전에 채움.
+
+틱 진행 (AIPlanner.plan)
+    1) 개체 표를 채우고 계획할 AI 뱀을 워커 수만큼 겹치지 않게 나눠 보냄
+    2) 틱 마감 시간(deadline_ms)까지 결과를 모아 snake.planned_direction에 기록
+    3) 마감까지 답하지 않은 워커의 뱀은 planned_direction이 없으므로 Snake.move가
+       기존 탐욕 AI(ai_decide_direction)로 방향을 정함
+늦게 도착한 결과는 틱 번호가 달라서 버린다. 워커는 밀린 요청 중 가장 최근 것만 계산한다.
+
+워커 정책 (plan_direction)은 탐욕 AI보다 무거운 선행 탐색이다.
+    - 머리에서 너비 우선 탐색으로 막히지 않은 경로상 가장 가까운 음식 칸을 찾음
+    - 그 방향으로 갔을 때 들어갈 수 있는 공간이 몸길이보다 작으면(막다른 곳) 가장 넓은 방향을 고름
+추적(플레이어 쫓기) 상태인 뱀은 상태가 있는 판단이라 계획하지 않고 기존 AI가 맡는다 (module.plannable_ai_indices).
+
+사용:
+    planner = AIPlanner(workers=3)      # 로컬 게임은 get_ai_planner()로 판마다 같은 워커를 재사용
+    set_arena(planner.new_arena())      # 새 판의 점유 격자로 사용
+    ...틱마다 update_snakes 전에
+    planner.plan(snakes, plannable_ai_indices(snakes), tick)
+    ...
+    planner.close()
+"""
+
+import atexit
+import multiprocessing
+import os
+import signal
+import time
+from array import array
+from collections import deque
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from arena import Arena, BODIES, FOOD, PROJECTILES
+
+DEFAULT_DEADLINE_MS = 15     # 틱 예산(약 66ms) 중 계획 결과를 기다리는 시간
+MAX_ENTITIES = 512           # 개체 표 줄 수 (넘는 뱀은 계획하지 않음)
+ENTITY_FIELDS = 4            # alive, 머리 칸 x, 머리 칸 y, 길이
+SEARCH_LIMIT = 2000          # 뱀 하나당 너비 우선 탐색으로 방문할 최대 칸 수
+
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+STEPS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+#############################################
+# 워커 정책
+#############################################
+def is_open(arena, x, y):
+    """칸이 화면 안이고 몸통/투사체가 없는지 확인"""
+    if not (0 <= x < arena.columns and 0 <= y < arena.rows):
+        return False
+    cell = y * arena.columns + x
+    return not arena.layers[BODIES][cell] and not arena.layers[PROJECTILES][cell]
+
+def open_area(arena, start_x, start_y, limit):
+    """(start_x, start_y)에서 갈 수 있는 칸 수 (limit에서 멈춤)"""
+    if not is_open(arena, start_x, start_y):
+        return 0
+    seen = {(start_x, start_y)}
+    queue = deque(seen)
+    while queue and len(seen) < limit:
+        x, y = queue.popleft()
+        for step_x, step_y in STEPS:
+            cell = (x + step_x, y + step_y)
+            if cell not in seen and is_open(arena, *cell):
+                seen.add(cell)
+                queue.append(cell)
+    return len(seen)
+
+def plan_direction(arena, head_x, head_y, length):
+    """
+    머리 칸 (head_x, head_y)인 뱀의 다음 방향 계산
+
+    Returns:
+        str: 방향 이름 (갈 수 있는 칸이 없으면 None)
+    """
+    first_steps = {}
+    queue = deque()
+    for index, (step_x, step_y) in enumerate(STEPS):
+        cell = (head_x + step_x, head_y + step_y)
+        if is_open(arena, *cell):
+            first_steps[cell] = index
+            queue.append(cell)
+    if not queue:
+        return None
+
+    # 가장 가까운 음식 칸까지의 첫 방향 (너비 우선 탐색)
+    target = None
+    food = arena.layers[FOOD]
+    while queue and len(first_steps) < SEARCH_LIMIT:
+        x, y = queue.popleft()
+        if food[y * arena.columns + x]:
+            target = first_steps[(x, y)]
+            break
+        for step_x, step_y in STEPS:
+            cell = (x + step_x, y + step_y)
+            if cell not in first_steps and is_open(arena, *cell):
+                first_steps[cell] = first_steps[(x, y)]
+                queue.append(cell)
+
+    # 막다른 곳 피하기: 음식 방향의 공간이 몸길이보다 좁으면 가장 넓은 방향으로
+    areas = {}
+    for index, (step_x, step_y) in enumerate(STEPS):
+        areas[index] = open_area(arena, head_x + step_x, head_y + step_y, length + 1)
+    if target is None or areas[target] <= length:
+        target = max(areas, key=areas.get)
+        if not areas[target]:
+            return None
+    return DIRECTIONS[target]
+
+def planner_worker_main(conn, arena_name, entities_name, width, height, cell_size):
+    """워커 프로세스 진입점 - 공유 메모리를 붙여서 계획 요청을 처리"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    arena_memory = shared_memory.SharedMemory(name=arena_name)
+    entities_memory = shared_memory.SharedMemory(name=entities_name)
+    arena = Arena(width, height, cell_size, buffer=arena_memory.buf)
+    entities = entities_memory.buf.cast('i')
+    try:
+        while True:
+            command, data = conn.recv()
+            # 밀린 요청이 있으면 가장 최근 것만 계산
+            while command == "plan" and conn.poll():
+                command, data = conn.recv()
+            if command == "plan":
+                tick, indices = data
+                results = []
+                for index in indices:
+                    row = index * ENTITY_FIELDS
+                    if not entities[row]:
+                        continue
+                    direction = plan_direction(arena, entities[row + 1], entities[row + 2], entities[row + 3])
+                    if direction is not None:
+                        results.append((index, direction))
+                conn.send((tick, results))
+            elif command == "close":
+                break
+    except (KeyboardInterrupt, EOFError, BrokenPipeError):
+        pass
+    finally:
+        arena.detach()
+        entities.release()
+        arena_memory.close()
+        entities_memory.close()
+        conn.close()
+
+#############################################
+# 메인 프로세스 측
+#############################################
+class AIPlanner:
+    """공유 메모리 월드와 AI 계획 워커 풀"""
+
+    def __init__(self, workers=None, width=None, height=None, cell_size=None,
+                 deadline_ms=DEFAULT_DEADLINE_MS):
+        """
+        Args:
+            workers: int - 워커 프로세스 수 (None이면 CPU 코어 수 - 1, 최소 1)
+            width, height, cell_size: 격자 크기 (None이면 module의 화면 크기)
+            deadline_ms: float - 틱마다 계획 결과를 기다리는 최대 시간 (밀리초)
+        """
+        if width is None:
+            from module import WIDTH, HEIGHT, CELL_SIZE
+            width, height, cell_size = WIDTH, HEIGHT, CELL_SIZE
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) - 1)
+        self.deadline_ms = deadline_ms
+        self.size = (width, height, cell_size)
+        self.arena_memory = shared_memory.SharedMemory(
+            create=True, size=Arena.buffer_size(width, height, cell_size))
+        self.entities_memory = shared_memory.SharedMemory(
+            create=True, size=MAX_ENTITIES * ENTITY_FIELDS * array('i').itemsize)
+        self.arena = None
+        self.entities = self.entities_memory.buf.cast('i')
+
+        # 지표
+        self.ticks = 0
+        self.planned = 0     # 워커 결과로 방향을 정한 뱀 수
+        self.fallbacks = 0   # 마감을 넘겨 기존 AI로 돌린 뱀 수
+        self.late_results = 0
+
+        context = multiprocessing.get_context("spawn")
+        self.conns = []
+        self.processes = []
+        for _ in range(workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=planner_worker_main,
+                                      args=(child_conn, self.arena_memory.name, self.entities_memory.name,
+                                            width, height, cell_size),
+                                      daemon=True)
+            process.start()
+            child_conn.close()
+            self.conns.append(parent_conn)
+            self.processes.append(process)
+        self.closed = False
+
+    def new_arena(self):
+        """
+        공유 메모리를 비우고 그 위에 새 점유 격자를 만듦 (새 판 시작 시)
+
+        이전 판의 격자는 프로세스 안 배열로 복사되어 공유 메모리와 끊어진다.
+        """
+        if self.arena is not None:
+            self.arena.detach()
+        width, height, cell_size = self.size
+        size = Arena.buffer_size(width, height, cell_size)
+        self.arena_memory.buf[:size] = bytes(size)
+        self.arena = Arena(width, height, cell_size, buffer=self.arena_memory.buf)
+        return self.arena
+
+    def write_entities(self, snakes):
+        """개체 표를 현재 뱀 상태로 채움"""
+        size = self.arena.cell_size
+        entities = self.entities
+        for index, snake in enumerate(snakes[:MAX_ENTITIES]):
+            row = index * ENTITY_FIELDS
+            head_x, head_y = snake.body[0] if snake.body else (0, 0)
+            entities[row] = 1 if snake.alive else 0
+            entities[row + 1] = int(head_x) // size
+            entities[row + 2] = int(head_y) // size
+            entities[row + 3] = len(snake.body)
+
+    def plan(self, snakes, indices, tick):
+        """
+        indices의 AI 뱀 방향을 워커에 나눠 계산하고 마감까지 받은 결과를 기록
+
+        Args:
+            snakes: list - 월드의 뱀 목록 (개체 표 순서)
+            indices: list - 계획할 뱀 인덱스
+            tick: int - 현재 틱 (늦은 결과 구분용)
+
+        Returns:
+            int: 이번 틱에 워커 결과로 방향을 정한 뱀 수
+        """
+        for snake in snakes:
+            if snake.is_ai:
+                snake.planned_direction = None
+        indices = [index for index in indices if index < MAX_ENTITIES]
+        if self.closed or not indices:
+            return 0
+        self.ticks += 1
+        self.write_entities(snakes)
+
+        # 워커마다 겹치지 않는 묶음 (뱀 수가 적으면 일부 워커만 사용)
+        pending = []
+        for worker, conn in enumerate(list(self.conns)):
+            chunk = indices[worker::len(self.conns)]
+            if not chunk:
+                continue
+            try:
+                conn.send(("plan", (tick, chunk)))
+            except (BrokenPipeError, OSError):
+                self.drop_worker(conn)  # 이번 틱 이 묶음은 기존 AI가 맡음
+                continue
+            pending.append(conn)
+
+        planned = 0
+        deadline = time.perf_counter() + self.deadline_ms / 1000
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            for conn in wait(pending, timeout=remaining):
+                try:
+                    result_tick, results = conn.recv()
+                except (EOFError, OSError):
+                    pending.remove(conn)
+                    self.drop_worker(conn)
+                    continue
+                if result_tick != tick:
+                    self.late_results += 1  # 지난 틱 결과 - 버리고 이번 틱 결과를 계속 기다림
+                    continue
+                pending.remove(conn)
+                for index, direction in results:
+                    snakes[index].planned_direction = direction
+                planned += len(results)
+        self.planned += planned
+        self.fallbacks += len(indices) - planned
+        return planned
+
+    def drop_worker(self, conn):
+        """죽은 워커를 이후 계획에서 뺌 (워커가 모두 없으면 모든 AI가 기존 AI로 움직임)"""
+        if conn in self.conns:
+            index = self.conns.index(conn)
+            self.conns.pop(index)
+            self.processes.pop(index)
+            conn.close()
+
+    def close(self):
+        """워커 종료 후 공유 메모리 해제 (마지막 격자는 프로세스 안 배열로 바뀌어 계속 쓸 수 있음)"""
+        if getattr(self, "closed", True):
+            return
+        self.closed = True
+        for conn in self.conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self.conns:
+            conn.close()
+        if self.arena is not None:
+            self.arena.detach()
+        self.entities.release()
+        self.arena_memory.close()
+        self.arena_memory.unlink()
+        self.entities_memory.close()
+        self.entities_memory.unlink()
+
+    def __del__(self):
+        self.close()
+
+_ai_planner = None
+
+def get_ai_planner(workers=None):
+    """로컬 게임용 AI 계획 워커 풀 싱글톤 반환 (처음 호출 시 워커를 띄우고 종료 시 정리)"""
+    global _ai_planner
+    if _ai_planner is None or _ai_planner.closed:
+        _ai_planner = AIPlanner(workers)
+        atexit.register(_ai_planner.close)
+    return _ai_planner
@@ -0,0 +1,175 @@
+"""
+Snake Game - 아레나 점유 격자
+뱀 몸통, 음식, 투사체가 어느 칸에 있는지를 한곳에 모아 둔 격자.
+
+스폰, 충돌, AI, 음식 획득이 저마다 Snake.body / food_list를 훑어서 "이 칸에 무엇이 있는지"를 만들지 않고
+이 격자 하나를 읽는다. 격자는 바뀌는 순간에만 갱신한다.
+    - 몸통: 머리 추가 / 꼬리 제거 / 꼬리 복제 때 (Snake.push_head, pop_tail, grow_tail)
+    - 음식: 생성 / 획득 때 (spawn_food, spawn_special_item, remove_food)
+    - 투사체: 이동과 제거가 끝난 뒤 한 번에 (BossSnake.update_projectiles, handle_boss_collision)
+
+층(layer)마다 칸별 개수를 uint16 배열(array('H'))에 두므로 numpy 없이도 동작한다.
+buffer를 주면 그 메모리(예: multiprocessing.shared_memory)를 층 배열로 쓴다 (ai_planner.py).
+    arena.count(BODIES, x, y)             # 칸 조회 O(1)
+    arena.food_at(x, y)                   # 그 칸의 음식 객체
+    arena.count_rect(BODIES, x, y, w, h)  # 사각형 안의 개수 (행마다 배열 조각 합)
+    arena.sample_free_cell()              # 몸통이 없는 칸 무작위 선택
+좌표는 모두 픽셀 단위이고 화면 밖은 가장자리 칸으로 붙인다.
+"""
+
+import random
+from array import array
+
+BODIES = 0
+FOOD = 1
+PROJECTILES = 2
+LAYER_NAMES = ("bodies", "food", "projectiles")
+
+SAMPLE_ATTEMPTS = 1000  # 무작위 시도로 빈 칸을 못 찾으면 빈 칸 목록에서 고름
+
+class Arena:
+    """층별 칸 점유 개수와 칸별 음식 목록"""
+
+    def __init__(self, width, height, cell_size, buffer=None):
+        """
+        Args:
+            buffer: 층 배열로 쓸 쓰기 가능한 메모리 (buffer_size() 바이트 이상, 0으로 채워져 있어야 함).
+                    None이면 프로세스 안의 array를 사용
+        """
+        self.cell_size = cell_size
+        self.columns = width // cell_size
+        self.rows = height // cell_size
+        size = self.columns * self.rows
+        if buffer is None:
+            self.layers = [array('H', bytes(2 * size)) for _ in LAYER_NAMES]
+        else:
+            view = memoryview(buffer).cast('B')[:2 * size * len(LAYER_NAMES)].cast('H')
+            self.layers = [view[layer * size:(layer + 1) * size] for layer in range(len(LAYER_NAMES))]
+        self.foods = {}              # 칸 번호 -> [음식, ...] (생성 순서)
+        self.projectile_cells = []   # 투사체 층에 표시한 칸 번호
+
+    @staticmethod
+    def buffer_size(width, height, cell_size):
+        """buffer로 넘길 메모리 크기 (바이트)"""
+        return 2 * (width // cell_size) * (height // cell_size) * len(LAYER_NAMES)
+
+    def detach(self):
+        """공유 메모리 층을 프로세스 안의 배열로 복사 (공유 메모리를 닫기 전에 호출)"""
+        if isinstance(self.layers[0], memoryview):
+            views = self.layers
+            self.layers = [array('H', view) for view in views]
+            for view in views:
+                view.release()
+
+    def __getstate__(self):
+        # 공유 메모리 층은 pickle할 수 없으므로 복사본으로 저장
+        state = self.__dict__.copy()
+        state["layers"] = [array('H', layer) for layer in self.layers]
+        return state
+
+    def index(self, x, y):
+        """픽셀 좌표의 칸 번호"""
+        column = min(max(int(x) // self.cell_size, 0), self.columns - 1)
+        row = min(max(int(y) // self.cell_size, 0), self.rows - 1)
+        return row * self.columns + column
+
+    #############################################
+    # 갱신
+    #############################################
+    def add(self, layer, x, y):
+        self.layers[layer][self.index(x, y)] += 1
+
+    def remove(self, layer, x, y):
+        cells = self.layers[layer]
+        cell = self.index(x, y)
+        if cells[cell]:
+            cells[cell] -= 1
+
+    def add_body(self, body):
+        """몸통 전체 등록 (뱀 생성, 몸통 교체)"""
+        for x, y in body:
+            self.add(BODIES, x, y)
+
+    def remove_body(self, body):
+        """몸통 전체 제거 (뱀이 월드에서 빠질 때, 몸통 교체)"""
+        for x, y in body:
+            self.remove(BODIES, x, y)
+
+    def add_food(self, food):
+        cell = self.index(food.x, food.y)
+        self.layers[FOOD][cell] += 1
+        self.foods.setdefault(cell, []).append(food)
+
+    def remove_food(self, food):
+        cell = self.index(food.x, food.y)
+        foods = self.foods.get(cell)
+        if foods and food in foods:
+            foods.remove(food)
+            if not foods:
+                del self.foods[cell]
+            self.layers[FOOD][cell] -= 1
+
+    def set_projectiles(self, projectiles):
+        """투사체 층을 현재 투사체 위치로 다시 표시 (투사체는 수가 적고 매 틱 모두 움직임)"""
+        cells = self.layers[PROJECTILES]
+        for cell in self.projectile_cells:
+            cells[cell] -= 1
+        self.projectile_cells = [self.index(projectile.x, projectile.y) for projectile in projectiles]
+        for cell in self.projectile_cells:
+            cells[cell] += 1
+
+    #############################################
+    # 조회
+    #############################################
+    def count(self, layer, x, y):
+        """칸 하나에 있는 개수"""
+        return self.layers[layer][self.index(x, y)]
+
+    def is_free(self, x, y, layers=(BODIES,)):
+        """주어진 층들이 모두 비어 있는 칸인지 확인"""
+        cell = self.index(x, y)
+        return not any(self.layers[layer][cell] for layer in layers)
+
+    def food_at(self, x, y):
+        """칸에 있는 음식 중 가장 먼저 생긴 것 (없으면 None)"""
+        foods = self.foods.get(self.index(x, y))
+        return foods[0] if foods else None
+
+    def count_rect(self, layer, x, y, width, height):
+        """
+        픽셀 사각형 (x, y, width, height)과 겹치는 칸들의 개수 합
+
+        Returns:
+            int: 사각형이 화면 밖이면 화면 안 부분만 셈
+        """
+        size = self.cell_size
+        first_column = max(int(x) // size, 0)
+        last_column = min((int(x + width) - 1) // size, self.columns - 1)
+        first_row = max(int(y) // size, 0)
+        last_row = min((int(y + height) - 1) // size, self.rows - 1)
+        if first_column > last_column or first_row > last_row:
+            return 0
+        cells = self.layers[layer]
+        columns = self.columns
+        return sum(sum(cells[row * columns + first_column:row * columns + last_column + 1])
+                   for row in range(first_row, last_row + 1))
+
+    def sample_free_cell(self, layers=(BODIES,), rng=random):
+        """
+        주어진 층들이 비어 있는 칸을 무작위로 골라 픽셀 좌표로 반환
+
+        기존 spawn_food와 같은 방식(열, 행 순서로 randint)으로 뽑아서 같은 난수 흐름에서는 같은 칸이 나온다.
+        빈 칸이 없으면 None.
+        """
+        size = self.cell_size
+        for _ in range(SAMPLE_ATTEMPTS):
+            x = rng.randint(0, self.columns - 1) * size
+            y = rng.randint(0, self.rows - 1) * size
+            if self.is_free(x, y, layers):
+                return x, y
+        free = [cell for cell in range(self.columns * self.rows)
+                if not any(self.layers[layer][cell] for layer in layers)]
+        if not free:
+            return None
+        row, column = divmod(rng.choice(free), self.columns)
+        return column * size, row * size
@@ -0,0 +1,157 @@
+"""
+Snake Game - 에셋 관리 모듈
+사운드, 이미지, 폰트를 한 번만 디코딩해서 공유 핸들로 나눠주고,
+모드 선택 화면이 떠 있는 동안 이미지와 사운드는 백그라운드 스레드에서 미리 읽어 둔다.
+화면은 프리로드를 기다리지 않고, 아직 읽는 중인 에셋을 요청하면 그 에셋이 끝날 때까지만 기다린다.
+폰트(SDL_ttf/FreeType)는 다른 스레드의 텍스트 렌더링과 동시에 만들면 안전하지 않으므로 메인 스레드에서 만든다 (load_fonts).
+에셋별 로드 시간과 메모리 사용량을 보고할 수 있다.
+"""
+
+import os
+import time
+import threading
+import pygame
+from font_manager import get_font_manager
+
+# 미리 읽어 둘 에셋 목록 (이름 -> 파일 경로)
+SOUND_ASSETS = {
+    "warning": "warning_sound.mp3"
+}
+IMAGE_ASSETS = {
+    "logo": "logo.png"
+}
+# 게임에서 사용하는 폰트 (font_type, size, bold)
+FONT_ASSETS = [
+    ('title', 48, True), ('button', 24, False), ('small', 18, False),
+    ('small', 20, False), ('small', 24, False), ('small', 16, False),
+    ('button', 18, False), ('button', 20, False), ('button', 22, False), ('button', 36, False),
+    ('button', 20, True), ('button', 24, True),
+    ('title', 32, True), ('title', 42, True), ('title', 72, True)
+]
+
+class AssetManager:
+    """에셋을 한 번만 로드해서 공유하는 관리 클래스"""
+    
+    def __init__(self):
+        self.assets = {}     # (kind, name) -> 로드된 객체 (실패는 저장하지 않아서 다음 요청 때 다시 시도)
+        self.stats = {}      # (kind, name) -> {"load_ms": float, "bytes": int}
+        self.key_locks = {}  # (kind, name) -> 같은 에셋을 두 번 디코딩하지 않도록 하는 에셋별 잠금
+        self.lock = threading.Lock()  # key_locks 보호용
+        self.preload_thread = None
+
+    def preload(self):
+        """
+        백그라운드 스레드에서 이미지와 사운드 미리 읽기 시작
+
+        Returns:
+            bool: 이번에 시작했으면 True (이미 시작했으면 무시하고 False)
+        """
+        if self.preload_thread is not None:
+            return False
+        self.preload_thread = threading.Thread(target=self.load_media, name="asset-preload", daemon=True)
+        self.preload_thread.start()
+        return True
+
+    def is_preloading(self):
+        """백그라운드 프리로드가 아직 진행 중인지 확인 (기다리지 않음)"""
+        return self.preload_thread is not None and self.preload_thread.is_alive()
+
+    def load_media(self):
+        """매니페스트의 이미지와 사운드 로드 (백그라운드 스레드에서 호출해도 됨)"""
+        for name in IMAGE_ASSETS:
+            self.get_image(name)
+        for name in SOUND_ASSETS:
+            self.get_sound(name)
+
+    def load_fonts(self):
+        """매니페스트의 폰트 로드 (메인 스레드에서만 호출)"""
+        for font_type, size, bold in FONT_ASSETS:
+            self.get_font(font_type, size, bold)
+
+    def load_all(self):
+        """매니페스트에 있는 모든 에셋을 현재 스레드에서 로드하고 보고"""
+        self.load_media()
+        self.load_fonts()
+        self.report()
+
+    def get(self, kind, name, loader):
+        """
+        캐시된 에셋 반환 (없으면 loader로 로드하고 시간과 메모리 기록)
+        다른 스레드가 같은 에셋을 읽는 중이면 그 에셋이 끝날 때까지만 기다리고, 실패하면 None
+        """
+        key = (kind, name)
+        asset = self.assets.get(key)
+        if asset is not None:
+            return asset
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            asset = self.assets.get(key)
+            if asset is not None:
+                return asset
+            start = time.perf_counter()
+            try:
+                asset, size_bytes = loader()
+            except (pygame.error, FileNotFoundError) as e:
+                # 실패는 캐시하지 않음 (믹서 초기화 후 다시 요청하면 로드할 수 있도록), 메시지는 처음 한 번만
+                if key not in self.stats:
+                    print(f"❌ 에셋 로드 실패 ({kind}: {name}): {e}")
+                asset, size_bytes = None, 0
+            self.stats[key] = {
+                "load_ms": (time.perf_counter() - start) * 1000,
+                "bytes": size_bytes
+            }
+            if asset is not None:
+                self.assets[key] = asset
+            return asset
+
+    def get_image(self, name):
+        """이미지 반환 (pygame.Surface 또는 None)"""
+        def load():
+            image = pygame.image.load(IMAGE_ASSETS[name])
+            return image, image.get_width() * image.get_height() * image.get_bytesize()
+        return self.get("image", name, load)
+
+    def get_sound(self, name):
+        """사운드 반환 (pygame.mixer.Sound, 믹서를 쓸 수 없으면 None)"""
+        def load():
+            if not pygame.mixer.get_init():
+                raise pygame.error("mixer not initialized")
+            sound = pygame.mixer.Sound(SOUND_ASSETS[name])
+            frequency, sample_size, channels = pygame.mixer.get_init()
+            size_bytes = int(sound.get_length() * frequency) * channels * abs(sample_size) // 8
+            return sound, size_bytes
+        return self.get("sound", name, load)
+
+    def get_font(self, font_type, size, bold=False):
+        """폰트 반환 (폰트 매니저의 공유 폰트, 폰트 파일 크기는 보고서에 따로 표시)"""
+        def load():
+            return get_font_manager().get_font(font_type, size, bold), 0
+        return self.get("font", f"{font_type}-{size}{'-bold' if bold else ''}", load)
+
+    def report(self):
+        """에셋별 로드 시간과 메모리 사용량 출력"""
+        print("📦 에셋 로드 보고")
+        total_ms = 0.0
+        total_bytes = 0
+        for (kind, name), stat in sorted(self.stats.items()):
+            loaded = "" if self.assets.get((kind, name)) is not None else " (실패)"
+            print(f"  {kind:<6} {name:<16} {stat['load_ms']:8.1f} ms {stat['bytes'] / 1024:10.1f} KB{loaded}")
+            total_ms += stat["load_ms"]
+            total_bytes += stat["bytes"]
+        fm = get_font_manager()
+        if fm.font_available:
+            font_file_bytes = os.path.getsize(fm.local_font_path)
+            print(f"  {'font':<6} {'(file)':<16} {'':>11} {font_file_bytes / 1024:10.1f} KB")
+            total_bytes += font_file_bytes
+        print(f"  {'합계':<23} {total_ms:8.1f} ms {total_bytes / 1024:10.1f} KB")
+
+# 전역 에셋 매니저 인스턴스
+asset_manager = None
+
+def get_asset_manager():
+    """에셋 매니저 싱글톤 반환"""
+    global asset_manager
+    if asset_manager is None:
+        asset_manager = AssetManager()
+    return asset_manager
@@ -0,0 +1,82 @@
+"""
+Snake Game - 백그라운드 기록 모듈
+점수 저장처럼 디스크에 쓰는 작업을 UI 스레드에서 분리해 전용 스레드의 큐로 처리한다.
+프로그램이 종료될 때는 큐에 남은 작업을 모두 기록한 뒤 끝난다.
+"""
+
+import atexit
+import queue
+import threading
+
+class BackgroundWriter:
+    """쓰기 작업을 순서대로 처리하는 백그라운드 큐"""
+    
+    def __init__(self, name="background-writer"):
+        self.name = name
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def submit(self, func, *args, **kwargs):
+        """
+        쓰기 작업을 큐에 추가 (즉시 반환)
+        
+        매개변수:
+            func: callable - 백그라운드 스레드에서 실행할 함수
+            *args, **kwargs - func에 넘길 인자
+        """
+        with self.lock:
+            if self.closed:
+                # 종료 처리 이후에 들어온 작업은 바로 실행해서 잃어버리지 않도록 함
+                self.run_task(func, args, kwargs)
+                return
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+                self.thread.start()
+            self.queue.put((func, args, kwargs))
+
+    def run(self):
+        """큐에서 작업을 꺼내 순서대로 실행 (None을 받으면 종료)"""
+        while True:
+            task = self.queue.get()
+            try:
+                if task is None:
+                    return
+                self.run_task(*task)
+            finally:
+                self.queue.task_done()
+
+    def run_task(self, func, args, kwargs):
+        """작업 하나 실행 (실패해도 다음 작업은 계속 처리)"""
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            print(f"❌ 백그라운드 기록 실패 ({getattr(func, '__name__', func)}):", e)
+
+    def flush(self):
+        """지금까지 추가된 작업이 모두 끝날 때까지 대기"""
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """남은 작업을 모두 기록하고 스레드 종료 (프로그램 종료 시 자동 호출)"""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            thread = self.thread
+        if thread is not None:
+            self.queue.put(None)
+            thread.join()
+
+# 전역 백그라운드 기록기 인스턴스
+background_writer = None
+
+def get_background_writer():
+    """백그라운드 기록기 싱글톤 반환 (종료 시 남은 작업을 기록하도록 등록)"""
+    global background_writer
+    if background_writer is None:
+        background_writer = BackgroundWriter()
+        atexit.register(background_writer.close)
+    return background_writer
@@ -0,0 +1,72 @@
+"""
+Snake Game - AI 계획 워커 벤치마크
+AI 뱀이 많은 진화 모드 게임을 같은 시드로
+    1) 기존 탐욕 AI만 사용 (워커 0개)
+    2) 공유 메모리 월드를 읽는 계획 워커 N개 (마감 안에 못 받은 뱀은 탐욕 AI)
+로 진행하면서 틱 처리 시간, 워커가 방향을 정한 비율, 죽은 AI 수, 살아 있는 AI 점수를 비교한다.
+워커 결과가 마감 시각에 따라 달라지므로 같은 시드라도 판 진행은 실행마다 조금씩 다르다.
+
+실행:
+    python3 -m benchmarks.ai_planner
+    python3 -m benchmarks.ai_planner --ticks 900 --ai 24 --workers 1 2 4 --deadline 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from world import GameWorld
+
+def play(seed, ticks, ai, workers, deadline_ms):
+    """
+    게임 한 판 진행
+
+    Returns:
+        dict: 틱당 시간(ms), 계획 비율, 죽은 AI 수, 살아 있는 AI 점수 합
+    """
+    world = GameWorld("EVOLUTION", seed=seed, initial_ai=ai, ai_workers=workers)
+    if world.planner is not None:
+        world.planner.deadline_ms = deadline_ms
+    try:
+        start = time.perf_counter()
+        for _ in range(ticks):
+            world.step()
+        elapsed = time.perf_counter() - start
+        alive_ai = [snake for snake in world.snakes if snake.is_ai and snake.alive]
+        planner = world.planner
+        requested = planner.planned + planner.fallbacks if planner is not None else 0
+        return {
+            "tick_ms": elapsed / ticks * 1000,
+            "planned_ratio": planner.planned / requested if requested else 0.0,
+            # 처음 AI + 보충/번식으로 생긴 AI 중 지금 없는 수
+            "ai_deaths": world.next_entity_id - 1 - len(alive_ai),
+            "ai_score": sum(snake.score for snake in alive_ai),
+        }
+    finally:
+        world.release_entities()
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 계획 워커 벤치마크")
+    parser.add_argument("--ticks", type=int, default=450)
+    parser.add_argument("--ai", type=int, default=12)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--deadline", type=float, default=15.0, help="틱마다 결과를 기다리는 시간 (ms)")
+    parser.add_argument("--seeds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'워커':<6}{'틱당(ms)':>10}{'계획 비율':>12}{'죽은 AI':>10}{'AI 점수':>10}")
+    for workers in [0] + args.workers:
+        results = [play(seed, args.ticks, args.ai, workers, args.deadline) for seed in range(args.seeds)]
+        count = len(results)
+        print(f"{workers:<6}{sum(r['tick_ms'] for r in results) / count:>10.2f}"
+              f"{sum(r['planned_ratio'] for r in results) / count:>12.1%}"
+              f"{sum(r['ai_deaths'] for r in results) / count:>10.1f}"
+              f"{sum(r['ai_score'] for r in results) / count:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Snake Game - 객체 풀 벤치마크
+3페이즈 보스전(원형 탄막)을 계속 돌리면서 객체 풀을 켰을 때/껐을 때의
+    1) 새로 만든 Projectile / Food / SpecialItem 수 (1000틱당)
+    2) 풀에서 다시 꺼내 쓴 횟수 (1000틱당)
+    3) 틱당 처리 시간
+을 비교한다. 플레이어가 죽거나 보스를 잡으면 release_entities()로 반환하고 새 판을 시작한다.
+
+실행:
+    python -m benchmarks.entity_pools
+    python -m benchmarks.entity_pools --ticks 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import module
+from module import Projectile, Food, SpecialItem, PROJECTILE_POOL, FOOD_POOL, SPECIAL_ITEM_POOL
+from world import GameWorld
+from boss_analyzer import ScriptedBossPlayer
+
+POOLS = {"Projectile": PROJECTILE_POOL, "Food": FOOD_POOL, "SpecialItem": SPECIAL_ITEM_POOL}
+
+def play(ticks, seed):
+    """
+    3페이즈 보스전을 ticks틱 진행 (판이 끝나면 다음 시드로 새 판)
+
+    Returns:
+        int: 진행한 판 수
+    """
+    saved = dict(module.BOSS_EVOLUTION_TIME)
+    module.BOSS_EVOLUTION_TIME["PHASE2"] = 1
+    module.BOSS_EVOLUTION_TIME["PHASE3"] = 2
+    try:
+        world = None
+        games = 0
+        done = 0
+        while done < ticks:
+            if world is None:
+                world = GameWorld("BOSS", seed=seed)
+                player_id = world.add_player("Scripted")
+                player = world.players[player_id]
+                policy = ScriptedBossPlayer()
+                seed += 1
+                games += 1
+            action = policy.act(player, world)
+            if action:
+                world.apply_input(player_id, **action)
+            world.step()
+            done += 1
+            if world.finished or not player.alive:
+                world.release_entities()
+                world = None
+        if world is not None:
+            world.release_entities()
+        return games
+    finally:
+        module.BOSS_EVOLUTION_TIME.clear()
+        module.BOSS_EVOLUTION_TIME.update(saved)
+
+def measure(pooling, ticks, seed):
+    """풀 설정 하나로 측정 (처음 1000틱은 풀을 채우는 워밍업)"""
+    module.OBJECT_POOLING = pooling
+    for pool in POOLS.values():
+        pool.free.clear()
+    play(1000, seed)
+
+    for pool in POOLS.values():
+        pool.created = pool.reused = 0
+    start = time.perf_counter()
+    games = play(ticks, seed)
+    elapsed = time.perf_counter() - start
+
+    scale = 1000 / ticks
+    return {
+        "created": {name: pool.created * scale for name, pool in POOLS.items()},
+        "reused": sum(pool.reused for pool in POOLS.values()) * scale,
+        "games": games,
+        "tick_us": elapsed / ticks * 1e6,
+    }
+
+def object_size(cls, *args):
+    """객체 하나가 차지하는 메모리 (바이트, tracemalloc 기준)"""
+    count = 10000
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(*args) for _ in range(count)]
+    size = (tracemalloc.get_traced_memory()[0] - before) / count
+    tracemalloc.stop()
+    del objects
+    return size
+
+def main():
+    parser = argparse.ArgumentParser(description="객체 풀 벤치마크")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print("객체 크기 (__slots__, 목록 포인터 포함): "
+          f"Projectile {object_size(Projectile, 0, 0, 1, 0, 4, True):.0f}B, "
+          f"Food {object_size(Food, 0, 0):.0f}B, "
+          f"SpecialItem {object_size(SpecialItem, 0, 0):.0f}B")
+    print(f"{'풀':<6}" + "".join(f"{name + '/1k':>16}" for name in POOLS)
+          + f"{'재사용/1k':>12}{'판':>6}{'틱(us)':>10}")
+    for pooling in (False, True):
+        result = measure(pooling, args.ticks, args.seed)
+        print(f"{'켬' if pooling else '끔':<6}"
+              + "".join(f"{result['created'][name]:>16.1f}" for name in POOLS)
+              + f"{result['reused']:>12.1f}{result['games']:>6}{result['tick_us']:>10.0f}")
+    module.OBJECT_POOLING = True
+
+if __name__ == "__main__":
+    main()
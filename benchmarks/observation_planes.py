@@ -0,0 +1,67 @@
+"""
+Snake Game - 관측 텐서 벤치마크
+녹화한 게임을 재생하면서 틱마다
+    1) build_planes: Snake.body 목록으로 채널 평면을 처음부터 만드는 방식
+    2) ObservationBuilder.update: 바뀐 부분만 갱신하는 방식
+의 처리 시간을 비교하고, 두 결과가 같은지 확인한다.
+
+실행:
+    python -m benchmarks.observation_planes
+    python -m benchmarks.observation_planes --ticks 3000 --players 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from observation import ObservationBuilder, build_planes, CHANNELS
+from benchmarks.replication_bandwidth import record_game, replay_game
+
+def measure(recording):
+    """녹화 한 판의 방식별 틱당 처리 시간(초)과 불일치 틱 수"""
+    builder = None
+    rebuild_time = 0.0
+    update_time = 0.0
+    ticks = 0
+    mismatches = 0
+    for world in replay_game(recording):
+        player_id = next(iter(world.players))
+        if builder is None:
+            builder = ObservationBuilder(world, player_id, crop_radius=15)
+
+        start = time.perf_counter()
+        expected = build_planes(world, player_id)
+        rebuild_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        planes = builder.update()
+        builder.crop()
+        update_time += time.perf_counter() - start
+
+        ticks += 1
+        if not np.array_equal(planes, expected):
+            mismatches += 1
+    return ticks, rebuild_time / ticks, update_time / ticks, mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description="관측 텐서 벤치마크")
+    parser.add_argument("--ticks", type=int, default=1800)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seeds", type=int, default=2, help="모드당 녹화 수")
+    args = parser.parse_args()
+
+    print(f"채널 {len(CHANNELS)}개: {', '.join(CHANNELS)}")
+    print(f"{'녹화':<14}{'틱':>6}{'재생성(us)':>12}{'증분(us)':>12}{'배율':>8}")
+    for mode in ("CLASSIC", "EVOLUTION", "BOSS"):
+        for seed in range(1, args.seeds + 1):
+            recording = record_game(mode, seed, args.ticks, args.players)
+            ticks, rebuild, update, mismatches = measure(recording)
+            print(f"{mode + '_' + str(seed):<14}{ticks:>6}{rebuild * 1e6:>12.0f}{update * 1e6:>12.0f}"
+                  f"{rebuild / update:>7.1f}x" + (f"  불일치 {mismatches}틱" if mismatches else ""))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Snake Game - 복제 대역폭 벤치마크
+녹화한 게임(시드 + 틱별 입력)을 GameWorld로 재생하면서 틱마다
+    1) 전체 상태 JSON (server.py의 기존 방식)
+    2) 매 틱 바이너리 키프레임
+    3) ack 기반 바이너리 델타 (ack 지연 1틱 / 4틱)
+의 전송량을 비교하고, 델타를 적용한 클라이언트 상태가 서버 상태와 같은지도 확인한다.
+
+실행:
+    python -m benchmarks.replication_bandwidth
+    python -m benchmarks.replication_bandwidth --ticks 3000 --players 8 --record recordings/
+    python -m benchmarks.replication_bandwidth --replay recordings/EVOLUTION_1.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from collections import Counter, deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from world import GameWorld, TICK_RATE, DIRECTIONS
+from server import encode_message
+from replication import (
+    Replicator, ClientReplica, ReplicaReceiver, EMPTY_FRAME, encode_delta, frame_message
+)
+
+def record_game(mode, seed, ticks, players):
+    """봇 입력으로 게임 한 판을 녹화 (틱마다 [플레이어 번호, 입력] 목록)"""
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(ticks):
+        tick_inputs = []
+        for index in range(players):
+            if rng.random() < 0.15:
+                tick_inputs.append([index, {"direction": rng.choice(DIRECTIONS),
+                                            "dash": rng.random() < 0.05,
+                                            "charge": rng.random() < 0.05}])
+        inputs.append(tick_inputs)
+    return {"mode": mode, "seed": seed, "players": players, "inputs": inputs}
+
+def replay_game(recording):
+    """녹화를 재생하면서 틱마다 월드를 넘겨줌"""
+    world = GameWorld(recording["mode"], seed=recording["seed"])
+    player_ids = [world.add_player(f"P{index}") for index in range(recording["players"])]
+    for tick_inputs in recording["inputs"]:
+        for index, pending in tick_inputs:
+            world.apply_input(player_ids[index], **pending)
+        world.step()
+        for player_id in player_ids:
+            if not world.players[player_id].alive:
+                world.respawn_player(player_id)
+        yield world
+        if world.finished:
+            break
+
+def normalize_state(state):
+    """비교용 상태 정리 (음식 순서 무시, 에너지 소수 첫째 자리)"""
+    snakes = {}
+    for snake in state["snakes"]:
+        snakes[snake["id"]] = (snake["name"], tuple(snake["color"]), snake["alive"], snake["score"],
+                               round(snake["energy"], 1), snake["level"], snake["form"],
+                               snake["effects"], tuple(snake["body"]))
+    food = state["food"]
+    return snakes, Counter(tuple(food[i:i + 3]) for i in range(0, len(food), 3)), state["boss_health"]
+
+def measure(recording, ack_delays=(1, 4)):
+    """녹화 한 판의 방식별 전송량(바이트) 측정"""
+    replicator = Replicator()
+    totals = {"json": 0, "keyframe": 0}
+    clients = {}
+    for delay in ack_delays:
+        totals[f"delta_ack{delay}"] = 0
+        clients[delay] = (ClientReplica(), ReplicaReceiver(), deque())
+    ticks = 0
+    mismatches = 0
+
+    for world in replay_game(recording):
+        ticks += 1
+        snapshot = world.snapshot()
+        snapshot["type"] = "state"
+        totals["json"] += len(encode_message(snapshot))
+
+        frame = replicator.capture(world)
+        totals["keyframe"] += len(frame_message(encode_delta(EMPTY_FRAME, frame, keyframe=True)))
+
+        expected = normalize_state(snapshot)
+        for delay, (replica, receiver, in_flight) in clients.items():
+            data = replicator.message_for(replica)
+            totals[f"delta_ack{delay}"] += len(data)
+            # 길이 접두어를 떼고 클라이언트에 적용
+            received = receiver.receive(_strip_length(data))
+            if normalize_state(received.to_state()) != expected:
+                mismatches += 1
+            # ack는 delay 틱 뒤에 서버에 도착
+            in_flight.append(received.tick)
+            if len(in_flight) >= delay:
+                replica.acknowledge(in_flight.popleft())
+    return ticks, totals, mismatches
+
+def _strip_length(data):
+    """varint 길이 접두어 제거"""
+    pos = 0
+    while data[pos] & 0x80:
+        pos += 1
+    return data[pos + 1:]
+
+def main():
+    parser = argparse.ArgumentParser(description="복제 대역폭 벤치마크")
+    parser.add_argument("--ticks", type=int, default=1800, help="게임당 틱 수 (기본 2분)")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seeds", type=int, default=2, help="모드당 녹화 수")
+    parser.add_argument("--record", help="녹화를 저장할 디렉터리")
+    parser.add_argument("--replay", nargs="*", help="저장된 녹화 파일로만 측정")
+    args = parser.parse_args()
+
+    recordings = []
+    if args.replay:
+        for path in args.replay:
+            with open(path, "r", encoding="utf-8") as f:
+                recordings.append((os.path.basename(path), json.load(f)))
+    else:
+        for mode in ("CLASSIC", "EVOLUTION", "BOSS"):
+            for seed in range(1, args.seeds + 1):
+                recording = record_game(mode, seed, args.ticks, args.players)
+                name = f"{mode}_{seed}"
+                recordings.append((name, recording))
+                if args.record:
+                    os.makedirs(args.record, exist_ok=True)
+                    with open(os.path.join(args.record, name + ".json"), "w", encoding="utf-8") as f:
+                        json.dump(recording, f)
+
+    print(f"{'녹화':<14}{'틱':>6}{'JSON':>12}{'키프레임':>12}{'델타(ack1)':>12}{'델타(ack4)':>12}{'절감':>8}  (틱당 평균 바이트)")
+    for name, recording in recordings:
+        ticks, totals, mismatches = measure(recording)
+        per_tick = {key: value / ticks for key, value in totals.items()}
+        saving = 1 - per_tick["delta_ack1"] / per_tick["json"]
+        print(f"{name:<14}{ticks:>6}{per_tick['json']:>12.0f}{per_tick['keyframe']:>12.0f}"
+              f"{per_tick['delta_ack1']:>12.0f}{per_tick['delta_ack4']:>12.0f}{saving:>8.1%}"
+              + (f"  불일치 {mismatches}틱" if mismatches else ""))
+    print(f"(초당 {TICK_RATE}틱 기준 클라이언트당 대역폭 = 틱당 바이트 x {TICK_RATE})")
+
+if __name__ == "__main__":
+    main()
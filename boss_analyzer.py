@@ -0,0 +1,580 @@
+"""
+Snake Game - 보스전 난이도 분석기 (몬테카를로)
+스크립트 플레이어로 화면 없는 보스전을 수천 번 돌려서 보스 밸런스를 수치로 확인한다.
+
+- 플레이어: 투사체를 예측해서 피하고, 음식으로 에너지를 모으다가 보스가 가까우면 돌진(F)
+- 결과: 페이즈별 생존 곡선(Kaplan-Meier), 보스 처치 시간 분포, 사망 원인
+- 스윕: 보스 상수(진화 시간, 투사체 간격, 원형 탄막 수, 돌진 피해량)를 바꿔가며 설정별로 비교
+- 병렬: 경기들을 프로세스 풀에 나눠서 실행
+
+실행:
+    python3 boss_analyzer.py --fights 2000
+    python3 boss_analyzer.py --fights 500 --sweep charge_damage=10,15,20 --sweep cooldown1=75,45
+    python3 boss_analyzer.py --fights 500 --set phase2_time=900 --set phase3_time=1800 --json result.json
+"""
+
+import argparse
+import functools
+import itertools
+import json
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import module
+from module import (CELL_SIZE, WIDTH, HEIGHT, MAX_CELL_X, MAX_CELL_Y, SPEED_UNITS_PER_CELL,
+                    DIRECTION_STEPS, OPPOSITE)
+from world import GameWorld, DIRECTIONS, TICK_RATE
+from profiler import worker_job, collect_worker_results
+
+DEFAULT_FIGHTS = 1000
+DEFAULT_MAX_TICKS = TICK_RATE * 600   # 경기당 제한 10분
+CHARGE_ENERGY = 30                    # 돌진에 필요한 에너지 (world.start_charge와 동일)
+SURVIVAL_CHECKPOINTS = (10, 30, 60, 120, 180, 300)  # 생존 곡선 출력 시점 (페이즈 진입 후 초)
+TIME_TO_KILL_BIN = 30                 # 처치 시간 히스토그램 구간 (초)
+MAX_OPEN_SPACE = 80                   # 스크립트 플레이어가 갇힘 확인에 세는 최대 칸 수
+PHASE_HEALTH_RATIOS = (0.6, 0.3)      # BossSnake.update_boss_state의 체력 기반 강제 진화 기준
+PHASE_MARGIN_HITS = 4                 # 돌진 한 번에 들어갈 수 있는 적중 수 (진화 직전 판단용)
+SPEED_UPGRADE_LEVEL = 2               # 스크립트 플레이어가 올리는 속도 스탯 상한 (나머지 포인트는 에너지)
+
+# 스윕 가능한 보스 상수: 이름 -> 설명 (--list로 출력)
+PARAMETERS = {
+    "phase2_time": "BOSS_EVOLUTION_TIME['PHASE2'] - 2페이즈 진화 시간 (틱)",
+    "phase3_time": "BOSS_EVOLUTION_TIME['PHASE3'] - 3페이즈 진화 시간 (틱)",
+    "cooldown1": "BOSS_PROJECTILE_COOLDOWN[1] - 1페이즈 발사 간격 (틱)",
+    "cooldown2": "BOSS_PROJECTILE_COOLDOWN[2] - 2페이즈 발사 간격 (틱)",
+    "cooldown3": "BOSS_PROJECTILE_COOLDOWN[3] - 3페이즈 3연발 후 대기 (틱)",
+    "burst_interval": "BOSS_BURST_INTERVAL - 3페이즈 연발 간격 (틱)",
+    "circular_shot_count": "BossSnake.circular_shot_count - 원형 탄막 발사 수",
+    "enhanced_shot_count": "BossSnake.enhanced_shot_count - 강화 원형 탄막 발사 수",
+    "charge_damage": "BOSS_CHARGE_DAMAGE - 돌진 적중 피해량",
+}
+
+# handle_boss_collision이 남기는 메시지로 사망 원인 구분
+DEATH_CAUSES = {
+    "보스의 투사체에 맞았습니다!": "projectile",
+    "보스에게 부딪혀 사망!": "boss",
+    "전체 공격에 당했습니다!": "global",
+}
+
+def default_parameters():
+    """현재 module 상수 기준 기본값"""
+    return {
+        "phase2_time": module.BOSS_EVOLUTION_TIME["PHASE2"],
+        "phase3_time": module.BOSS_EVOLUTION_TIME["PHASE3"],
+        "cooldown1": module.BOSS_PROJECTILE_COOLDOWN[1],
+        "cooldown2": module.BOSS_PROJECTILE_COOLDOWN[2],
+        "cooldown3": module.BOSS_PROJECTILE_COOLDOWN[3],
+        "burst_interval": module.BOSS_BURST_INTERVAL,
+        "circular_shot_count": 8,
+        "enhanced_shot_count": 16,
+        "charge_damage": module.BOSS_CHARGE_DAMAGE,
+    }
+
+def apply_parameters(params, boss):
+    """
+    보스 상수를 params 값으로 바꿈
+
+    Returns:
+        dict: 원래 module 상수 (restore_parameters로 되돌림)
+    """
+    saved = {
+        "BOSS_EVOLUTION_TIME": dict(module.BOSS_EVOLUTION_TIME),
+        "BOSS_PROJECTILE_COOLDOWN": dict(module.BOSS_PROJECTILE_COOLDOWN),
+        "BOSS_BURST_INTERVAL": module.BOSS_BURST_INTERVAL,
+        "BOSS_CHARGE_DAMAGE": module.BOSS_CHARGE_DAMAGE,
+    }
+    module.BOSS_EVOLUTION_TIME["PHASE2"] = params["phase2_time"]
+    module.BOSS_EVOLUTION_TIME["PHASE3"] = params["phase3_time"]
+    module.BOSS_PROJECTILE_COOLDOWN[1] = params["cooldown1"]
+    module.BOSS_PROJECTILE_COOLDOWN[2] = params["cooldown2"]
+    module.BOSS_PROJECTILE_COOLDOWN[3] = params["cooldown3"]
+    module.BOSS_BURST_INTERVAL = params["burst_interval"]
+    module.BOSS_CHARGE_DAMAGE = params["charge_damage"]
+    boss.circular_shot_count = params["circular_shot_count"]
+    boss.enhanced_shot_count = params["enhanced_shot_count"]
+    boss.projectile_cooldown = params["cooldown1"]
+    return saved
+
+def restore_parameters(saved):
+    module.BOSS_EVOLUTION_TIME.clear()
+    module.BOSS_EVOLUTION_TIME.update(saved["BOSS_EVOLUTION_TIME"])
+    module.BOSS_PROJECTILE_COOLDOWN.clear()
+    module.BOSS_PROJECTILE_COOLDOWN.update(saved["BOSS_PROJECTILE_COOLDOWN"])
+    module.BOSS_BURST_INTERVAL = saved["BOSS_BURST_INTERVAL"]
+    module.BOSS_CHARGE_DAMAGE = saved["BOSS_CHARGE_DAMAGE"]
+
+#############################################
+# 스크립트 플레이어
+#############################################
+class ScriptedBossPlayer:
+    """
+    보스전 스크립트 플레이어
+
+    매 틱 반대 방향을 뺀 세 방향의 다음 위치를 평가해서 비용이 가장 낮은 방향으로 움직인다.
+        - 앞으로 horizon틱 동안 투사체와 가까워지는 위치: 큰 비용
+        - 돌진 중이 아닐 때 보스 머리 근처: 큰 비용, 보스와 너무 가까우면 거리만큼 비용
+        - 몸통에 둘러싸여 갈 곳이 몸 길이보다 적은 방향: 큰 비용
+        - 목표(돌진 중/돌진 가능하면 보스 머리, 아니면 가장 가까운 음식)까지의 거리
+    에너지가 최대치의 engage_ratio 이상일 때만 보스를 노리고, 돌진 후에 energy_reserve보다
+    적게 남거나 보스가 곧 진화할 체력이면 다시 음식을 모은다. 돌진은 보스와 한 줄에 있고
+    투사체 발사까지 여유가 있을 때(또는 보스에게 몰렸을 때) 시작하고, 돌진이 끝나가거나
+    투사체가 곧 나오면 보스에게서 빠진다. 벽 밖으로 나가는 방향은 고르지 않는다.
+    스탯 포인트는 속도를 SPEED_UPGRADE_LEVEL까지 올린 뒤 에너지에 쓴다.
+    """
+
+    def __init__(self, charge_range=120, safe_distance=60, horizon=4, energy_reserve=40, engage_ratio=0.9):
+        """
+        Args:
+            charge_range: int - 보스 머리가 이 거리(픽셀) 안이면 돌진
+            safe_distance: int - 돌진할 수 없을 때 보스와 유지할 거리
+            horizon: int - 투사체 위치를 예측할 틱 수
+            energy_reserve: int - 돌진 후 남겨둘 에너지
+            engage_ratio: float - 음식을 모으다가 에너지가 최대치의 이 비율이 되면 다시 보스를 노림
+        """
+        self.charge_range = charge_range
+        self.safe_distance = safe_distance
+        self.horizon = horizon
+        self.energy_reserve = energy_reserve
+        self.engage_ratio = engage_ratio
+        self.hunting = False       # True면 보스를 노리고, False면 에너지를 채울 때까지 음식만 모음
+
+    def act(self, player, world):
+        boss = world.boss
+        head_x, head_y = player.get_head()
+        boss_x, boss_y = boss.get_head()
+        boss_reach = CELL_SIZE * boss.size_multiplier
+        boss_distance = math.hypot(boss_x - head_x, boss_y - head_y)
+
+        charging = getattr(player, 'is_charging', False)
+        # 에너지를 채운 뒤에만 보스를 노리고, 돌진하면 예비 에너지 아래로 떨어지는 상태면 다시 음식으로
+        max_energy = 100 + (player.stats["ENERGY"] - 1) * 20  # Snake.move의 에너지 최대치
+        if player.energy >= max_energy * self.engage_ratio:
+            self.hunting = True
+        elif not charging and (player.energy < CHARGE_ENERGY + self.energy_reserve
+                               or self.near_phase_change(boss)):
+            # 다음 페이즈로 넘기는 돌진은 에너지를 가득 채운 뒤에만 (3페이즈 보스는 대시로 계속 쫓아옴)
+            self.hunting = False
+        # 음식을 모으는 중이라도 보스에게 따라잡히면 돌진으로 맞받아침 (돌진 중에는 부딪혀도 죽지 않고 피해를 줌)
+        cornered = boss_distance < boss_reach + CELL_SIZE * 3
+        can_charge = ((self.hunting or cornered) and not charging
+                      and player.energy >= CHARGE_ENERGY + self.energy_reserve)
+        # 보스와 한 줄에 있고 가까우면 이번 틱에 돌진 시작
+        aligned = abs(boss_x - head_x) < boss_reach or abs(boss_y - head_y) < boss_reach
+        # 투사체는 보스 머리에서 나오므로 발사 직전에는 보스에 붙어 있지 않도록 돌진 시점을 고름
+        shot_soon = boss.projectile_cooldown <= 2
+        start_charge = can_charge and (cornered or (aligned and boss_distance < self.charge_range
+                                                    and boss.projectile_cooldown > module.CHARGE_DURATION))
+        # 돌진이 끝나가거나 투사체가 곧 나오면 보스와 닿아 있지 않도록 빠짐 (그 전까지는 계속 맞힘)
+        retreating = charging and (player.charge_timer <= 2 or shot_soon)
+        attacking = (charging and not retreating) or start_charge or (can_charge and boss_distance < self.charge_range * 2)
+
+        if attacking:
+            target = (boss_x, boss_y)
+        elif retreating:
+            target = None
+        else:
+            # 보스 근처 음식은 다가가다 멈칫하게 되므로 다른 음식이 있으면 제외
+            foods = [food for food in world.food_list
+                     if math.hypot(food.x - boss_x, food.y - boss_y) >= self.safe_distance]
+            target = None
+            best_distance = None
+            for food in foods or world.food_list:
+                distance = abs(food.x - head_x) + abs(food.y - head_y)
+                if best_distance is None or distance < best_distance:
+                    target, best_distance = (food.x, food.y), distance
+
+        # BossSnake.move와 같은 보스 이동 거리
+        boss_step = CELL_SIZE * (1.5 if boss.is_dashing else 1) * (0.5 if boss.phase == 2 else 1)
+        boss_step_x, boss_step_y = DIRECTION_STEPS[boss.direction]
+        boss_next_x = boss_x + boss_step_x * boss_step
+        boss_next_y = boss_y + boss_step_y * boss_step
+
+        # Snake.move와 같은 이동 거리 (이번 틱에 옮길 칸 수)
+        units = player.speed_units()
+        if start_charge:
+            units *= 2
+        speed = (player.move_progress + units) // SPEED_UNITS_PER_CELL * CELL_SIZE
+        body = player.body[1:]
+        body_cells = {(int(x) // CELL_SIZE, int(y) // CELL_SIZE) for x, y in player.body}
+        limit = min(len(body) + 5, MAX_OPEN_SPACE)
+        best = None
+        best_cost = None
+        for direction in DIRECTIONS:
+            if direction == OPPOSITE[player.direction]:
+                continue
+            step_x, step_y = DIRECTION_STEPS[direction]
+            next_x = head_x + step_x * speed
+            next_y = head_y + step_y * speed
+            # 벽에 막히면 남은 이동이 벽 칸에 겹쳐 쌓여 자기 몸과 부딪히므로 제외, 여러 칸 이동하면 지나가는 칸도 확인
+            if not (0 <= next_x <= MAX_CELL_X and 0 <= next_y <= MAX_CELL_Y) or speed == 0:
+                continue
+            path = [[head_x + step_x * CELL_SIZE * k, head_y + step_y * CELL_SIZE * k]
+                    for k in range(1, speed // CELL_SIZE)]
+            if [next_x, next_y] in body or any(cell in body for cell in path):
+                continue
+            cost = 0.0
+            if self.open_space(next_x, next_y, body_cells, limit) < limit:
+                cost += 2000  # 몸통에 갇히는 방향
+            for projectile in boss.projectiles:
+                for ahead in range(1, self.horizon + 1):
+                    x = head_x + step_x * speed * ahead
+                    y = head_y + step_y * speed * ahead
+                    distance = math.hypot(projectile.x + projectile.dx * ahead - x,
+                                          projectile.y + projectile.dy * ahead - y)
+                    if distance < CELL_SIZE * 1.5:
+                        cost += 1000 / ahead
+            # 보스도 이번 틱에 움직이므로 지금 위치와 진행 방향으로 한 번 움직인 위치 중 가까운 쪽 기준
+            next_boss_distance = min(math.hypot(boss_x - next_x, boss_y - next_y),
+                                     math.hypot(boss_next_x - next_x, boss_next_y - next_y))
+            if not attacking:
+                if next_boss_distance < boss_reach + boss_step + CELL_SIZE:
+                    cost += 500
+                if next_boss_distance < self.safe_distance:
+                    cost += (self.safe_distance - next_boss_distance) * 2
+            if target is not None:
+                cost += abs(target[0] - next_x) + abs(target[1] - next_y)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = direction, cost
+
+        action = {}
+        if best is not None:
+            action["direction"] = best
+        upgrade = self.choose_upgrade(player)
+        if upgrade is not None:
+            action["upgrade"] = upgrade
+        if start_charge:
+            action["charge"] = True
+        return action
+
+    @staticmethod
+    def near_phase_change(boss):
+        """보스 체력이 강제 진화 기준(60%, 30%)까지 돌진 한 번에 깎을 수 있는 거리 안인지"""
+        for ratio in PHASE_HEALTH_RATIOS:
+            threshold = boss.max_health * ratio
+            if threshold < boss.health <= threshold + module.BOSS_CHARGE_DAMAGE * PHASE_MARGIN_HITS:
+                return True
+        return False
+
+    @staticmethod
+    def choose_upgrade(player):
+        """
+        스탯 포인트가 있으면 올릴 스탯
+        속도는 보스(한 틱에 한 칸)를 따돌릴 만큼만 올리고 (더 빠르면 한 틱에 두 칸씩 움직여 몸통에 갇히기 쉬움)
+        나머지는 에너지에 씀 (소모 감소, 최대치 증가)
+        """
+        if player.stat_points <= 0:
+            return None
+        for stat, level in (("SPEED", SPEED_UPGRADE_LEVEL), ("ENERGY", module.MAX_STAT_LEVEL)):
+            if player.stats[stat] < level:
+                return stat
+        return None
+
+    def open_space(self, x, y, blocked, limit):
+        """(x, y)에서 몸통을 피해 갈 수 있는 칸 수 (limit개까지만 셈)"""
+        columns, rows = WIDTH // CELL_SIZE, HEIGHT // CELL_SIZE
+        start = (int(x) // CELL_SIZE, int(y) // CELL_SIZE)
+        seen = {start}
+        queue = deque([start])
+        while queue and len(seen) < limit:
+            cell_x, cell_y = queue.popleft()
+            for step_x, step_y in DIRECTION_STEPS.values():
+                cell = (cell_x + step_x, cell_y + step_y)
+                if (cell not in seen and cell not in blocked
+                        and 0 <= cell[0] < columns and 0 <= cell[1] < rows):
+                    seen.add(cell)
+                    queue.append(cell)
+        return len(seen)
+
+#############################################
+# 경기
+#############################################
+def run_fight(params, seed, max_ticks=DEFAULT_MAX_TICKS, player_options=None):
+    """
+    보스전 한 판
+
+    Returns:
+        dict: {"outcome": "win"/"death"/"timeout", "ticks", "cause", "phase",
+               "phase_start": [1페이즈, 2페이즈, 3페이즈 진입 틱 또는 None], "hits", "boss_health"}
+    """
+    world = GameWorld("BOSS", seed=seed)
+    player_id = world.add_player("Scripted")
+    player = world.players[player_id]
+    boss = world.boss
+    policy = ScriptedBossPlayer(**(player_options or {}))
+    saved = apply_parameters(params, boss)
+    try:
+        phase_start = [0, None, None]
+        hits = 0
+        while world.tick < max_ticks:
+            action = policy.act(player, world)
+            if action:
+                world.apply_input(player_id, **action)
+            health = boss.health
+            world.step()
+            if boss.health < health:
+                hits += 1
+            if phase_start[boss.phase - 1] is None:
+                phase_start[boss.phase - 1] = world.tick
+            if world.finished or not player.alive:
+                break
+    finally:
+        restore_parameters(saved)
+
+    if world.finished:
+        outcome, cause = "win", None
+    elif not player.alive:
+        outcome = "death"
+        if player.energy <= 0:
+            cause = "energy"
+        else:
+            cause = DEATH_CAUSES.get(getattr(player, 'message', None), "self")
+    else:
+        outcome, cause = "timeout", None
+    return {"outcome": outcome, "ticks": world.tick, "cause": cause, "phase": boss.phase,
+            "phase_start": phase_start, "hits": hits, "boss_health": max(0, boss.health)}
+
+def run_job(job):
+    """프로세스 풀 작업 단위"""
+    params, seed, max_ticks, player_options = job
+    return run_fight(params, seed, max_ticks, player_options)
+
+#############################################
+# 통계
+#############################################
+def kaplan_meier(durations, events):
+    """
+    Kaplan-Meier 생존 곡선
+
+    Args:
+        durations: list - 관찰 시간 (틱)
+        events: list - True면 그 시간에 사망, False면 중도 종료(처치/페이즈 이동/제한 시간)
+
+    Returns:
+        list: [(시간, 생존 확률)] (사망이 일어난 시간마다)
+    """
+    records = sorted(zip(durations, events))
+    at_risk = len(records)
+    survival = 1.0
+    curve = []
+    index = 0
+    while index < len(records):
+        time = records[index][0]
+        deaths = 0
+        leaving = 0
+        while index < len(records) and records[index][0] == time:
+            deaths += records[index][1]
+            leaving += 1
+            index += 1
+        if deaths:
+            survival *= 1 - deaths / at_risk
+            curve.append((time, survival))
+        at_risk -= leaving
+    return curve
+
+def survival_at(curve, time):
+    """생존 곡선의 time 시점 값"""
+    value = 1.0
+    for point, survival in curve:
+        if point > time:
+            break
+        value = survival
+    return value
+
+def percentile(values, fraction):
+    """정렬된 값의 백분위수 (선형 보간)"""
+    if not values:
+        return None
+    position = (len(values) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+def summarize(results):
+    """
+    설정 하나의 경기 결과 요약
+
+    Returns:
+        dict: 승률, 사망 원인/페이즈, 페이즈별 생존 곡선, 처치 시간 분포
+    """
+    fights = len(results)
+    outcomes = {"win": 0, "death": 0, "timeout": 0}
+    causes = {}
+    death_phases = {1: 0, 2: 0, 3: 0}
+    for result in results:
+        outcomes[result["outcome"]] += 1
+        if result["outcome"] == "death":
+            causes[result["cause"]] = causes.get(result["cause"], 0) + 1
+            death_phases[result["phase"]] += 1
+
+    # 페이즈별 생존: 페이즈 진입부터 사망(사건) 또는 처치/다음 페이즈/제한 시간(중도 종료)까지
+    phases = {}
+    for phase in (1, 2, 3):
+        durations = []
+        events = []
+        for result in results:
+            start = result["phase_start"][phase - 1]
+            if start is None:
+                continue
+            next_start = result["phase_start"][phase] if phase < 3 else None
+            end = next_start if next_start is not None else result["ticks"]
+            durations.append(end - start)
+            events.append(result["outcome"] == "death" and result["phase"] == phase)
+        curve = kaplan_meier(durations, events)
+        phases[phase] = {
+            "reached": len(durations),
+            "deaths": sum(events),
+            "survival": {seconds: survival_at(curve, seconds * TICK_RATE) for seconds in SURVIVAL_CHECKPOINTS},
+        }
+
+    kill_times = sorted(result["ticks"] / TICK_RATE for result in results if result["outcome"] == "win")
+    histogram = {}
+    for seconds in kill_times:
+        start = int(seconds // TIME_TO_KILL_BIN) * TIME_TO_KILL_BIN
+        histogram[start] = histogram.get(start, 0) + 1
+    return {
+        "fights": fights,
+        "outcomes": outcomes,
+        "win_rate": outcomes["win"] / fights if fights else 0.0,
+        "causes": causes,
+        "death_phases": death_phases,
+        "phases": phases,
+        "time_to_kill": {
+            "count": len(kill_times),
+            "p10": percentile(kill_times, 0.1), "p25": percentile(kill_times, 0.25),
+            "median": percentile(kill_times, 0.5), "p75": percentile(kill_times, 0.75),
+            "p90": percentile(kill_times, 0.9),
+            "histogram": dict(sorted(histogram.items())),
+        },
+        "mean_hits": sum(result["hits"] for result in results) / fights if fights else 0.0,
+    }
+
+def print_summary(label, summary):
+    """설정 하나의 요약 출력"""
+    outcomes = summary["outcomes"]
+    print(f"\n=== {label} ===")
+    print(f"경기 {summary['fights']}: 처치 {outcomes['win']} ({summary['win_rate']:.1%}), "
+          f"사망 {outcomes['death']}, 시간 초과 {outcomes['timeout']}, 평균 적중 {summary['mean_hits']:.1f}회")
+    if summary["causes"]:
+        causes = ", ".join(f"{cause} {count}" for cause, count in sorted(summary["causes"].items()))
+        phases = ", ".join(f"{phase}페이즈 {count}" for phase, count in summary["death_phases"].items())
+        print(f"사망 원인: {causes} / 사망 페이즈: {phases}")
+
+    print("페이즈별 생존 곡선 (진입 후 경과 초)")
+    print("  페이즈  진입  사망" + "".join(f"{str(seconds) + 's':>8}" for seconds in SURVIVAL_CHECKPOINTS))
+    for phase, data in summary["phases"].items():
+        if not data["reached"]:
+            print(f"  {phase:>6}{0:>6}     -")
+            continue
+        print(f"  {phase:>6}{data['reached']:>6}{data['deaths']:>6}"
+              + "".join(f"{data['survival'][seconds]:>8.1%}" for seconds in SURVIVAL_CHECKPOINTS))
+
+    ttk = summary["time_to_kill"]
+    if ttk["count"]:
+        print(f"처치 시간(초): p10 {ttk['p10']:.0f}, p25 {ttk['p25']:.0f}, 중앙값 {ttk['median']:.0f}, "
+              f"p75 {ttk['p75']:.0f}, p90 {ttk['p90']:.0f}")
+        largest = max(ttk["histogram"].values())
+        for start, count in ttk["histogram"].items():
+            bar = "#" * max(1, round(count / largest * 40))
+            print(f"  {start:>4}-{start + TIME_TO_KILL_BIN:<4}s {count:>5} {bar}")
+
+#############################################
+# 실행
+#############################################
+def parse_assignment(text, multiple):
+    """"name=value" 또는 "name=v1,v2" 해석"""
+    name, _, values = text.partition("=")
+    name = name.strip()
+    if name not in PARAMETERS or not values:
+        raise ValueError(f"알 수 없는 설정: {text} (사용 가능: {', '.join(PARAMETERS)})")
+    parsed = [int(value) for value in values.split(",")]
+    if not multiple and len(parsed) != 1:
+        raise ValueError(f"--set에는 값 하나만 지정합니다: {text}")
+    return name, parsed
+
+def analyze(configs, fights, max_ticks=DEFAULT_MAX_TICKS, workers=None, first_seed=1, player_options=None):
+    """
+    설정별로 fights판씩 실행해서 요약
+
+    Args:
+        configs: list - 보스 상수 dict 목록 (default_parameters() 형식)
+        workers: int - 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+
+    Returns:
+        list: 설정별 summarize() 결과
+    """
+    jobs = [(params, seed, max_ticks, player_options)
+            for params in configs for seed in range(first_seed, first_seed + fights)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            # 계측 중이면 워커별 구간 통계도 함께 받아서 이 프로세스의 결과에 합침
+            outputs = pool.map(functools.partial(worker_job, run_job), jobs,
+                               chunksize=max(1, len(jobs) // (workers * 8)))
+            results = collect_worker_results(outputs)
+    else:
+        results = [run_job(job) for job in jobs]
+    return [summarize(results[index * fights:(index + 1) * fights]) for index in range(len(configs))]
+
+def main():
+    parser = argparse.ArgumentParser(description="보스전 난이도 분석기")
+    parser.add_argument("--fights", type=int, default=DEFAULT_FIGHTS, help="설정당 경기 수")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="고정할 보스 상수")
+    parser.add_argument("--sweep", action="append", default=[], metavar="NAME=V1,V2",
+                        help="바꿔가며 비교할 보스 상수 (여러 개면 모든 조합)")
+    parser.add_argument("--charge-range", type=int, default=120, help="스크립트 플레이어 돌진 거리")
+    parser.add_argument("--json", help="요약을 저장할 JSON 파일")
+    parser.add_argument("--list", action="store_true", help="조정 가능한 상수 목록")
+    args = parser.parse_args()
+
+    if args.list:
+        defaults = default_parameters()
+        for name, description in PARAMETERS.items():
+            print(f"{name:<22}{defaults[name]:>6}  {description}")
+        return
+
+    base = default_parameters()
+    try:
+        for text in args.set:
+            name, values = parse_assignment(text, multiple=False)
+            base[name] = values[0]
+        sweeps = [parse_assignment(text, multiple=True) for text in args.sweep]
+    except ValueError as e:
+        parser.error(str(e))
+
+    configs = []
+    labels = []
+    for combination in itertools.product(*[values for _, values in sweeps]):
+        params = dict(base)
+        for (name, _), value in zip(sweeps, combination):
+            params[name] = value
+        configs.append(params)
+        labels.append(", ".join(f"{name}={value}" for (name, _), value in zip(sweeps, combination)) or "기본값")
+
+    print(f"설정 {len(configs)}개 x {args.fights}판, 제한 {args.max_ticks / TICK_RATE:.0f}초")
+    summaries = analyze(configs, args.fights, args.max_ticks, args.workers, args.first_seed,
+                        {"charge_range": args.charge_range})
+    for label, summary in zip(labels, summaries):
+        print_summary(label, summary)
+
+    if len(configs) > 1:
+        print(f"\n{'설정':<40}{'처치율':>8}{'처치 중앙값(초)':>16}{'1P 60s 생존':>13}")
+        for label, summary in zip(labels, summaries):
+            median = summary["time_to_kill"]["median"]
+            survival = summary["phases"][1]["survival"][60]
+            print(f"{label:<40}{summary['win_rate']:>8.1%}"
+                  f"{(f'{median:.0f}' if median is not None else '-'):>16}{survival:>13.1%}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([{"label": label, "params": params, "summary": summary}
+                       for label, params, summary in zip(labels, configs, summaries)], f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
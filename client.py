@@ -0,0 +1,359 @@
+"""
+Snake Game - 멀티플레이 클라이언트
+서버(server.py)에 접속해서 키 입력을 보내고, 서버가 보내는 상태를 그대로 그리는 클라이언트 모드.
+게임 규칙은 서버에서만 계산하므로 클라이언트는 입력과 렌더링만 담당한다.
+상태는 바이너리 델타(replication.py)로 받고, 적용한 틱을 서버에 ack로 알려준다.
+
+- run_client: pygame 창을 띄우는 일반 클라이언트 (main.py --connect HOST:PORT)
+- run_load_test: 화면 없이 여러 봇 클라이언트로 서버에 부하를 주는 로컬 테스트
+    python client.py --bots 32 --seconds 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+import pygame
+from module import (
+    WIDTH, HEIGHT, CELL_SIZE, BLACK, WHITE, ORANGE, RED, PURPLE, SPECIAL_ITEMS,
+    draw_leaderboard, draw_energy_bar
+)
+from font_manager import get_font_manager
+from server import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_ROOM, DEFAULT_MODE, encode_message
+from replication import ReplicaReceiver
+from world import FOOD_NORMAL, FOOD_ITEM, SPECIAL_ITEM_TYPES
+
+# 음식 종류 번호 -> (색상, 크기) - draw_game_objects와 같은 규칙
+FOOD_STYLES = {FOOD_NORMAL: (WHITE, CELL_SIZE), FOOD_ITEM: (ORANGE, 4)}
+for _index, _item_type in enumerate(SPECIAL_ITEM_TYPES):
+    FOOD_STYLES[2 + _index] = (SPECIAL_ITEMS[_item_type]["color"], 6)
+PROJECTILE_SIZE = 8
+
+# 키 -> 서버로 보낼 입력
+KEY_INPUTS = {
+    pygame.K_UP: {"direction": "UP"}, pygame.K_w: {"direction": "UP"},
+    pygame.K_DOWN: {"direction": "DOWN"}, pygame.K_s: {"direction": "DOWN"},
+    pygame.K_LEFT: {"direction": "LEFT"}, pygame.K_a: {"direction": "LEFT"},
+    pygame.K_RIGHT: {"direction": "RIGHT"}, pygame.K_d: {"direction": "RIGHT"},
+    pygame.K_SPACE: {"dash": True},
+    pygame.K_f: {"charge": True},
+    pygame.K_e: {"tank": True},
+}
+EVOLVE_KEYS = {pygame.K_1: "SPEEDER", pygame.K_2: "TANK", pygame.K_3: "HUNTER", pygame.K_4: "ULTIMATE"}
+
+def parse_address(address):
+    """"HOST:PORT" 문자열을 (host, port)로 변환 (포트가 없으면 기본 포트)"""
+    host, _, port = address.rpartition(":")
+    if not host:
+        return address, DEFAULT_PORT
+    return host, int(port)
+
+class RemoteSnake:
+    """서버 상태로 만든 뱀 - 리더보드/에너지 바 그리기 함수가 쓰는 속성만 가짐"""
+
+    def __init__(self, entity_id):
+        self.entity_id = entity_id
+        self.ranking = None
+        self._score = 0
+        self.name = ""
+        self.color = WHITE
+        self.is_ai = True
+        self.alive = True
+        self.energy = 0
+        self.body = []
+
+    @property
+    def score(self):
+        return self._score
+
+    @score.setter
+    def score(self, value):
+        if value != self._score:
+            self._score = value
+            if self.ranking is not None:
+                self.ranking.update(self)
+
+    def get_head(self):
+        return self.body[0] if self.body else (0, 0)
+
+    def apply(self, data):
+        self.name = data["name"]
+        self.color = tuple(data["color"])
+        self.is_ai = data["ai"]
+        self.alive = data["alive"]
+        self.energy = data["energy"]
+        flat = data["body"]
+        self.body = [(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)]
+        self.score = data["score"]
+
+def read_varint(stream):
+    """스트림에서 varint 하나 읽기 (연결이 끊기면 None)"""
+    result = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            return None
+        result |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return result
+        shift += 7
+
+class NetworkClient:
+    """서버 연결 - 수신은 별도 스레드에서 처리하고 가장 최근 상태만 보관"""
+
+    def __init__(self, host, port, name="YOU", room=DEFAULT_ROOM, mode=DEFAULT_MODE):
+        self.sock = socket.create_connection((host, port), timeout=5)
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()  # 입력(메인 스레드)과 ack(수신 스레드)가 섞이지 않도록
+        self.welcome = None
+        self.frame = None
+        self.state = None
+        self.error = None
+        self.connected = True
+        self.receiver = ReplicaReceiver()
+        self.send({"type": "join", "name": name, "room": room, "mode": mode, "protocol": "binary"})
+        self.thread = threading.Thread(target=self.receive_loop, daemon=True)
+        self.thread.start()
+
+    def send(self, message):
+        try:
+            with self.send_lock:
+                self.sock.sendall(encode_message(message))
+        except OSError:
+            self.connected = False
+
+    def receive_loop(self):
+        stream = self.sock.makefile("rb")
+        try:
+            message = json.loads(stream.readline())
+            if message.get("type") != "welcome":
+                self.error = message.get("message")
+                return
+            self.welcome = message
+            while True:
+                length = read_varint(stream)
+                if length is None:
+                    break
+                data = stream.read(length)
+                if len(data) < length:
+                    break
+                frame = self.receiver.receive(data)
+                with self.lock:
+                    self.frame = frame
+                self.send({"type": "ack", "tick": frame.tick})
+        except (OSError, ValueError, KeyError):
+            pass
+        finally:
+            self.connected = False
+
+    def latest_state(self):
+        """가장 최근 프레임을 그리기용 딕셔너리로 변환 (같은 틱이면 이전 결과 재사용)"""
+        with self.lock:
+            frame = self.frame
+        if frame is None:
+            return None
+        if self.state is None or self.state["tick"] != frame.tick:
+            self.state = frame.to_state()
+        return self.state
+
+    def close(self):
+        self.connected = False
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+class RemoteView:
+    """서버 상태를 화면에 그리는 뷰 (뱀 객체는 번호별로 재사용해서 리더보드 순위를 점진적으로 유지)"""
+
+    def __init__(self):
+        self.snakes = []       # 리더보드용 목록 (뒤에 추가만 함)
+        self.by_id = {}
+        self.last_tick = None
+
+    def update(self, state):
+        if state["tick"] == self.last_tick:
+            return
+        self.last_tick = state["tick"]
+        seen = set()
+        for data in state["snakes"]:
+            snake = self.by_id.get(data["id"])
+            if snake is None or (snake.ranking is None and data["alive"]):
+                # 처음 보는 뱀이거나 순위에서 빠진 뒤 다시 살아난 뱀
+                snake = RemoteSnake(data["id"])
+                self.by_id[data["id"]] = snake
+                self.snakes.append(snake)
+            snake.apply(data)
+            seen.add(data["id"])
+        for entity_id, snake in self.by_id.items():
+            if entity_id not in seen:
+                snake.alive = False
+
+    def draw(self, screen, state, player_id):
+        screen.fill(BLACK)
+        food = state["food"]
+        for i in range(0, len(food), 3):
+            color, size = FOOD_STYLES.get(food[i + 2], FOOD_STYLES[0])
+            pygame.draw.rect(screen, color, (food[i], food[i + 1], size, size))
+        for snake in self.by_id.values():
+            if not snake.alive:
+                continue
+            for x, y in snake.body:
+                pygame.draw.rect(screen, snake.color, (x, y, CELL_SIZE, CELL_SIZE))
+        projectiles = state["projectiles"]
+        for i in range(0, len(projectiles), 2):
+            pygame.draw.rect(screen, RED, (projectiles[i], projectiles[i + 1], PROJECTILE_SIZE, PROJECTILE_SIZE))
+
+        draw_leaderboard(screen, self.snakes)
+        player = self.by_id.get(player_id)
+        if player is not None:
+            draw_energy_bar(screen, player)
+            if not player.alive:
+                font = get_font_manager().get_font('small', 36)
+                text = font.render("R 키를 눌러 다시 시작", True, WHITE)
+                screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+        if state.get("boss_health") is not None:
+            font = get_font_manager().get_font('small', 24)
+            text = font.render(f"BOSS HP: {state['boss_health']}", True, PURPLE)
+            screen.blit(text, text.get_rect(center=(WIDTH // 2, 30)))
+
+def run_client(address, name="YOU", room=DEFAULT_ROOM, mode=DEFAULT_MODE):
+    """
+    서버 접속 클라이언트 실행
+
+    Args:
+        address: str - "HOST:PORT"
+        name: str - 플레이어 이름
+        room: str - 접속할 방 이름
+        mode: str - 방이 없을 때 만들 게임 모드
+    """
+    host, port = parse_address(address)
+    network = NetworkClient(host, port, name=name, room=room, mode=mode)
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(f"Snake Game - Online ({host}:{port})")
+    clock = pygame.time.Clock()
+    view = RemoteView()
+
+    running = True
+    while running and network.connected:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_r:
+                    network.send({"type": "respawn"})
+                elif event.key in KEY_INPUTS:
+                    network.send(dict(KEY_INPUTS[event.key], type="input"))
+                elif event.key in EVOLVE_KEYS:
+                    network.send({"type": "input", "evolve": EVOLVE_KEYS[event.key]})
+
+        state = network.latest_state()
+        if state is not None and network.welcome is not None:
+            view.update(state)
+            view.draw(screen, state, network.welcome["player_id"])
+            pygame.display.flip()
+        clock.tick(30)  # 서버 틱(15)보다 자주 확인해서 입력/표시 지연을 줄임
+
+    if network.error:
+        print("서버 오류:", network.error)
+    network.close()
+
+async def run_bot(host, port, index, stop_time, results, room=DEFAULT_ROOM, mode=DEFAULT_MODE):
+    """무작위 입력을 보내고 받은 델타를 적용/ack하는 봇 클라이언트 하나"""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode_message({"type": "join", "name": f"Bot{index}", "room": room, "mode": mode,
+                                 "protocol": "binary"}))
+    receiver = ReplicaReceiver()
+    states = 0
+    received_bytes = 0
+    last_tick = None
+    tick_gaps = 0
+    try:
+        welcome = json.loads(await reader.readline())
+        if welcome.get("type") != "welcome":
+            return
+        while time.monotonic() < stop_time:
+            length = 0
+            shift = 0
+            while True:
+                byte = (await asyncio.wait_for(reader.readexactly(1), timeout=2.0))[0]
+                length |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            data = await reader.readexactly(length)
+            received_bytes += length
+            frame = receiver.receive(data)
+            states += 1
+            if last_tick is not None and frame.tick != last_tick + 1:
+                tick_gaps += 1
+            last_tick = frame.tick
+            writer.write(encode_message({"type": "ack", "tick": frame.tick}))
+            if random.random() < 0.2:
+                writer.write(encode_message({
+                    "type": "input",
+                    "direction": random.choice(["UP", "DOWN", "LEFT", "RIGHT"]),
+                    "dash": random.random() < 0.05,
+                }))
+            if not frame.snakes[welcome["player_id"]].alive and random.random() < 0.1:
+                writer.write(encode_message({"type": "respawn"}))
+    finally:
+        writer.close()
+    results.append((states, tick_gaps, received_bytes))
+
+async def run_load_test(host=DEFAULT_HOST, port=DEFAULT_PORT, bots=32, seconds=10.0, rooms=1):
+    """
+    봇 클라이언트 여러 개로 서버 부하 테스트 (rooms > 1이면 봇을 여러 방에 나누고 모드도 돌아가며 사용)
+
+    Returns:
+        dict: 봇당 평균 수신 상태 수, 초당 상태 수, 틱 누락 횟수, 봇당 초당 수신 바이트
+    """
+    results = []
+    stop_time = time.monotonic() + seconds
+    modes = ("CLASSIC", "EVOLUTION", "BOSS")
+    await asyncio.gather(*(run_bot(host, port, i, stop_time, results,
+                                   room=DEFAULT_ROOM if rooms <= 1 else f"room{i % rooms}",
+                                   mode=DEFAULT_MODE if rooms <= 1 else modes[(i % rooms) % len(modes)])
+                           for i in range(bots)),
+                         return_exceptions=True)
+    received = [states for states, _, _ in results]
+    average = sum(received) / len(received) if received else 0
+    total_bytes = sum(received_bytes for _, _, received_bytes in results)
+    return {
+        "bots": bots,
+        "connected": len(results),
+        "avg_states": round(average, 1),
+        "states_per_second": round(average / seconds, 2),
+        "tick_gaps": sum(gaps for _, gaps, _ in results),
+        "bytes_per_bot_second": round(total_bytes / len(results) / seconds) if results else 0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake Game 멀티플레이 클라이언트")
+    parser.add_argument("address", nargs="?", default=f"{DEFAULT_HOST}:{DEFAULT_PORT}")
+    parser.add_argument("--name", default="YOU")
+    parser.add_argument("--room", default=DEFAULT_ROOM)
+    parser.add_argument("--mode", default=DEFAULT_MODE)
+    parser.add_argument("--bots", type=int, default=0, help="화면 없이 봇 N개로 부하 테스트")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--rooms", type=int, default=1, help="부하 테스트 봇을 나눌 방 수")
+    args = parser.parse_args()
+
+    if args.bots:
+        host, port = parse_address(args.address)
+        print(asyncio.run(run_load_test(host, port, args.bots, args.seconds, args.rooms)))
+    else:
+        pygame.init()
+        run_client(args.address, name=args.name, room=args.room, mode=args.mode)
+        pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Snake Game - 더티 렉트 렌더러
+매 프레임 전체 화면을 다시 그리는 대신, 바뀐 셀과 HUD 영역만 지우고 다시 그린 뒤
+pygame.display.update(rects)로 해당 영역만 화면에 전송하는 렌더링 모드
+"""
+
+import pygame
+from module import (
+    WIDTH, HEIGHT, CELL_SIZE, BLACK, WHITE, ORANGE,
+    SpecialItem, get_snake_alpha
+)
+
+# 더티 영역 검색용 버킷 크기 (픽셀)
+BUCKET_SIZE = 64
+
+# 리더보드 패널 영역 (module.draw_leaderboard 기준: 헤더 35 + 5행 * 28 + 여백 10)
+_LEADERBOARD_REGION = (WIDTH - 240 - 15, 15, 240, 185)
+
+# 모드별 HUD 패널 영역 - 내용이 매 틱 바뀌므로 항상 지우고 다시 그림
+HUD_REGIONS = {
+    "COMMON": [
+        (18, 8, 210, 56),            # 에너지 바 + 텍스트
+        (0, 68, WIDTH, 54),          # 중앙 상단 메시지 배너
+    ],
+    "CLASSIC": [
+        _LEADERBOARD_REGION,
+        (20, 60, 200, 32),           # 대시 쿨다운 텍스트
+    ],
+    "EVOLUTION": [
+        _LEADERBOARD_REGION,
+        (20, 80, 220, 100),          # 레벨/경험치 상태 UI
+        (10, 170, 210, 185),         # 스탯 + 활성 효과 패널
+        (20, HEIGHT - 220, 340, 190),  # 도움말 메시지
+        (WIDTH - 174, HEIGHT - 174, 158, 158),  # 미니맵
+    ],
+    "BOSS": [
+        (20, 80, 220, 100),
+        (10, 170, 210, 185),
+        (20, HEIGHT - 220, 340, 190),
+        (WIDTH - 174, HEIGHT - 174, 158, 158),
+        ((WIDTH - 400) // 2 - 2, 18, 404, 55),  # 보스 체력바 + 정보
+    ],
+}
+
+
+def get_hud_regions(game_mode):
+    """게임 모드에 해당하는 HUD 영역 목록을 pygame.Rect로 반환"""
+    regions = HUD_REGIONS["COMMON"] + HUD_REGIONS.get(game_mode, [])
+    return [pygame.Rect(region) for region in regions]
+
+
+def snap_to_cells(rect):
+    """영역을 셀 경계까지 바깥으로 넓힌 Rect 반환 (다시 그리는 셀은 통째로 지워지도록)"""
+    left = rect.left // CELL_SIZE * CELL_SIZE
+    top = rect.top // CELL_SIZE * CELL_SIZE
+    right = -(-rect.right // CELL_SIZE) * CELL_SIZE
+    bottom = -(-rect.bottom // CELL_SIZE) * CELL_SIZE
+    return pygame.Rect(left, top, right - left, bottom - top)
+
+
+def _food_style(food):
+    """음식 종류에 따른 (색상, 크기) 반환 - draw_game_objects와 동일한 규칙"""
+    if isinstance(food, SpecialItem):
+        return food.color, 6
+    if food.is_item:
+        return ORANGE, 4
+    return WHITE, CELL_SIZE
+
+
+class DirtyRectRenderer:
+    """변경된 영역만 다시 그리는 월드 렌더러"""
+
+    def __init__(self, screen, game_mode):
+        self.screen = screen
+        self.hud_rects = get_hud_regions(game_mode)
+        self.prev_cells = {}        # (x, y) -> (color, alpha)
+        self.prev_foods = {}        # (x, y) -> (color, size)
+        self.prev_projectiles = []  # 지난 프레임 투사체 영역
+        self.update_rects = []      # 이번 프레임에 화면으로 보낼 영역
+        self.cell_surfaces = {}     # (color, alpha) -> 셀 Surface 캐시
+        self.needs_full_redraw = True
+        self.full_present = True
+
+    def invalidate(self):
+        """오버레이 등으로 화면 전체가 바뀌었을 때 호출 - 이번 프레임은 flip, 다음 프레임은 전체 다시 그리기"""
+        self.needs_full_redraw = True
+        self.full_present = True
+
+    def get_cell_surface(self, style):
+        """(색상, 알파) 조합별 셀 Surface를 한 번만 생성해서 재사용"""
+        surface = self.cell_surfaces.get(style)
+        if surface is None:
+            color, alpha = style
+            surface = pygame.Surface((CELL_SIZE, CELL_SIZE))
+            surface.fill(color)
+            surface.set_alpha(alpha)
+            self.cell_surfaces[style] = surface
+        return surface
+
+    def draw_cell(self, pos, style):
+        """몸통 셀 하나 그리기 (불투명하면 블렌딩 없이 바로 채움)"""
+        color, alpha = style
+        if alpha >= 255:
+            self.screen.fill(color, (pos[0], pos[1], CELL_SIZE, CELL_SIZE))
+        else:
+            self.screen.blit(self.get_cell_surface(style), pos)
+
+    def collect_cells(self, snakes):
+        """살아있는 뱀들의 몸통 셀을 (좌표 -> 스타일) 딕셔너리로 수집"""
+        cells = {}
+        for snake in snakes:
+            if not snake.alive:
+                continue
+            style = (tuple(snake.color), get_snake_alpha(snake))
+            for segment in snake.body:
+                cells[(int(segment[0]), int(segment[1]))] = style
+        return cells
+
+    def draw_world(self, food_list, snakes, projectiles=()):
+        """
+        음식과 뱀을 그리고 화면에 전송할 더티 영역을 계산하는 함수
+
+        매개변수:
+            food_list: list - 게임 내 모든 음식/아이템 목록
+            snakes: list - 게임 내 모든 뱀 목록
+            projectiles: list - 보스 투사체 목록 (투사체 자체는 보스 UI가 그림)
+        """
+        screen = self.screen
+        cells = self.collect_cells(snakes)
+        foods = {(int(food.x), int(food.y)): _food_style(food) for food in food_list}
+        projectile_rects = [pygame.Rect(p.x, p.y, p.size, p.size) for p in projectiles]
+
+        if self.needs_full_redraw:
+            screen.fill(BLACK)
+            for (x, y), (color, size) in foods.items():
+                pygame.draw.rect(screen, color, (x, y, size, size))
+            for pos, style in cells.items():
+                self.draw_cell(pos, style)
+            self.needs_full_redraw = False
+            self.full_present = True
+        else:
+            # 이전 프레임과 달라진 셀/음식, 투사체 이동 경로, HUD 패널이 더티 영역
+            dirty = [pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+                     for (x, y) in {pos for pos, _ in cells.items() ^ self.prev_cells.items()}]
+            for (x, y), (_, size) in foods.items() ^ self.prev_foods.items():
+                dirty.append(pygame.Rect(x, y, size, size))
+            dirty.extend(self.prev_projectiles)
+            dirty.extend(projectile_rects)
+            dirty.extend(self.hud_rects)
+            # 셀 일부만 겹치는 영역(투사체, HUD)도 셀 전체를 지워야 반투명 몸통이 두 번 섞이지 않음
+            dirty = [snap_to_cells(rect) for rect in dirty]
+            buckets = self.build_buckets(dirty)
+            redraw_cells = self.collect_redraw_cells(cells, dirty, buckets)
+
+            for rect in dirty:
+                screen.fill(BLACK, rect)
+
+            # 지워진 영역과 겹치는 오브젝트만 다시 그림
+            for (x, y), (color, size) in foods.items():
+                if self.hits_dirty(buckets, x, y, size):
+                    pygame.draw.rect(screen, color, (x, y, size, size))
+            for pos, style in redraw_cells.items():
+                self.draw_cell(pos, style)
+            self.update_rects = dirty
+
+        self.prev_cells = cells
+        self.prev_foods = foods
+        self.prev_projectiles = projectile_rects
+
+    def collect_redraw_cells(self, cells, dirty, buckets):
+        """
+        더티 영역과 겹쳐서 다시 그릴 셀 수집
+
+        격자에서 벗어난 셀(벽에 붙은 보스 등)은 셀 경계로 넓힌 더티 영역에도 일부만 걸칠 수 있으므로,
+        그런 셀의 영역을 더티 영역에 더하고 새로 걸리는 셀이 없을 때까지 반복 (dirty, buckets를 직접 갱신)
+        """
+        redraw = {}
+        pending = cells
+        while pending:
+            added = []
+            for (x, y), style in pending.items():
+                if self.hits_dirty(buckets, x, y, CELL_SIZE):
+                    redraw[(x, y)] = style
+                    if x % CELL_SIZE or y % CELL_SIZE:
+                        added.append(snap_to_cells(pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)))
+            if not added:
+                break
+            dirty.extend(added)
+            for rect in added:
+                self.add_to_buckets(buckets, rect)
+            pending = {pos: style for pos, style in cells.items() if pos not in redraw}
+        return redraw
+
+    def build_buckets(self, rects):
+        """더티 영역을 고정 크기 버킷에 등록"""
+        buckets = {}
+        for rect in rects:
+            self.add_to_buckets(buckets, rect)
+        return buckets
+
+    @staticmethod
+    def add_to_buckets(buckets, rect):
+        """더티 영역 하나를 버킷에 등록 (셀의 왼쪽 위 좌표로 바로 찾을 수 있도록 셀 크기만큼 확장)"""
+        for bx in range((rect.left - CELL_SIZE) // BUCKET_SIZE, rect.right // BUCKET_SIZE + 1):
+            for by in range((rect.top - CELL_SIZE) // BUCKET_SIZE, rect.bottom // BUCKET_SIZE + 1):
+                buckets.setdefault((bx, by), []).append(rect)
+
+    @staticmethod
+    def hits_dirty(buckets, x, y, size):
+        """(x, y) 위치의 오브젝트가 더티 영역과 겹치는지 확인"""
+        candidates = buckets.get((x // BUCKET_SIZE, y // BUCKET_SIZE))
+        if not candidates:
+            return False
+        return pygame.Rect(x, y, size, size).collidelist(candidates) != -1
+
+    def present(self):
+        """이번 프레임 결과를 화면에 전송 (전체 갱신이 필요하면 flip)"""
+        if self.full_present:
+            pygame.display.flip()
+            self.full_present = False
+        else:
+            pygame.display.update(self.update_rects)
+        self.update_rects = []
@@ -1,5 +1,6 @@
 import pygame
 import os
+import threading
 
 class FontManager:
     """크로스 플랫폼 폰트 관리 클래스"""
@@ -7,6 +8,8 @@ class FontManager:
     def __init__(self):
         self.local_font_path = "fonts/PretendardVariable.ttf"
         self.font_available = os.path.exists(self.local_font_path)
+        self.fonts = {}  # (font_type, size, bold) -> 공유 폰트 객체
+        self.lock = threading.Lock()  # 백그라운드 프리로드와 동시에 접근할 수 있음
         
         if self.font_available:
             print(f"✅ 로컬 폰트 파일 발견: {self.local_font_path}")
@@ -14,7 +17,19 @@ class FontManager:
             print(f"❌ 로컬 폰트 파일 없음, 시스템 폰트 사용")
     
     def get_font(self, font_type, size, bold=False):
-        """지정된 타입과 크기의 폰트 반환"""
+        """지정된 타입과 크기의 폰트 반환 (한 번 만든 폰트는 캐시해서 공유)"""
+        key = (font_type, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            with self.lock:
+                font = self.fonts.get(key)
+                if font is None:
+                    font = self.load_font(size, bold)
+                    self.fonts[key] = font
+        return font
+    
+    def load_font(self, size, bold=False):
+        """폰트 파일(또는 시스템 폰트)에서 새 폰트 생성"""
         try:
             if self.font_available:
                 return pygame.font.Font(self.local_font_path, size)
@@ -25,10 +40,13 @@ class FontManager:
 
 # 전역 폰트 매니저 인스턴스
 font_manager = None
+font_manager_lock = threading.Lock()  # 여러 스레드가 처음 호출해도 인스턴스는 하나만 생성
 
 def get_font_manager():
     """폰트 매니저 싱글톤 반환"""
     global font_manager
     if font_manager is None:
-        font_manager = FontManager()
-    return font_manager 
\ No newline at end of file
+        with font_manager_lock:
+            if font_manager is None:
+                font_manager = FontManager()
+    return font_manager
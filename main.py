@@ -9,7 +9,7 @@ Snake Game - 메인 게임 파일
 4. UI 렌더링
 """
 
-import subprocess
+from startup import get_startup_timer, ensure_requirements
 import sys
 import pygame
 import random
@@ -24,59 +24,83 @@ from module import (
     WIDTH, HEIGHT, CELL_SIZE, LEADERBOARD_FILE,
     save_score, BLACK, WHITE, GREEN, ORANGE, RED, YELLOW, EVOLUTION_FORMS,
     GRAY, MAX_STAT_LEVEL, get_angle_from_direction, EMOTIONS,
+    get_snake_alpha, set_arena, plannable_ai_indices, AI_PLANNER_WORKERS, DIRTY_RECT_RENDERING, ADAPTIVE_QUALITY, CHARGE_DURATION,
     # 보스전 관련 임포트
     BossSnake, draw_boss_ui, handle_boss_collision, BOSS_PATTERNS
 )
 from font_manager import get_font_manager
+from dirty_rect import DirtyRectRenderer
+from asset_manager import get_asset_manager
+from world import update_ai_population, update_items, update_snakes
+from timer_wheel import TimerWheel, set_timer_wheel
+from arena import Arena
+from ai_planner import get_ai_planner
+from render_quality import get_quality_controller
+from profiler import profile_point
+
+# 모든 모듈 임포트가 끝난 시점 기록
+get_startup_timer().mark("imports")
 
 # 추가 색상 정의
 BLUE = (0, 0, 255)
 LIGHT_BLUE = (100, 149, 237)  # 더 부드러운 파란색
 
-def install_requirements():
+# 메뉴/일시정지 화면에서 이벤트를 기다리는 최대 시간 (밀리초)
+IDLE_WAIT_TIMEOUT = 250
+LOGO_POLL_TIMEOUT = 20  # 모드 선택 화면에서 로고 프리로드가 끝났는지 확인하는 간격 (밀리초)
+
+# UI 레이어 캐시 - 한 번 그린 정적 패널을 키별로 보관해서 재사용
+_ui_layer_cache = {}
+
+def get_ui_layer(key, builder):
     """
-    게임 실행에 필요한 패키지 설치
+    캐시된 UI 레이어 Surface를 반환하는 함수
     
-    Returns:
-        None
+    매개변수:
+        key: tuple - 레이어를 구분하는 캐시 키
+        builder: callable - 캐시에 없을 때 레이어를 생성하는 함수
+        
+    반환값:
+        pygame.Surface - 합성이 끝난 레이어
     """
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-    except subprocess.CalledProcessError as e:
-        print("패키지 설치 중 오류 발생:", e)
-        sys.exit(1)
+    layer = _ui_layer_cache.get(key)
+    if layer is None:
+        layer = builder()
+        _ui_layer_cache[key] = layer
+    return layer
 
-def draw_evolution_ui(screen, snake):
+def get_overlay(alpha):
+    """화면 전체를 덮는 반투명 검은색 오버레이 (알파값별로 한 번만 생성)"""
+    def build():
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        return overlay
+    return get_ui_layer(("overlay", alpha), build)
+
+def get_evolution_forms(snake):
+    """뱀 레벨 구간에 따라 선택 가능한 진화 형태 목록 반환"""
+    if snake.level >= 10:
+        return ["ULTIMATE"]
+    elif snake.level >= 5:
+        return ["SPEEDER", "TANK", "HUNTER"]
+    return []
+
+def build_evolution_layer(available_forms):
     """
-    진화 선택 UI를 화면에 표시하는 함수
+    진화 선택 패널 전체(테두리, 그라데이션 배경, 카드, 배지, 태그, 안내문)를 하나의 Surface로 합성
     
     매개변수:
-        screen: pygame.Surface - 게임 화면
-        snake: Snake - 진화 가능한 뱀 객체
+        available_forms: tuple - 표시할 진화 형태 목록
         
     반환값:
-        bool - UI가 활성화되어 있는지 여부
-        
-    기능:
-        - 반투명 오버레이로 배경 어둡게 처리
-        - 진화 가능한 형태 목록 표시
-        - 각 진화 형태의 능력치 정보 표시
-        - 선택 방법 안내 메시지 표시
+        pygame.Surface - 테두리를 포함한 패널 레이어 (패널 원점은 (2, 2))
     """
-    if not snake.can_evolve():
-        return False
-
     fm = get_font_manager()
-
-    # 부드러운 반투명 오버레이
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    screen.blit(overlay, (0, 0))
-
-    # 진화 메뉴 크기 및 위치 (높이 늘림)
+    
+    # 진화 메뉴 크기 (레이어 내부 좌표, 테두리 2픽셀만큼 안쪽)
     menu_width, menu_height = 700, 550
-    menu_x = (WIDTH - menu_width) // 2
-    menu_y = (HEIGHT - menu_height) // 2
+    menu_x, menu_y = 2, 2
+    layer = pygame.Surface((menu_width + 4, menu_height + 4), pygame.SRCALPHA)
     
     # 메인 패널 - 둥근 모서리와 그라데이션 효과
     panel_surface = pygame.Surface((menu_width, menu_height), pygame.SRCALPHA)
@@ -92,10 +116,8 @@ def draw_evolution_ui(screen, snake):
     draw_rounded_rect(panel_surface, (30, 30, 45, 220), (0, 0, menu_width, menu_height), 20)
     
     # 테두리 (미묘한 글로우 효과)
-    border_surface = pygame.Surface((menu_width + 4, menu_height + 4), pygame.SRCALPHA)
-    draw_rounded_rect(border_surface, (100, 150, 255, 100), (0, 0, menu_width + 4, menu_height + 4), 22)
-    screen.blit(border_surface, (menu_x - 2, menu_y - 2))
-    screen.blit(panel_surface, (menu_x, menu_y))
+    draw_rounded_rect(layer, (100, 150, 255, 100), (0, 0, menu_width + 4, menu_height + 4), 22)
+    layer.blit(panel_surface, (menu_x, menu_y))
 
     # 제목 - 한국어로 변경
     title_font = fm.get_font('title', 42, bold=True)
@@ -106,22 +128,15 @@ def draw_evolution_ui(screen, snake):
     
     # 제목 그림자 효과
     title_shadow = title_font.render(title_text, True, (0, 0, 0, 150))
-    screen.blit(title_shadow, (menu_x + (menu_width - title_shadow.get_width()) // 2 + 2, menu_y + 32))
+    layer.blit(title_shadow, (menu_x + (menu_width - title_shadow.get_width()) // 2 + 2, menu_y + 32))
     
     # 제목 메인 텍스트 (그라데이션 색상)
     title_main = title_font.render(title_text, True, (255, 255, 255))
-    screen.blit(title_main, (menu_x + (menu_width - title_main.get_width()) // 2, menu_y + 30))
+    layer.blit(title_main, (menu_x + (menu_width - title_main.get_width()) // 2, menu_y + 30))
     
     # 서브타이틀
     subtitle_main = subtitle_font.render(subtitle_text, True, (180, 180, 200))
-    screen.blit(subtitle_main, (menu_x + (menu_width - subtitle_main.get_width()) // 2, menu_y + 80))
-
-    # 진화 옵션 표시
-    available_forms = []
-    if snake.level >= 10:
-        available_forms = ["ULTIMATE"]
-    elif snake.level >= 5:
-        available_forms = ["SPEEDER", "TANK", "HUNTER"]
+    layer.blit(subtitle_main, (menu_x + (menu_width - subtitle_main.get_width()) // 2, menu_y + 80))
 
     # 옵션 카드들 (위치 조정)
     card_width = menu_width - 80
@@ -153,29 +168,29 @@ def draw_evolution_ui(screen, snake):
         stripe_surface.fill(border_color)
         card_surface.blit(stripe_surface, (2, 2))
         
-        screen.blit(card_surface, (menu_x + 40, card_y))
+        layer.blit(card_surface, (menu_x + 40, card_y))
         
         # 키 번호 (왼쪽 상단 원형 배지)
         key_radius = 15
         key_center = (menu_x + 65, card_y + 20)
-        pygame.draw.circle(screen, border_color, key_center, key_radius)
-        pygame.draw.circle(screen, (255, 255, 255), key_center, key_radius - 2)
+        pygame.draw.circle(layer, border_color, key_center, key_radius)
+        pygame.draw.circle(layer, (255, 255, 255), key_center, key_radius - 2)
         
         key_text = key_font.render(str(i + 1), True, base_color)
         key_rect = key_text.get_rect(center=key_center)
-        screen.blit(key_text, key_rect)
+        layer.blit(key_text, key_rect)
         
         # 진화 형태 이름
         name_x = menu_x + 95
         name_y = card_y + 12  # 위치 조정
         
         name_text = name_font.render(form, True, (255, 255, 255))
-        screen.blit(name_text, (name_x, name_y))
+        layer.blit(name_text, (name_x, name_y))
         
         # 설명 텍스트
         desc_text = form_data["description"]
         desc_render = desc_font.render(desc_text, True, (200, 200, 220))
-        screen.blit(desc_render, (name_x, name_y + 26))  # 위치 조정
+        layer.blit(desc_render, (name_x, name_y + 26))  # 위치 조정
         
         # 능력 목록 (작은 태그 형태)
         abilities_y = name_y + 48  # 위치 조정
@@ -190,11 +205,11 @@ def draw_evolution_ui(screen, snake):
             # 태그 배경
             tag_surface = pygame.Surface((tag_width, tag_height), pygame.SRCALPHA)
             draw_rounded_rect(tag_surface, (base_color[0], base_color[1], base_color[2], 120), (0, 0, tag_width, tag_height), 9)
-            screen.blit(tag_surface, (tag_x, abilities_y))
+            layer.blit(tag_surface, (tag_x, abilities_y))
             
             # 태그 텍스트
             text_rect = ability_text.get_rect(center=(tag_x + tag_width // 2, abilities_y + tag_height // 2))
-            screen.blit(ability_text, text_rect)
+            layer.blit(ability_text, text_rect)
             
             tag_x += tag_width + 8  # 다음 태그 위치
             
@@ -206,7 +221,7 @@ def draw_evolution_ui(screen, snake):
     guide_y = menu_y + menu_height - 70  # 위치 조정
     guide_surface = pygame.Surface((menu_width - 40, 55), pygame.SRCALPHA)  # 크기 조정
     draw_rounded_rect(guide_surface, (0, 0, 0, 100), (0, 0, menu_width - 40, 55), 15)
-    screen.blit(guide_surface, (menu_x + 20, guide_y))
+    layer.blit(guide_surface, (menu_x + 20, guide_y))
     
     # 안내 텍스트들 - 한국어로 변경
     guide_font = fm.get_font('small', 18)
@@ -224,7 +239,44 @@ def draw_evolution_ui(screen, snake):
         guide_text = guide_font.render(line, True, text_color)
         text_x = menu_x + (menu_width - guide_text.get_width()) // 2
         text_y = guide_y + 10 + i * 20  # 간격 조정
-        screen.blit(guide_text, (text_x, text_y))
+        layer.blit(guide_text, (text_x, text_y))
+
+    return layer
+
+def draw_evolution_ui(screen, snake):
+    """
+    진화 선택 UI를 화면에 표시하는 함수
+    
+    매개변수:
+        screen: pygame.Surface - 게임 화면
+        snake: Snake - 진화 가능한 뱀 객체
+        
+    반환값:
+        bool - UI가 활성화되어 있는지 여부
+        
+    기능:
+        - 반투명 오버레이로 배경 어둡게 처리
+        - 진화 가능한 형태 목록 표시
+        - 각 진화 형태의 능력치 정보 표시
+        - 선택 방법 안내 메시지 표시
+        - 패널은 (레벨 구간, 진화 옵션)별로 한 번만 합성하고 캐시에서 재사용
+    """
+    if not snake.can_evolve():
+        return False
+
+    # 부드러운 반투명 오버레이
+    screen.blit(get_overlay(160), (0, 0))
+
+    # 진화 메뉴 위치
+    menu_width, menu_height = 700, 550
+    menu_x = (WIDTH - menu_width) // 2
+    menu_y = (HEIGHT - menu_height) // 2
+    
+    available_forms = tuple(get_evolution_forms(snake))
+    level_bracket = 10 if snake.level >= 10 else 5
+    layer = get_ui_layer(("evolution", level_bracket, available_forms),
+                         lambda: build_evolution_layer(available_forms))
+    screen.blit(layer, (menu_x - 2, menu_y - 2))
 
     return True
 
@@ -267,22 +319,77 @@ def draw_status_ui(screen, snake):
     draw_rounded_rect(screen, (50, 50, 50), bar_bg_rect, 3)
     draw_rounded_rect(screen, (0, 255, 0), bar_fill_rect, 3)
 
+def wait_for_events(timeout=IDLE_WAIT_TIMEOUT):
+    """
+    이벤트가 올 때까지 CPU를 점유하지 않고 대기하는 함수
+    
+    매개변수:
+        timeout: int - 최대 대기 시간 (밀리초)
+        
+    반환값:
+        list - 대기 중 도착한 이벤트 목록 (타임아웃이면 빈 목록)
+    """
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+def load_logo():
+    """
+    logo.png를 화면 크기에 맞게 축소한 Surface 반환 (원본은 에셋 매니저가 한 번만 디코딩)
+    
+    반환값:
+        pygame.Surface 또는 None - 로고 파일이 없거나 읽을 수 없으면 None
+    """
+    logo_image = get_asset_manager().get_image("logo")
+    if logo_image is None:
+        return None
+    
+    # 로고 크기 조정 (원본 크기가 너무 클 경우를 대비)
+    logo_rect = logo_image.get_rect()
+    max_width = WIDTH // 2  # 화면 너비의 절반으로 제한
+    max_height = HEIGHT // 4  # 화면 높이의 1/4로 제한
+    
+    # 비율을 유지하면서 크기 조정
+    if logo_rect.width > max_width or logo_rect.height > max_height:
+        scale_x = max_width / logo_rect.width
+        scale_y = max_height / logo_rect.height
+        scale = min(scale_x, scale_y)  # 더 작은 스케일 사용하여 비율 유지
+        
+        new_width = int(logo_rect.width * scale)
+        new_height = int(logo_rect.height * scale)
+        logo_image = pygame.transform.scale(logo_image, (new_width, new_height))
+    return logo_image
+
 def mode_select_screen():
     """
     게임 모드 선택 화면 표시
+    입력이나 마우스 호버 변경이 있을 때만 다시 그리고, 그 외에는 이벤트를 기다리며 대기
     
     Returns:
         str: 선택된 게임 모드 ("CLASSIC", "EVOLUTION", "BOSS")
     """
-    pygame.init()
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Snake Game - Mode Selection")
-    clock = pygame.time.Clock()
-    
-    fm = get_font_manager()
-    title_font = fm.get_font('title', 48, bold=True)
-    button_font = fm.get_font('button', 24)
-    desc_font = fm.get_font('small', 18)
+    timer = get_startup_timer()
+    with timer.phase("pygame.init"):
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Snake Game - Mode Selection")
+    
+    # 모드 선택 화면이 떠 있는 동안 사운드/이미지를 백그라운드에서 미리 로드 (첫 프레임은 기다리지 않음)
+    assets = get_asset_manager()
+    first_load = assets.preload()
+    
+    # 폰트는 텍스트 렌더링과 같은 메인 스레드에서 게임에 쓰는 것을 모두 미리 만듦
+    with timer.phase("font load"):
+        assets.load_fonts()
+        fm = get_font_manager()
+        title_font = fm.get_font('title', 48, bold=True)
+        button_font = fm.get_font('button', 24)
+        desc_font = fm.get_font('small', 18)
+    
+    # 로고는 프리로드가 끝나면 크기를 맞춰서 표시 (그 전에는 제목 텍스트로 대신함)
+    logo_image = None
+    logo_pending = True
     
     # 버튼 정보
     modes = [
@@ -300,11 +407,17 @@ def mode_select_screen():
     total_height = len(modes) * button_height + (len(modes) - 1) * button_margin
     start_y = (HEIGHT - total_height) // 2 + 50
     button_x = (WIDTH - button_width) // 2
+    button_rects = [pygame.Rect(button_x, start_y + i * (button_height + button_margin), button_width, button_height)
+                    for i in range(len(modes))]
+    
+    # 마지막으로 그린 상태 (선택 인덱스, 호버 인덱스) - 바뀔 때만 다시 그림
+    drawn_state = None
+    events = []
     
     while True:
         mouse_pos = pygame.mouse.get_pos()
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -328,114 +441,108 @@ def mode_select_screen():
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # 왼쪽 클릭
                     for i, mode in enumerate(modes):
-                        button_y = start_y + i * (button_height + button_margin)
-                        button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-                        if button_rect.collidepoint(mouse_pos):
+                        if button_rects[i].collidepoint(mouse_pos):
                             return mode["mode"]
             elif event.type == pygame.MOUSEMOTION:
                 # 마우스가 버튼 위에 있으면 선택 상태 변경
-                for i, mode in enumerate(modes):
-                    button_y = start_y + i * (button_height + button_margin)
-                    button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-                    if button_rect.collidepoint(mouse_pos):
+                for i in range(len(modes)):
+                    if button_rects[i].collidepoint(mouse_pos):
                         selected_index = i
                         break
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                drawn_state = None  # 창이 다시 보이면 강제로 다시 그림
         
-        # 화면 그리기
-        screen.fill(BLACK)
-        
-        # 로고 이미지 표시
-        try:
-            logo_image = pygame.image.load("logo.png")
-            # 로고 크기 조정 (원본 크기가 너무 클 경우를 대비)
-            logo_rect = logo_image.get_rect()
-            max_width = WIDTH // 2  # 화면 너비의 절반으로 제한
-            max_height = HEIGHT // 4  # 화면 높이의 1/4로 제한
-            
-            # 비율을 유지하면서 크기 조정
-            if logo_rect.width > max_width or logo_rect.height > max_height:
-                scale_x = max_width / logo_rect.width
-                scale_y = max_height / logo_rect.height
-                scale = min(scale_x, scale_y)  # 더 작은 스케일 사용하여 비율 유지
-                
-                new_width = int(logo_rect.width * scale)
-                new_height = int(logo_rect.height * scale)
-                logo_image = pygame.transform.scale(logo_image, (new_width, new_height))
-            
-            # 로고를 화면 중앙 상단에 배치
-            logo_rect = logo_image.get_rect(center=(WIDTH//2, HEIGHT//4))
-            screen.blit(logo_image, logo_rect)
-            
-        except (pygame.error, FileNotFoundError):
-            # 로고 파일이 없거나 로드할 수 없는 경우 기본 텍스트 표시
-            title = title_font.render("뱀 게임", True, WHITE)
-            title_rect = title.get_rect(center=(WIDTH//2, HEIGHT//4))
-            screen.blit(title, title_rect)
+        if logo_pending and not assets.is_preloading():
+            logo_pending = False
+            logo_image = load_logo()
+            drawn_state = None
+            if first_load:
+                assets.report()
         
-        # 버튼들 그리기
-        for i, mode in enumerate(modes):
-            button_y = start_y + i * (button_height + button_margin)
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+        hovered_index = pygame.Rect(mouse_pos, (1, 1)).collidelist(button_rects)
+        if (selected_index, hovered_index) != drawn_state:
+            drawn_state = (selected_index, hovered_index)
             
-            # 선택된 버튼인지 확인
-            is_selected = (i == selected_index)
-            is_hovered = button_rect.collidepoint(mouse_pos)
+            # 화면 그리기
+            screen.fill(BLACK)
             
-            # 버튼 색상 결정
-            if is_selected:
-                button_color = (80, 120, 200)  # 파란색
-                border_color = (120, 160, 255)  # 밝은 파란색
-                text_color = WHITE
-            elif is_hovered:
-                button_color = (60, 60, 60)  # 어두운 회색
-                border_color = (100, 100, 100)  # 회색
-                text_color = WHITE
+            # 로고 이미지 표시
+            if logo_image is not None:
+                # 로고를 화면 중앙 상단에 배치
+                logo_rect = logo_image.get_rect(center=(WIDTH//2, HEIGHT//4))
+                screen.blit(logo_image, logo_rect)
             else:
-                button_color = (40, 40, 40)  # 매우 어두운 회색
-                border_color = (70, 70, 70)  # 회색
-                text_color = GRAY
+                # 로고 파일이 없거나 로드할 수 없는 경우 기본 텍스트 표시
+                title = title_font.render("뱀 게임", True, WHITE)
+                title_rect = title.get_rect(center=(WIDTH//2, HEIGHT//4))
+                screen.blit(title, title_rect)
             
-            # 버튼 배경 (테두리 포함)
-            draw_rounded_rect(screen, border_color, button_rect, 12)
-            # 버튼 내부 (테두리를 위해 2픽셀 작게)
-            inner_rect = (button_rect.x + 2, button_rect.y + 2, button_rect.width - 4, button_rect.height - 4)
-            draw_rounded_rect(screen, button_color, inner_rect, 10)
-            
-            # 버튼 텍스트
-            mode_text = button_font.render(mode["name"], True, text_color)
-            desc_text = desc_font.render(mode["desc"], True, text_color)
+            # 버튼들 그리기
+            for i, mode in enumerate(modes):
+                button_rect = button_rects[i]
+                
+                # 선택된 버튼인지 확인
+                is_selected = (i == selected_index)
+                is_hovered = (i == hovered_index)
+                
+                # 버튼 색상 결정
+                if is_selected:
+                    button_color = (80, 120, 200)  # 파란색
+                    border_color = (120, 160, 255)  # 밝은 파란색
+                    text_color = WHITE
+                elif is_hovered:
+                    button_color = (60, 60, 60)  # 어두운 회색
+                    border_color = (100, 100, 100)  # 회색
+                    text_color = WHITE
+                else:
+                    button_color = (40, 40, 40)  # 매우 어두운 회색
+                    border_color = (70, 70, 70)  # 회색
+                    text_color = GRAY
+                
+                # 버튼 배경 (테두리 포함)
+                draw_rounded_rect(screen, border_color, button_rect, 12)
+                # 버튼 내부 (테두리를 위해 2픽셀 작게)
+                inner_rect = (button_rect.x + 2, button_rect.y + 2, button_rect.width - 4, button_rect.height - 4)
+                draw_rounded_rect(screen, button_color, inner_rect, 10)
+                
+                # 버튼 텍스트
+                mode_text = button_font.render(mode["name"], True, text_color)
+                desc_text = desc_font.render(mode["desc"], True, text_color)
+                
+                # 텍스트 중앙 정렬
+                mode_rect = mode_text.get_rect(center=(button_rect.centerx, button_rect.centery - 12))
+                desc_rect = desc_text.get_rect(center=(button_rect.centerx, button_rect.centery + 12))
+                
+                screen.blit(mode_text, mode_rect)
+                screen.blit(desc_text, desc_rect)
+                
+                # 선택된 버튼에 화살표 표시
+                if is_selected:
+                    arrow_font = fm.get_font('button', 24)
+                    left_arrow = arrow_font.render("▶", True, WHITE)
+                    right_arrow = arrow_font.render("◀", True, WHITE)
+                    screen.blit(left_arrow, (button_x - 30, button_rect.centery - 12))
+                    screen.blit(right_arrow, (button_x + button_width + 10, button_rect.centery - 12))
             
-            # 텍스트 중앙 정렬
-            mode_rect = mode_text.get_rect(center=(button_rect.centerx, button_rect.centery - 12))
-            desc_rect = desc_text.get_rect(center=(button_rect.centerx, button_rect.centery + 12))
+            # 조작 안내
+            help_y = HEIGHT - 100
+            help_texts = [
+                "↑↓ 키: 선택",
+                "Enter: 확인",
+                "마우스: 클릭하여 선택",
+                "ESC: 게임 종료"
+            ]
             
-            screen.blit(mode_text, mode_rect)
-            screen.blit(desc_text, desc_rect)
+            for i, help_text in enumerate(help_texts):
+                help_surface = desc_font.render(help_text, True, GRAY)
+                help_rect = help_surface.get_rect(center=(WIDTH//2, help_y + i * 20))
+                screen.blit(help_surface, help_rect)
             
-            # 선택된 버튼에 화살표 표시
-            if is_selected:
-                arrow_font = fm.get_font('button', 24)
-                left_arrow = arrow_font.render("▶", True, WHITE)
-                right_arrow = arrow_font.render("◀", True, WHITE)
-                screen.blit(left_arrow, (button_x - 30, button_rect.centery - 12))
-                screen.blit(right_arrow, (button_x + button_width + 10, button_rect.centery - 12))
-        
-        # 조작 안내
-        help_y = HEIGHT - 100
-        help_texts = [
-            "↑↓ 키: 선택",
-            "Enter: 확인",
-            "마우스: 클릭하여 선택",
-            "ESC: 게임 종료"
-        ]
-        
-        for i, help_text in enumerate(help_texts):
-            help_surface = desc_font.render(help_text, True, GRAY)
-            help_rect = help_surface.get_rect(center=(WIDTH//2, help_y + i * 20))
-            screen.blit(help_surface, help_rect)
+            pygame.display.flip()
+            timer.first_frame()
         
-        pygame.display.flip()
-        clock.tick(60)
+        # 다음 입력이 올 때까지 대기 (유휴 상태에서 CPU 점유 방지, 로고를 기다리는 동안은 짧게)
+        events = wait_for_events(LOGO_POLL_TIMEOUT if logo_pending else IDLE_WAIT_TIMEOUT)
 
 def handle_evolution(screen, player, event):
     """진화 선택을 처리하는 함수"""
@@ -484,6 +591,13 @@ def game_loop(game_mode):
     pygame.display.set_caption(caption[game_mode])
     clock = pygame.time.Clock()
 
+    # 이 판의 뱀이 사용할 타이머 휠
+    timers = TimerWheel()
+    set_timer_wheel(timers)
+    # 이 판의 뱀 몸통/음식/투사체 점유 격자 (AI 계획 워커를 쓰면 공유 메모리 위에 둠)
+    planner = get_ai_planner(AI_PLANNER_WORKERS) if AI_PLANNER_WORKERS else None
+    set_arena(planner.new_arena() if planner is not None else Arena(WIDTH, HEIGHT, CELL_SIZE))
+
     # 게임 객체 초기화
     if game_mode == "BOSS":
         player = Snake(WIDTH//4, HEIGHT//2, color=GREEN, name="YOU", is_ai=False)
@@ -518,10 +632,22 @@ def game_loop(game_mode):
     evolution_ui_active = False
     evolution_ui_just_activated = False
     running = True
+    
+    # 더티 렉트 렌더링 모드 (변경된 영역만 다시 그림)
+    renderer = DirtyRectRenderer(screen, game_mode) if DIRTY_RECT_RENDERING else None
+
+    # 적응형 렌더링 품질 (시뮬레이션은 매 틱 진행하고 그리기만 줄임)
+    quality = get_quality_controller()
+    quality.enabled = ADAPTIVE_QUALITY
+    quality.reset()
 
     # 메인 게임 루프
     while running:
-        screen.fill(BLACK)
+        quality.begin_frame()
+        # 진화 UI는 입력을 받아야 하므로 프레임 건너뛰기 중에도 항상 그림
+        render = quality.render_frame() or player.can_evolve()
+        if renderer is None and render:
+            screen.fill(BLACK)
         tick += 1
         
         # 타이머 업데이트
@@ -574,7 +700,9 @@ def game_loop(game_mode):
                     running = False
                     break
 
-            # 모든 뱀 업데이트
+            # 모든 뱀 업데이트 (AI 계획 워커가 마감 안에 정한 방향을 먼저 받아 둠)
+            if planner is not None:
+                planner.plan(snakes, plannable_ai_indices(snakes), tick)
             update_snakes(snakes, food_list, tick, game_mode)
 
             # 충돌 처리
@@ -584,20 +712,35 @@ def game_loop(game_mode):
             if len(food_list) < 10:
                 spawn_food(food_list, snakes)
 
-        # 화면 그리기
-        draw_game_objects(screen, food_list, snakes, game_mode)
+            # 효과/쿨다운 만료 처리 (진화 UI가 떠 있는 동안은 멈춤)
+            timers.advance()
+
+        # 화면 그리기 (건너뛰는 프레임은 메시지 표시 시간만 줄임)
+        if not render:
+            for snake in snakes:
+                if snake.message:
+                    snake.update_message()
+        elif renderer is not None:
+            projectiles = boss.projectiles if game_mode == "BOSS" else ()
+            renderer.draw_world(food_list, snakes, projectiles)
+        else:
+            draw_game_objects(screen, food_list, snakes, game_mode)
         
         # UI 그리기
-        draw_game_ui(screen, player, snakes, game_mode, food_list)
+        if render:
+            draw_game_ui(screen, player, snakes, game_mode, food_list)
         
         # 보스 UI 그리기 (보스 모드)
-        if game_mode == "BOSS":
+        if render and game_mode == "BOSS":
             draw_boss_ui(screen, boss, player)
         
         # 진화 UI 처리 (진화 모드와 보스 모드)
-        if game_mode in ["EVOLUTION", "BOSS"]:
+        if render and game_mode in ["EVOLUTION", "BOSS"]:
             evolution_ui_active, evolution_ui_just_activated = handle_evolution_ui(
                 screen, player, evolution_ui_active, evolution_ui_just_activated)
+            # 진화 UI 오버레이는 화면 전체를 덮으므로 전체 갱신
+            if evolution_ui_active and renderer is not None:
+                renderer.invalidate()
 
         # 이벤트 처리
         for event in pygame.event.get():
@@ -607,6 +750,9 @@ def game_loop(game_mode):
                 if event.key == pygame.K_ESCAPE and not evolution_ui_active:
                     # 일시정지 화면 표시
                     pause_action = draw_pause_screen(screen)
+                    quality.discard_frame()
+                    if renderer is not None:
+                        renderer.invalidate()
                     if pause_action == "restart":
                         return "restart"
                     elif pause_action == "quit":
@@ -617,11 +763,16 @@ def game_loop(game_mode):
                         if player.energy >= 30:
                             player.energy -= 30
                             player.is_charging = True
-                            player.charge_timer = 15  # 1초간 돌진
+                            player.charge_timer = CHARGE_DURATION
                             player.collision_immune = True  # 5초 무적 시작
                             player.invincible_time = 75
                 else:
                     evolution_ui_active = handle_keydown(event, game_mode, player, evolution_ui_active, screen)
+                    # 스탯 창이 화면에 그려졌으면 다음 프레임은 전체 다시 그리기
+                    if event.key == pygame.K_TAB:
+                        quality.discard_frame()
+                        if renderer is not None:
+                            renderer.invalidate()
 
         # 게임 오버 체크
         if not player.alive:
@@ -635,86 +786,18 @@ def game_loop(game_mode):
                 return "mode_select"
             running = False
 
-        # 돌진 모드 타이머 관리 (BOSS 모드에서만)
-        if game_mode == "BOSS" and hasattr(player, 'is_charging') and player.is_charging:
-            player.charge_timer -= 1
-            if player.charge_timer <= 0:
-                player.is_charging = False
-
-        pygame.display.flip()
+        if render:
+            if renderer is not None:
+                renderer.present()
+            else:
+                pygame.display.flip()
+            # 입력 대기 없이 끝난 프레임의 처리 시간으로 품질 단계 조절
+            quality.end_frame()
+        else:
+            # 4단계에서 건너뛴 프레임은 그리기 비용이 없으므로 기록하지 않음
+            quality.discard_frame()
         clock.tick(15)
 
-def update_ai_population(snakes, ai_check_timer, ai_timer):
-    """
-    AI 뱀 개체 수를 관리하는 함수
-    
-    매개변수:
-        snakes: list - 게임 내 모든 뱀 목록
-        ai_check_timer: int - AI 체크 타이머
-        ai_timer: int - AI 생성 타이머
-        
-    기능:
-        - 현재 AI 뱀 개체 수 확인
-        - 필요한 경우 새로운 AI 뱀 생성
-        - 최소 AI 개체 수 유지
-    """
-    current_ai_count = sum(1 for s in snakes if s.is_ai and s.alive)
-    
-    if ai_check_timer >= 150:
-        if current_ai_count < 7:
-            spawn_ai_snake(snakes)
-        ai_check_timer = 0
-    
-    if current_ai_count < 3:
-        spawn_ai_snake(snakes)
-        ai_timer = 0
-        ai_check_timer = 0
-
-def update_items(food_list, snakes, item_timer, special_item_timer):
-    """
-    아이템 생성을 관리하는 함수
-    
-    매개변수:
-        food_list: list - 게임 내 모든 음식/아이템 목록
-        snakes: list - 게임 내 모든 뱀 목록
-        item_timer: int - 일반 아이템 생성 타이머
-        special_item_timer: int - 특수 아이템 생성 타이머
-    """
-    # 일반 아이템과 특수 아이템 개수 확인
-    normal_item_count = sum(1 for food in food_list if food.is_item and not isinstance(food, SpecialItem))
-    special_item_count = sum(1 for food in food_list if isinstance(food, SpecialItem))
-    
-    # 일반 아이템 생성 (최대 3개)
-    if item_timer >= 225:  # 15초 (15fps * 15)
-        if normal_item_count < 3:
-            spawn_food(food_list, snakes, is_item=True)
-        item_timer = 0
-        
-    # 특수 아이템 생성 (최대 3개)
-    if special_item_timer >= 225:  # 15초
-        if special_item_count < 3:
-            spawn_special_item(food_list, snakes)
-        special_item_timer = 0
-
-def update_snakes(snakes, food_list, tick, game_mode):
-    """
-    모든 뱀의 상태를 업데이트하는 함수
-    
-    매개변수:
-        snakes: list - 게임 내 모든 뱀 목록
-        food_list: list - 게임 내 모든 음식/아이템 목록
-        tick: int - 현재 게임 틱
-        game_mode: str - 현재 게임 모드
-        
-    기능:
-        - 각 뱀의 효과 상태 업데이트
-        - 각 뱀의 이동 처리
-    """
-    for snake in snakes:
-        if snake.alive:
-            snake.update_effects()
-            snake.move(food_list, snakes, tick)
-
 def draw_game_objects(screen, food_list, snakes, game_mode):
     """
     게임 오브젝트를 화면에 렌더링하는 함수
@@ -745,24 +828,19 @@ def draw_game_objects(screen, food_list, snakes, game_mode):
     for snake in snakes:
         draw_snake(screen, snake)
 
+@profile_point("render.snake")
 def draw_snake(screen, snake):
     """뱀 그리기"""
     if not snake.alive:
         return
         
-    # 깜빡이는 효과는 Tank의 일회용 면역이 활성화되었을 때만 적용
-    if snake.evolution_form == "TANK" and snake.tank_immunity_active:
-        if pygame.time.get_ticks() % 200 < 100:  # 깜빡이는 효과
-            alpha = 128
-        else:
-            alpha = 255
-    # 다른 무적 상태에서는 반투명 효과만 적용
-    elif snake.collision_immune:
-        alpha = 180
-    else:
-        alpha = 255
+    alpha = get_snake_alpha(snake)
     
-    # 뱀 그리기
+    # 뱀 그리기 (불투명하면 Surface 없이 바로 채움)
+    if alpha >= 255:
+        for segment in snake.body:
+            screen.fill(snake.color, (segment[0], segment[1], CELL_SIZE, CELL_SIZE))
+        return
     for segment in snake.body:
         s = pygame.Surface((CELL_SIZE, CELL_SIZE))
         s.fill(snake.color)
@@ -1010,7 +1088,7 @@ def handle_keydown(event, game_mode, player, evolution_ui_active, screen):
             pygame.display.flip()
             waiting_for_close = True
             while waiting_for_close:
-                for e in pygame.event.get():
+                for e in wait_for_events():
                     if e.type == pygame.KEYDOWN:
                         if e.key == pygame.K_ESCAPE:
                             waiting_for_close = False
@@ -1024,26 +1102,25 @@ def handle_keydown(event, game_mode, player, evolution_ui_active, screen):
                         sys.exit()
         return evolution_ui_active
 
-def handle_game_over(screen, player, game_mode):
+def get_game_over_buttons():
+    """게임 오버 화면 버튼 영역 반환 (재시작, 모드 선택, 끝내기)"""
+    button_width, button_height = 180, 50
+    button_margin = 20
+    buttons_y = HEIGHT//3 + 200
+    total_buttons_width = button_width * 3 + button_margin * 2
+    start_x = WIDTH//2 - total_buttons_width//2
+    return [pygame.Rect(start_x + (button_width + button_margin) * i, buttons_y, button_width, button_height)
+            for i in range(3)]
+
+def build_game_over_layer():
     """
-    게임 오버 상태를 처리하는 함수
-    
-    매개변수:
-        screen: pygame.Surface - 게임 화면
-        player: Snake - 플레이어 객체
-        game_mode: str - 현재 게임 모드
+    게임 오버 화면의 정적인 부분(오버레이, 제목, 버튼, 단축키 안내)을 하나의 Surface로 합성
     
     반환값:
-        str: 다음 행동 ("restart", "mode_select", "quit", None)
+        pygame.Surface - 화면 크기의 레이어
     """
-    # 보스 모드가 아닐 때만 점수 저장
-    if game_mode != "BOSS":
-        save_score(player.name, player.score)
-    
-    # 반투명 오버레이
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
+    layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    layer.fill((0, 0, 0, 180))
     
     # 폰트 매니저 사용
     fm = get_font_manager()
@@ -1051,45 +1128,21 @@ def handle_game_over(screen, player, game_mode):
     font = fm.get_font('button', 36)
     
     game_over_text = font_large.render("GAME OVER", True, RED)
-    screen.blit(game_over_text, (WIDTH//2 - game_over_text.get_width()//2, HEIGHT//3))
-    
-    # 점수 표시
-    score_text = font.render(f"점수: {player.score}", True, WHITE)
-    screen.blit(score_text, (WIDTH//2 - score_text.get_width()//2, HEIGHT//3 + 100))
-    
-    # 버튼 설정
-    button_width, button_height = 180, 50
-    button_margin = 20
-    buttons_y = HEIGHT//3 + 200
-    total_buttons_width = button_width * 3 + button_margin * 2
-    start_x = WIDTH//2 - total_buttons_width//2
+    layer.blit(game_over_text, (WIDTH//2 - game_over_text.get_width()//2, HEIGHT//3))
     
-    # 재시작 버튼
-    restart_button = pygame.Rect(start_x, buttons_y, button_width, button_height)
-    draw_rounded_rect(screen, WHITE, restart_button, 8)
-    inner_rect = (restart_button.x + 2, restart_button.y + 2, restart_button.width - 4, restart_button.height - 4)
-    draw_rounded_rect(screen, GREEN, inner_rect, 6)
-    restart_text = font.render("재시작", True, BLACK)
-    restart_rect = restart_text.get_rect(center=restart_button.center)
-    screen.blit(restart_text, restart_rect)
-    
-    # 모드 선택 버튼
-    mode_button = pygame.Rect(start_x + button_width + button_margin, buttons_y, button_width, button_height)
-    draw_rounded_rect(screen, WHITE, mode_button, 8)
-    inner_rect = (mode_button.x + 2, mode_button.y + 2, mode_button.width - 4, mode_button.height - 4)
-    draw_rounded_rect(screen, LIGHT_BLUE, inner_rect, 6)
-    mode_text = font.render("모드 선택", True, BLACK)
-    mode_rect = mode_text.get_rect(center=mode_button.center)
-    screen.blit(mode_text, mode_rect)
-    
-    # 끝내기 버튼
-    quit_button = pygame.Rect(start_x + (button_width + button_margin) * 2, buttons_y, button_width, button_height)
-    draw_rounded_rect(screen, WHITE, quit_button, 8)
-    inner_rect = (quit_button.x + 2, quit_button.y + 2, quit_button.width - 4, quit_button.height - 4)
-    draw_rounded_rect(screen, RED, inner_rect, 6)
-    quit_text = font.render("끝내기", True, WHITE)
-    quit_rect = quit_text.get_rect(center=quit_button.center)
-    screen.blit(quit_text, quit_rect)
+    # 버튼 (재시작, 모드 선택, 끝내기)
+    buttons = [
+        ("재시작", GREEN, BLACK),
+        ("모드 선택", LIGHT_BLUE, BLACK),
+        ("끝내기", RED, WHITE)
+    ]
+    button_rects = get_game_over_buttons()
+    for button_rect, (label, fill_color, text_color) in zip(button_rects, buttons):
+        draw_rounded_rect(layer, WHITE, button_rect, 8)
+        inner_rect = (button_rect.x + 2, button_rect.y + 2, button_rect.width - 4, button_rect.height - 4)
+        draw_rounded_rect(layer, fill_color, inner_rect, 6)
+        label_text = font.render(label, True, text_color)
+        layer.blit(label_text, label_text.get_rect(center=button_rect.center))
     
     # 단축키 안내
     shortcut_font = fm.get_font('small', 20)
@@ -1099,18 +1152,46 @@ def handle_game_over(screen, player, game_mode):
         ("ESC: 끝내기", RED)
     ]
     
-    shortcut_y = buttons_y + button_height + 30
-    for i, (text, color) in enumerate(shortcuts):
+    shortcut_y = button_rects[0].bottom + 30
+    for button_rect, (text, color) in zip(button_rects, shortcuts):
         shortcut_text = shortcut_font.render(text, True, color)
-        x = start_x + (button_width + button_margin) * i + button_width//2 - shortcut_text.get_width()//2
-        screen.blit(shortcut_text, (x, shortcut_y))
+        x = button_rect.centerx - shortcut_text.get_width()//2
+        layer.blit(shortcut_text, (x, shortcut_y))
+    
+    return layer
+
+def handle_game_over(screen, player, game_mode):
+    """
+    게임 오버 상태를 처리하는 함수
+    
+    매개변수:
+        screen: pygame.Surface - 게임 화면
+        player: Snake - 플레이어 객체
+        game_mode: str - 현재 게임 모드
+    
+    반환값:
+        str: 다음 행동 ("restart", "mode_select", "quit", None)
+    """
+    # 보스 모드가 아닐 때만 점수 저장
+    if game_mode != "BOSS":
+        save_score(player.name, player.score, game_mode)
+    
+    # 정적인 부분은 캐시된 레이어 사용
+    screen.blit(get_ui_layer(("game_over",), build_game_over_layer), (0, 0))
+    
+    # 점수 표시 (동적인 부분만 매번 렌더링)
+    font = get_font_manager().get_font('button', 36)
+    score_text = font.render(f"점수: {player.score}", True, WHITE)
+    screen.blit(score_text, (WIDTH//2 - score_text.get_width()//2, HEIGHT//3 + 100))
     
     pygame.display.flip()
     
+    restart_button, mode_button, quit_button = get_game_over_buttons()
+    
     # 버튼 클릭 처리
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in wait_for_events():
             if event.type == pygame.QUIT:
                 return "quit"
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1170,85 +1251,84 @@ def draw_boss_ui(screen, boss, player):
         pygame.draw.rect(screen, projectile.color, 
                         (projectile.x, projectile.y, projectile.size, projectile.size))
 
-def draw_pause_screen(screen):
+def get_pause_buttons():
+    """일시정지 화면 버튼 영역 반환 (계속하기, 다시하기, 시작화면으로 이동)"""
+    button_width, button_height = 200, 60
+    button_margin = 20
+    total_width = button_width * 3 + button_margin * 2
+    start_x = (WIDTH - total_width) // 2
+    buttons_y = HEIGHT//2 + 50
+    return [pygame.Rect(start_x + (button_width + button_margin) * i, buttons_y, button_width, button_height)
+            for i in range(3)]
+
+def build_pause_layer():
     """
-    일시정지 화면을 그리는 함수
+    일시정지 화면(오버레이, 제목, 버튼, 단축키 안내)을 하나의 Surface로 합성
     
-    매개변수:
-        screen: pygame.Surface - 게임 화면
-        
     반환값:
-        str: 사용자 선택 ("resume", "restart", "quit", None)
+        pygame.Surface - 화면 크기의 레이어
     """
     fm = get_font_manager()
     
     # 반투명 오버레이
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
+    layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    layer.fill((0, 0, 0, 180))
     
     # 제목
     title_font = fm.get_font('title', 48, bold=True)
     pause_text = title_font.render("일시정지", True, WHITE)
     title_rect = pause_text.get_rect(center=(WIDTH//2, HEIGHT//3))
-    screen.blit(pause_text, title_rect)
+    layer.blit(pause_text, title_rect)
     
-    # 버튼 설정
+    # 버튼 (계속하기, 다시하기, 시작화면으로 이동)
     button_font = fm.get_font('button', 24)
-    button_width, button_height = 200, 60
-    button_margin = 20
-    
-    # 버튼 위치 계산
-    total_width = button_width * 3 + button_margin * 2
-    start_x = (WIDTH - total_width) // 2
-    buttons_y = HEIGHT//2 + 50
-    
-    # 계속하기 버튼
-    resume_button = pygame.Rect(start_x, buttons_y, button_width, button_height)
-    draw_rounded_rect(screen, WHITE, resume_button, 8)
-    inner_rect = (resume_button.x + 2, resume_button.y + 2, resume_button.width - 4, resume_button.height - 4)
-    draw_rounded_rect(screen, GREEN, inner_rect, 6)
-    resume_text = button_font.render("계속하기", True, BLACK)
-    resume_rect = resume_text.get_rect(center=resume_button.center)
-    screen.blit(resume_text, resume_rect)
-    
-    # 다시하기 버튼
-    restart_button = pygame.Rect(start_x + button_width + button_margin, buttons_y, button_width, button_height)
-    draw_rounded_rect(screen, WHITE, restart_button, 8)
-    inner_rect = (restart_button.x + 2, restart_button.y + 2, restart_button.width - 4, restart_button.height - 4)
-    draw_rounded_rect(screen, LIGHT_BLUE, inner_rect, 6)
-    restart_text = button_font.render("다시하기", True, BLACK)
-    restart_rect = restart_text.get_rect(center=restart_button.center)
-    screen.blit(restart_text, restart_rect)
-    
-    # 시작화면으로 이동 버튼
-    quit_button = pygame.Rect(start_x + (button_width + button_margin) * 2, buttons_y, button_width, button_height)
-    draw_rounded_rect(screen, WHITE, quit_button, 8)
-    inner_rect = (quit_button.x + 2, quit_button.y + 2, quit_button.width - 4, quit_button.height - 4)
-    draw_rounded_rect(screen, RED, inner_rect, 6)
-    quit_text = button_font.render("시작화면으로 이동", True, WHITE)
-    quit_rect = quit_text.get_rect(center=quit_button.center)
-    screen.blit(quit_text, quit_rect)
+    buttons = [
+        ("계속하기", GREEN, BLACK),
+        ("다시하기", LIGHT_BLUE, BLACK),
+        ("시작화면으로 이동", RED, WHITE)
+    ]
+    button_rects = get_pause_buttons()
+    for button_rect, (label, fill_color, text_color) in zip(button_rects, buttons):
+        draw_rounded_rect(layer, WHITE, button_rect, 8)
+        inner_rect = (button_rect.x + 2, button_rect.y + 2, button_rect.width - 4, button_rect.height - 4)
+        draw_rounded_rect(layer, fill_color, inner_rect, 6)
+        label_text = button_font.render(label, True, text_color)
+        layer.blit(label_text, label_text.get_rect(center=button_rect.center))
     
     # 단축키 안내
     help_font = fm.get_font('small', 18)
-    help_y = buttons_y + button_height + 40
+    help_y = button_rects[0].bottom + 40
     shortcuts = [
         ("ESC: 계속하기", GREEN),
         ("R: 다시하기", LIGHT_BLUE),
         ("Q: 시작화면으로", RED)
     ]
     
-    for i, (text, color) in enumerate(shortcuts):
+    for button_rect, (text, color) in zip(button_rects, shortcuts):
         help_text = help_font.render(text, True, color)
-        x = start_x + (button_width + button_margin) * i + button_width//2 - help_text.get_width()//2
-        screen.blit(help_text, (x, help_y))
+        x = button_rect.centerx - help_text.get_width()//2
+        layer.blit(help_text, (x, help_y))
+    
+    return layer
+
+def draw_pause_screen(screen):
+    """
+    일시정지 화면을 그리는 함수
     
+    매개변수:
+        screen: pygame.Surface - 게임 화면
+        
+    반환값:
+        str: 사용자 선택 ("resume", "restart", "quit", None)
+    """
+    screen.blit(get_ui_layer(("pause",), build_pause_layer), (0, 0))
     pygame.display.flip()
     
-    # 이벤트 처리
+    resume_button, restart_button, quit_button = get_pause_buttons()
+    
+    # 이벤트 처리 (입력이 올 때까지 대기)
     while True:
-        for event in pygame.event.get():
+        for event in wait_for_events():
             if event.type == pygame.QUIT:
                 return "quit"
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1302,12 +1382,35 @@ def draw_rounded_rect(surface, color, rect, border_radius):
         pygame.draw.circle(surface, color, (x + border_radius, y + height - border_radius), border_radius)
         pygame.draw.circle(surface, color, (x + width - border_radius, y + height - border_radius), border_radius)
 
+def get_option(flag, default):
+    """명령행에서 "flag 값" 형태의 옵션 값 읽기"""
+    if flag in sys.argv:
+        index = sys.argv.index(flag)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return default
+
 def main():
     """
     게임 메인 함수
     게임 초기화 및 실행을 담당
+    
+    실행 옵션:
+        --install-requirements: 설치 상태 확인 없이 pip으로 패키지 설치
+        --connect HOST:PORT: 멀티플레이 서버(server.py)에 접속 (--name 이름, --room 방)
     """
-    install_requirements()
+    # 설치된 패키지 버전을 프로세스 안에서 확인 (부족할 때만 pip 실행)
+    with get_startup_timer().phase("requirements"):
+        ensure_requirements(force_install="--install-requirements" in sys.argv)
+    
+    # 온라인 클라이언트 모드
+    if "--connect" in sys.argv:
+        from client import run_client
+        pygame.init()
+        run_client(get_option("--connect", "127.0.0.1:8765"),
+                   name=get_option("--name", "YOU"), room=get_option("--room", "main"))
+        pygame.quit()
+        sys.exit()
     
     while True:
         game_mode = mode_select_screen()
@@ -5,11 +5,24 @@ Snake Game - 모듈 파일
 
 import pygame
 import random
+import bisect
 import math
-import json
 import os
-from datetime import datetime
+import itertools
+from collections.abc import MutableMapping
 from font_manager import get_font_manager
+from asset_manager import get_asset_manager
+from score_store import get_score_store
+from background_writer import get_background_writer
+from timer_wheel import Countdown, get_timer_wheel
+from render_quality import get_quality_controller
+from arena import Arena, BODIES, FOOD as FOOD_LAYER
+from profiler import profile_point
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 미니맵은 draw 호출 방식으로 갱신
+    np = None
 
 #############################################
 # 공통 상수 (모든 모드에서 사용)
@@ -17,8 +30,27 @@ from font_manager import get_font_manager
 # 게임 화면 설정
 WIDTH, HEIGHT = 1024, 768
 CELL_SIZE = 10
+MAX_CELL_X = (WIDTH // CELL_SIZE - 1) * CELL_SIZE   # 뱀 머리가 갈 수 있는 마지막 칸 (픽셀 좌표)
+MAX_CELL_Y = (HEIGHT // CELL_SIZE - 1) * CELL_SIZE
 LEADERBOARD_FILE = "leaderboard.json"
 
+# 렌더링 설정
+DIRTY_RECT_RENDERING = True  # 변경된 영역만 다시 그려서 화면에 전송
+ADAPTIVE_QUALITY = True      # 프레임 시간이 예산을 넘으면 렌더링 품질을 단계적으로 낮춤
+
+# 미니맵 설정
+MINIMAP_SIZE = 150
+MINIMAP_BACKGROUND = (50, 50, 50)
+MINIMAP_REFRESH_INTERVAL = 3   # 미니맵을 다시 만드는 주기 (프레임)
+MINIMAP_VIEW_MODE = "BODIES"   # "HEADS": 머리만, "BODIES": 몸통 전체, "HEATMAP": 밀도 히트맵
+
+# AI 계획 설정 (ai_planner.py)
+AI_PLANNER_WORKERS = 0  # 공유 메모리 월드를 읽는 AI 계획 워커 프로세스 수 (0이면 끄고 기존 AI만 사용)
+
+# 객체 풀 설정 (음식/특수 아이템/투사체를 버리지 않고 재사용)
+OBJECT_POOLING = True   # False면 매번 새로 생성 (비교용)
+POOL_MAX_SIZE = 512     # 풀마다 보관할 최대 객체 수
+
 # 기본 색상 정의
 
 BLACK = (0, 0, 0)
@@ -39,6 +71,10 @@ SAFE_SPAWN_DISTANCE = 150  # 다른 뱀으로부터의 최소 안전 거리
 DASH_DURATION = 60      # 4초 (15fps * 4)
 DASH_COOLDOWN = 150     # 10초
 DASH_ENERGY_COST = 1    # 초당 에너지 소모량
+CHARGE_DURATION = 8     # 돌진 지속 틱 (보스 모드 F)
+SPEED_UNITS_PER_CELL = 5  # 이동 거리 정수 단위 (한 칸 = 5, 속도 스탯 1당 +1 = 20%)
+DIRECTION_STEPS = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+OPPOSITE = {'UP': 'DOWN', 'DOWN': 'UP', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}  # 바로 뒤로 돌 수 없는 방향
 
 #############################################
 # 진화 모드 상수
@@ -147,9 +183,45 @@ EMOTIONS = {
 #############################################
 # 기본 클래스 (모든 모드에서 사용)
 #############################################
+class ObjectPool:
+    """
+    프리 리스트 기반 객체 풀
+
+    release()된 객체를 모아뒀다가 acquire() 때 reset()으로 다시 초기화해서 돌려준다.
+    풀에 넣은 객체는 다른 곳에서 더 이상 참조하지 않아야 한다.
+    """
+
+    __slots__ = ("cls", "free", "max_size", "created", "reused")
+
+    def __init__(self, cls, max_size=POOL_MAX_SIZE):
+        self.cls = cls
+        self.free = []
+        self.max_size = max_size
+        self.created = 0   # 새로 만든 객체 수
+        self.reused = 0    # 풀에서 꺼내 쓴 횟수
+
+    def acquire(self, *args, **kwargs):
+        if self.free and OBJECT_POOLING:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        if OBJECT_POOLING and len(self.free) < self.max_size:
+            self.free.append(obj)
+
 class Food:
     """기본 음식 클래스"""
+
+    __slots__ = ("x", "y", "is_item")
+
     def __init__(self, x, y, is_item=False):
+        self.reset(x, y, is_item)
+
+    def reset(self, x, y, is_item=False):
         self.x = float(x)
         self.y = float(y)
         self.is_item = is_item
@@ -157,16 +229,73 @@ class Food:
     def get_pos(self):
         return int(self.x), int(self.y)
 
+class EffectTimers(MutableMapping):
+    """
+    특수 효과 이름 -> 남은 틱 수 (dict처럼 사용)
+
+    값을 넣으면 타이머 휠에 만료를 예약하고, 만료되면 snake.end_effect(이름)를 호출한다.
+    """
+
+    def __init__(self, snake, names):
+        self.snake = snake
+        self.timers = dict.fromkeys(names)  # 이름 -> Timer 또는 None
+
+    def __getitem__(self, name):
+        timer = self.timers[name]
+        return 0 if timer is None else timer.remaining
+
+    def __setitem__(self, name, duration):
+        timer = self.timers.get(name)
+        if timer is not None:
+            timer.cancel()
+        if duration > 0:
+            self.timers[name] = self.snake.timers.schedule(duration, self.expire, name)
+        else:
+            self.timers[name] = None
+
+    def __delitem__(self, name):
+        self[name] = 0
+        del self.timers[name]
+
+    def __iter__(self):
+        return iter(self.timers)
+
+    def __len__(self):
+        return len(self.timers)
+
+    def expire(self, name):
+        self.timers[name] = None
+        self.snake.end_effect(name)
+
 class Snake:
     """뱀 기본 클래스"""
+
+    # 남은 틱 수 속성 - 매 틱 줄이지 않고 타이머 휠이 만료 시점에 on_expire 메서드를 호출
+    spawn_protection_time = Countdown()
+    invincible_time = Countdown()
+    dash_duration = Countdown(on_expire="dash_expired")
+    dash_cooldown = Countdown()
+    breed_cooldown = Countdown()
+    recovery_timer = Countdown(on_expire="finish_recovery")
+    charge_timer = Countdown(on_expire="end_charge")
+    tank_immunity_cooldown = Countdown(on_expire="end_tank_cooldown")
+
     def __init__(self, x, y, color=GREEN, is_ai=False, name="Player"):
-        # 기본 속성
+        self.timers = get_timer_wheel()  # 생성 시점의 월드 타이머 휠
+        self.arena = get_arena()         # 생성 시점의 월드 점유 격자
+        # 기본 속성 (몸통 좌표는 항상 CELL_SIZE 격자 위의 정수)
+        x = int(x) // CELL_SIZE * CELL_SIZE
+        y = int(y) // CELL_SIZE * CELL_SIZE
         self.body = [[x, y], [x - CELL_SIZE, y], [x - 2 * CELL_SIZE, y]]
+        self.arena.add_body(self.body)
+        self.move_progress = 0  # 아직 이동하지 않은 거리 (SPEED_UNITS_PER_CELL 단위)
         self.direction = 'RIGHT'
         self.color = color
         self.is_ai = is_ai
         self.name = name
         self.alive = True
+        self.entity_id = None  # 월드가 부여하는 고유 번호 (네트워크 동기화용)
+        self.ranking = None  # 점수 순위 구조 (등록되면 점수 변경 시 자동 갱신)
         self.score = 0
         
         # 에너지 시스템
@@ -200,13 +329,7 @@ class Snake:
         self.emotion_timer = 0
         
         # 효과 시스템
-        self.active_effects = {
-            "SHIELD": 0,
-            "SPEED_BOOST": 0,
-            "GHOST": 0,
-            "INVINCIBLE": 0,
-            "STUN": 0
-        }
+        self.active_effects = EffectTimers(self, ("SHIELD", "SPEED_BOOST", "GHOST", "INVINCIBLE", "STUN"))
         
         # 스탯 시스템
         self.stats = {
@@ -234,14 +357,20 @@ class Snake:
         self.message = None
         self.message_duration = 0
 
+    @property
+    def score(self):
+        return self._score
+
+    @score.setter
+    def score(self, value):
+        self._score = value
+        if self.ranking is not None:
+            self.ranking.update(self)
+
     def init_evolution_attributes(self):
         """진화 모드 속성 초기화"""
         # 특수 효과 초기화
-        self.active_effects = {
-            "SHIELD": 0,
-            "SPEED_BOOST": 0,
-            "GHOST": 0
-        }
+        self.active_effects = EffectTimers(self, ("SHIELD", "SPEED_BOOST", "GHOST"))
 
     def init_ai_attributes(self):
         """AI 속성 초기화"""
@@ -250,6 +379,7 @@ class Snake:
         self.target_player = None
         self.last_player_pos = None
         self.chase_cooldown = 0
+        self.planned_direction = None  # AI 계획 워커가 이번 틱에 정한 방향 (없으면 기존 AI로 결정)
         self.food_detection_range = 50
 
     def add_exp(self, amount):
@@ -295,6 +425,35 @@ class Snake:
     def get_head(self):
         return self.body[0]
 
+    def push_head(self, head):
+        """머리 세그먼트 추가 (점유 격자도 함께 갱신)"""
+        self.body.insert(0, head)
+        self.arena.add(BODIES, head[0], head[1])
+
+    def pop_tail(self):
+        """꼬리 세그먼트 제거"""
+        tail = self.body.pop()
+        self.arena.remove(BODIES, tail[0], tail[1])
+
+    def grow_tail(self, count=1):
+        """꼬리 위치에 세그먼트를 count개 복제해서 몸통을 늘림"""
+        tail_x, tail_y = self.body[-1]
+        for _ in range(count):
+            self.body.append([tail_x, tail_y])
+            self.arena.add(BODIES, tail_x, tail_y)
+
+    def set_body(self, body):
+        """몸통 목록 전체 교체"""
+        self.arena.remove_body(self.body)
+        self.body = body
+        self.arena.add_body(body)
+
+    def leave_arena(self):
+        """월드의 뱀 목록에서 빠질 때 점유 격자에서 몸통 제거 (죽은 뱀만 빠지므로 이후 몸통은 바뀌지 않음)"""
+        if self.arena is not None:
+            self.arena.remove_body(self.body)
+            self.arena = None
+
     def update_emotion_state(self, snakes):
         if not self.alive:
             return
@@ -396,14 +555,10 @@ class Snake:
             self.energy = 120
             self.stored_energy += extra * 0.5  # 50% 효율로 저장
 
-    def update_recovery(self):
-        """회복 시스템"""
-        if self.recovery_timer is not None:
-            self.recovery_timer -= 1
-            if self.recovery_timer <= 0:
-                self.recovery_timer = None
-                heal_amount = 30
-                self.energy = min(150, self.energy + heal_amount)
+    def finish_recovery(self):
+        """회복 시간이 끝나면 에너지 회복"""
+        heal_amount = 30
+        self.energy = min(150, self.energy + heal_amount)
 
     def try_breed(self, snakes):
         """번식 시도"""
@@ -439,14 +594,11 @@ class Snake:
             new_snake = Snake(new_x, new_y, color=self.color, is_ai=True)
             snakes.append(new_snake)
 
+    @profile_point("snake.move")
     def move(self, food_list, snakes, tick_count, simulation_mode=False):
         """뱀 이동 처리"""
-        # 스폰 보호 시간 처리
-        if hasattr(self, 'spawn_protection_time') and self.spawn_protection_time > 0:
-            self.spawn_protection_time -= 1
-            self.collision_immune = True
-        elif self.invincible_time > 0:
-            self.invincible_time -= 1
+        # 스폰 보호 / 무적 시간 처리
+        if self.spawn_protection_time > 0 or self.invincible_time > 0:
             self.collision_immune = True
         else:
             # Tank 형태의 면역 상태 처리
@@ -461,21 +613,14 @@ class Snake:
                                        self.active_effects["SHIELD"] > 0 or 
                                        self.stats["ENERGY"] >= MAX_STAT_LEVEL)
 
-        # 대시 상태 업데이트
+        # 대시 에너지 소모 (지속 시간이 끝나면 end_dash가 호출됨)
         if self.is_dashing:
-            self.dash_duration -= 1
             # 보스전일 때 대시 에너지 소모 절반으로 감소
             dash_energy_cost = DASH_ENERGY_COST * 0.5 if any(isinstance(s, BossSnake) for s in snakes) else DASH_ENERGY_COST
             self.energy -= dash_energy_cost
             
-            if self.dash_duration <= 0 or self.energy <= 0:
-                self.is_dashing = False
-                self.dash_duration = 0
-                self.dash_cooldown = DASH_COOLDOWN
-        
-        # 대시 쿨다운 감소
-        if self.dash_cooldown > 0:
-            self.dash_cooldown -= 1
+            if self.energy <= 0:
+                self.end_dash()
 
         # 에너지 관련 처리
         max_energy = 100 + (self.stats["ENERGY"] - 1) * 20  # 스탯당 20 에너지 증가
@@ -485,106 +630,92 @@ class Snake:
         elif self.energy > max_energy:
             self.energy = max_energy
 
-        # AI 행동 처리
+        # AI 행동 처리 (계획 워커가 정한 방향이 있으면 그대로 사용)
         if self.is_ai:
-            self.ai_decide_direction(food_list, snakes)
-
-        # 회복 시스템 업데이트
-        self.update_recovery()
-        
-        # 번식 쿨다운 감소
-        if self.breed_cooldown > 0:
-            self.breed_cooldown -= 1
-        
-        # 이동 처리
-        head_x, head_y = self.get_head()
-        dx, dy = 0, 0
+            if self.planned_direction is not None:
+                self.direction = self.planned_direction
+                self.planned_direction = None
+            else:
+                self.ai_decide_direction(food_list, snakes)
+
+        # 이동 처리 (격자 한 칸씩, 속도는 틱마다 이동할 칸 수로 환산)
+        self.move_progress += self.speed_units()
+        steps, self.move_progress = divmod(self.move_progress, SPEED_UNITS_PER_CELL)
+        step_x, step_y = DIRECTION_STEPS.get(self.direction, (0, 0))
+        for _ in range(steps):
+            if not self.step_cell(step_x, step_y, food_list):
+                return
         
-        # 기존 방식의 이동
-        base_speed = CELL_SIZE * (1 + (self.stats["SPEED"] - 1) * 0.2)  # 스탯당 20% 속도 증가
-        if self.direction == 'UP': dy = -base_speed
-        elif self.direction == 'DOWN': dy = base_speed
-        elif self.direction == 'LEFT': dx = -base_speed
-        elif self.direction == 'RIGHT': dx = base_speed
+        # 에너지 소모 (스탯에 따라 감소)
+        base_consume = 0.5  # 기본 소모량을 절반으로 감소
+        # 보스전일 때 에너지 소모 절반으로 감소
+        if any(isinstance(s, BossSnake) for s in snakes):
+            base_consume *= 0.5
+        energy_efficiency = 1 - (self.stats["ENERGY"] - 1) * 0.15  # 스탯당 15% 에너지 소모 감소
+        self.energy -= base_consume * energy_efficiency
 
+    def speed_units(self):
+        """이번 틱의 이동 거리 (한 칸 = SPEED_UNITS_PER_CELL인 정수 단위)"""
+        units = SPEED_UNITS_PER_CELL + self.stats["SPEED"] - 1  # 스탯당 20% 속도 증가
         # 대시와 스피드 부스트 효과 적용
-        speed_mult = 1
         if self.is_dashing:
-            speed_mult *= 2
+            units *= 2
         if self.active_effects["SPEED_BOOST"] > 0:
-            speed_mult *= 2
+            units *= 2
         # 돌진 모드일 때 속도 2배
         if hasattr(self, 'is_charging') and self.is_charging:
-            speed_mult *= 2
-        dx *= speed_mult
-        dy *= speed_mult
+            units *= 2
+        return units
 
-        new_head = [head_x + dx, head_y + dy]
+    def step_cell(self, step_x, step_y, food_list):
+        """
+        머리를 한 칸 옮기고 그 칸의 음식을 먹음
 
+        Returns:
+            bool: 자기 몸에 부딪혀 죽었으면 False
+        """
+        head_x, head_y = self.get_head()
         # 벽 충돌 처리
-        new_head[0] = max(0, min(new_head[0], WIDTH - CELL_SIZE))
-        new_head[1] = max(0, min(new_head[1], HEIGHT - CELL_SIZE))
+        new_head = [max(0, min(head_x + step_x * CELL_SIZE, MAX_CELL_X)),
+                    max(0, min(head_y + step_y * CELL_SIZE, MAX_CELL_Y))]
 
         # 충돌 체크 (고스트 효과 중에는 무시)
         if not self.collision_immune and not self.active_effects["GHOST"] > 0:
             if new_head in self.body[1:]:
                 self.alive = False
-                return
-
-        self.body.insert(0, new_head)
-        
-        # 에너지 소모 (스탯에 따라 감소)
-        base_consume = 0.5  # 기본 소모량을 절반으로 감소
-        # 보스전일 때 에너지 소모 절반으로 감소
-        if any(isinstance(s, BossSnake) for s in snakes):
-            base_consume *= 0.5
-        energy_efficiency = 1 - (self.stats["ENERGY"] - 1) * 0.15  # 스탯당 15% 에너지 소모 감소
-        self.energy -= base_consume * energy_efficiency
+                return False
 
-        # 음식 충돌 체크 및 경험치 획득
-        foods_to_remove = []
-        for food in food_list:
-            food_x, food_y = food.get_pos()
-            # Hunter 형태일 때 흡수 범위 3배 증가
-            absorption_range = CELL_SIZE * 3 if self.evolution_form == "HUNTER" else CELL_SIZE
-            distance = math.sqrt((food_x - new_head[0])**2 + (food_y - new_head[1])**2)
-            
-            if distance < absorption_range:
-                foods_to_remove.append(food)
-                if isinstance(food, SpecialItem):
-                    self.apply_special_item(food.type)
-                    self.score += 20  # 점수만 획득
-                else:
-                    self.boost = 2 if food.is_item else 1
-                    if food.is_item:  # 황금 음식
-                        self.energy += 40
-                        self.score += 10
-                        self.add_exp(500)
-                    else:  # 일반 음식
-                        self.energy += 15
-                        self.score += 1
-                        self.add_exp(100)  # 1000에서 100으로 수정
-                    self.grow = True
-                break
+        self.push_head(new_head)
 
-        for food in foods_to_remove:
-            if food in food_list:
-                food_list.remove(food)
+        # 음식 충돌 체크 및 경험치 획득 (Hunter 형태일 때 흡수 범위 3칸)
+        radius = 3 if self.evolution_form == "HUNTER" else 1
+        food = find_food_near(food_list, new_head[0], new_head[1], radius, self.arena)
+        if food is not None:
+            if isinstance(food, SpecialItem):
+                self.apply_special_item(food.type)
+                self.score += 20  # 점수만 획득
+            else:
+                self.boost = 2 if food.is_item else 1
+                if food.is_item:  # 황금 음식
+                    self.energy += 40
+                    self.score += 10
+                    self.add_exp(500)
+                else:  # 일반 음식
+                    self.energy += 15
+                    self.score += 1
+                    self.add_exp(100)  # 1000에서 100으로 수정
+                self.grow = True
+            remove_food(food_list, food)
 
         if not self.grow:
-            self.body.pop()
+            self.pop_tail()
         else:
-            for _ in range(self.boost - 1):
-                self.body.append(self.body[-1])
+            self.grow_tail(self.boost - 1)
             self.boost = 1
             self.grow = False
+        return True
 
-        # 돌진 모드 타이머 관리(중복 방지)
-        if hasattr(self, 'is_charging') and self.is_charging:
-            self.charge_timer -= 1
-            if self.charge_timer <= 0:
-                self.is_charging = False
-
+    @profile_point("ai.decide_direction")
     def ai_decide_direction(self, food_list, snakes):
         """AI의 방향 결정"""
         if not self.alive:
@@ -653,9 +784,7 @@ class Snake:
         """대시 시스템"""
         # 이미 대시 중이면 대시 중지
         if self.is_dashing:
-            self.is_dashing = False
-            self.dash_duration = 0
-            self.dash_cooldown = DASH_COOLDOWN  # 중지 시점부터 10초 쿨타임
+            self.end_dash()  # 중지 시점부터 10초 쿨타임
             return False
             
         # 새로운 대시 시작
@@ -676,6 +805,20 @@ class Snake:
             return True
         return False
 
+    def end_dash(self):
+        """대시 종료 (지속 시간 만료, 에너지 소진, 직접 중지)"""
+        self.is_dashing = False
+        self.dash_duration = 0
+        self.dash_cooldown = DASH_COOLDOWN
+
+    def dash_expired(self):
+        """대시 지속 시간 만료"""
+        self.end_dash()
+
+    def end_charge(self):
+        """돌진 시간 만료"""
+        self.is_charging = False
+
     def upgrade_stat(self, stat_name):
         """스탯 업그레이드"""
         if (stat_name in self.stats and 
@@ -697,21 +840,15 @@ class Snake:
             self.message = f"{self.name}이(가) {SPECIAL_ITEMS[item_type]['name']}을(를) 섭취하였습니다!"
             self.message_duration = 45  # 3초간 표시 (15fps * 3)
 
-    def update_effects(self):
-        """특수 아이템 효과 업데이트"""
-        # 기존 효과 업데이트
-        for effect in self.active_effects:
-            if self.active_effects[effect] > 0:
-                self.active_effects[effect] -= 1
-                # SHIELD 효과가 끝나면 면역 해제
-                if effect == "SHIELD" and self.active_effects[effect] == 0:
-                    self.collision_immune = False
-        
-        # Tank 면역 쿨다운 업데이트
-        if self.tank_immunity_cooldown > 0:
-            self.tank_immunity_cooldown -= 1
-            if self.tank_immunity_cooldown <= 0:
-                self.tank_immunity_used = False  # 쿨다운이 끝나면 다시 사용 가능
+    def end_effect(self, effect):
+        """특수 아이템 효과 만료"""
+        # SHIELD 효과가 끝나면 면역 해제
+        if effect == "SHIELD":
+            self.collision_immune = False
+
+    def end_tank_cooldown(self):
+        """Tank 면역 쿨다운 만료 - 다시 사용 가능"""
+        self.tank_immunity_used = False
 
     def activate_tank_immunity(self):
         """Tank 형태의 일회용 피해 면역 능력을 활성화"""
@@ -751,11 +888,27 @@ class Snake:
 #############################################
 class SpecialItem(Food):
     """특수 아이템 클래스 (진화 모드)"""
+
+    __slots__ = ("type", "color")
+
     def __init__(self, x, y):
-        super().__init__(x, y, is_item=True)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        super().reset(x, y, is_item=True)
         self.type = random.choice(list(SPECIAL_ITEMS.keys()))
         self.color = SPECIAL_ITEMS[self.type]["color"]
 
+FOOD_POOL = ObjectPool(Food)
+SPECIAL_ITEM_POOL = ObjectPool(SpecialItem)
+
+def release_food(food):
+    """먹거나 없어진 음식/특수 아이템을 풀에 반환"""
+    if type(food) is SpecialItem:
+        SPECIAL_ITEM_POOL.release(food)
+    elif type(food) is Food:
+        FOOD_POOL.release(food)
+
 #############################################
 # 유틸리티 함수 (모든 모드 공통)
 #############################################
@@ -764,14 +917,71 @@ def generate_name():
     names = ["Neo", "Axe", "Lyn", "Koz", "Dex", "Zex", "Vox", "Tyr", "Lux", "Kai"]
     return random.choice(names) + str(random.randint(10, 99))
 
+_arena = None
+
+def get_arena():
+    """현재 월드의 점유 격자 반환 (없으면 화면 크기로 생성)"""
+    global _arena
+    if _arena is None:
+        _arena = Arena(WIDTH, HEIGHT, CELL_SIZE)
+    return _arena
+
+def set_arena(arena):
+    """
+    이후 생성되는 뱀과 음식이 사용할 점유 격자 지정 (월드/판마다 따로 둠)
+
+    Returns:
+        Arena: 이전 격자
+    """
+    global _arena
+    previous = _arena
+    _arena = arena
+    return previous
+
+def remove_food(food_list, food):
+    """먹은 음식을 목록과 점유 격자에서 빼고 풀에 반환"""
+    food_list.remove(food)
+    get_arena().remove_food(food)
+    release_food(food)
+
+def find_food_near(food_list, x, y, radius=1, arena=None):
+    """
+    (x, y) 칸에서 radius칸 미만 거리에 있는 첫 번째 음식 반환 (없으면 None)
+
+    음식과 뱀 머리는 모두 격자 위에 있으므로 radius가 1이면 같은 칸인지만 비교하고,
+    그보다 크면 칸 단위 거리의 제곱을 정수로 비교한다.
+    arena가 주어지면 radius 1은 칸 조회로 끝내고, 더 넓은 범위는 주변 사각형에 음식이 있을 때만 목록을 훑는다.
+    """
+    if radius <= 1:
+        if arena is not None:
+            return arena.food_at(x, y)
+        for food in food_list:
+            if food.x == x and food.y == y:
+                return food
+        return None
+    if arena is not None:
+        reach = (radius - 1) * CELL_SIZE
+        side = 2 * reach + CELL_SIZE
+        if not arena.count_rect(FOOD_LAYER, x - reach, y - reach, side, side):
+            return None
+    limit = (radius * CELL_SIZE) ** 2
+    for food in food_list:
+        dx = food.x - x
+        dy = food.y - y
+        if dx * dx + dy * dy < limit:
+            return food
+    return None
+
+@profile_point("spawn.food")
 def spawn_food(food_list, snakes, is_item=False):
-    """음식 생성"""
-    while True:
-        fx = random.randint(0, (WIDTH - CELL_SIZE) // CELL_SIZE) * CELL_SIZE
-        fy = random.randint(0, (HEIGHT - CELL_SIZE) // CELL_SIZE) * CELL_SIZE
-        if all(not [fx, fy] in s.body for s in snakes):
-            food_list.append(Food(fx, fy, is_item=is_item))
-            break
+    """음식 생성 (뱀 몸통이 없는 칸은 점유 격자에서 고름, 빈 칸이 없으면 생성하지 않음)"""
+    arena = get_arena()
+    cell = arena.sample_free_cell()
+    if cell is None:
+        return
+    food = FOOD_POOL.acquire(cell[0], cell[1], is_item=is_item)
+    food_list.append(food)
+    arena.add_food(food)
 
 def is_safe_location(x, y, snakes, min_distance=SAFE_SPAWN_DISTANCE):
     """주어진 위치가 스폰하기에 안전한지 확인"""
@@ -780,43 +990,59 @@ def is_safe_location(x, y, snakes, min_distance=SAFE_SPAWN_DISTANCE):
         y < SPAWN_AREA_PADDING or y > HEIGHT - SPAWN_AREA_PADDING):
         return False
         
-    # 다른 뱀들과의 거리 확인
+    # 주변 사각형에 몸통이 하나도 없으면 거리 계산 없이 안전
+    if not get_arena().count_rect(BODIES, x - min_distance, y - min_distance,
+                                  2 * min_distance, 2 * min_distance):
+        return True
+
+    # 다른 뱀들과의 거리 확인 (제곱 거리로 비교)
+    limit = min_distance * min_distance
     for snake in snakes:
         if not snake.alive:
             continue
         for segment in snake.body:
-            dist = math.hypot(x - segment[0], y - segment[1])
-            if dist < min_distance:
+            dx = x - segment[0]
+            dy = y - segment[1]
+            if dx * dx + dy * dy < limit:
                 return False
     return True
 
+@profile_point("spawn.safe_location")
 def find_safe_spawn_location(snakes):
     """안전한 스폰 위치 찾기"""
     attempts = 100  # 최대 시도 횟수
     best_location = None
-    max_min_distance = 0
+    max_min_distance = 0  # 지금까지 가장 먼 위치의 최소 제곱 거리
+    safe_distance = SAFE_SPAWN_DISTANCE * SAFE_SPAWN_DISTANCE
+    arena = get_arena()
     
     while attempts > 0:
         x = random.randint(SPAWN_AREA_PADDING, WIDTH - SPAWN_AREA_PADDING)
         x = x - (x % CELL_SIZE)  # 그리드에 맞추기
         y = random.randint(SPAWN_AREA_PADDING, HEIGHT - SPAWN_AREA_PADDING)
         y = y - (y % CELL_SIZE)  # 그리드에 맞추기
+
+        # 안전 거리 안쪽 사각형에 몸통이 없으면 바로 사용
+        if not arena.count_rect(BODIES, x - SAFE_SPAWN_DISTANCE, y - SAFE_SPAWN_DISTANCE,
+                                2 * SAFE_SPAWN_DISTANCE, 2 * SAFE_SPAWN_DISTANCE):
+            return x, y
         
-        # 최소 거리 계산
+        # 최소 거리 계산 (제곱 거리)
         min_distance = float('inf')
         for snake in snakes:
             if not snake.alive:
                 continue
             for segment in snake.body:
-                dist = math.hypot(x - segment[0], y - segment[1])
-                min_distance = min(min_distance, dist)
+                dx = x - segment[0]
+                dy = y - segment[1]
+                min_distance = min(min_distance, dx * dx + dy * dy)
         
         # 더 좋은 위치 발견시 업데이트
         if min_distance > max_min_distance:
             max_min_distance = min_distance
             best_location = (x, y)
         
-        if min_distance >= SAFE_SPAWN_DISTANCE:
+        if min_distance >= safe_distance:
             return x, y
             
         attempts -= 1
@@ -872,160 +1098,303 @@ def draw_energy_bar(screen, snake):
     txt = font.render(f"Energy: {int(snake.energy)}", True, (WHITE[0], WHITE[1], WHITE[2], alpha))
     screen.blit(txt, (x, y + height + 4))
 
-def draw_leaderboard(screen, snakes):
-    fm = get_font_manager()
-    title_font = fm.get_font('small', 20)
-    rank_font = fm.get_font('small', 18)
-    sorted_snakes = sorted([s for s in snakes if s.alive], key=lambda s: s.score, reverse=True)
+class ScoreRanking:
+    """
+    점수 순위 구조
     
-    def get_ordinal(n):
-        """숫자를 영어 서수로 변환하는 함수"""
-        if 10 <= n % 100 <= 20:  # 11th, 12th, 13th 등 예외 처리
-            suffix = "th"
+    (-점수, 등록 순서, id) 키를 정렬된 리스트로 유지하고, 점수가 바뀐 뱀만 이분 탐색으로
+    빼서 다시 넣는다. 죽은 뱀은 상위 항목을 읽을 때 발견되는 즉시 제거한다.
+    """
+    def __init__(self):
+        self.entries = []  # 정렬된 (-score, order, snake_id) 목록
+        self.keys = {}     # snake_id -> 현재 키
+        self.snakes = {}   # snake_id -> Snake
+        self.next_order = 0
+
+    def track(self, snake):
+        """뱀을 순위 구조에 등록 (이후 점수 변경 시 자동으로 update 호출)"""
+        if snake.ranking is self:
+            return
+        snake.ranking = self
+        self.snakes[id(snake)] = snake
+        self.update(snake)
+
+    def update(self, snake):
+        """점수가 바뀐 뱀의 위치만 재배치"""
+        snake_id = id(snake)
+        old_key = self.keys.get(snake_id)
+        if old_key is not None:
+            del self.entries[bisect.bisect_left(self.entries, old_key)]
+            order = old_key[1]
         else:
-            suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-        return f"{n}{suffix}"
-    
-    # 리더보드 크기 및 위치 설정
-    board_width = 240
-    header_height = 35
-    row_height = 28
-    max_entries = min(5, len(sorted_snakes))
-    total_height = header_height + max_entries * row_height + 10  # 하단 여백
-    
-    x = WIDTH - board_width - 15
-    y = 15
-    
-    # 뱀들의 머리 위치 확인 (근접 시 투명도 증가)
-    any_snake_near = False
-    leaderboard_area = pygame.Rect(x, y, board_width, total_height)
-    for snake in snakes:
-        if snake.alive:
-            head_x, head_y = snake.get_head()
-            if leaderboard_area.collidepoint(head_x, head_y):
-                any_snake_near = True
+            order = self.next_order
+            self.next_order += 1
+        new_key = (-snake.score, order, snake_id)
+        bisect.insort(self.entries, new_key)
+        self.keys[snake_id] = new_key
+
+    def remove(self, snake):
+        """뱀을 순위 구조에서 제거"""
+        snake_id = id(snake)
+        key = self.keys.pop(snake_id, None)
+        if key is not None:
+            del self.entries[bisect.bisect_left(self.entries, key)]
+            del self.snakes[snake_id]
+        if snake.ranking is self:
+            snake.ranking = None
+
+    def top(self, n):
+        """살아있는 뱀 중 점수 상위 n개 반환"""
+        result = []
+        dead = []
+        for _, _, snake_id in self.entries:
+            snake = self.snakes[snake_id]
+            if not snake.alive:
+                dead.append(snake)
+                continue
+            result.append(snake)
+            if len(result) >= n:
                 break
-    
-    # 알파값 설정 (게임 방해 최소화)
-    bg_alpha = 200 if any_snake_near else 120
-    text_alpha = 255 if any_snake_near else 180
-    
-    # 반투명 배경 패널
-    panel_surface = pygame.Surface((board_width, total_height), pygame.SRCALPHA)
-    
-    # 둥근 모서리 배경
-    draw_rounded_rect(panel_surface, (20, 20, 30, bg_alpha), (0, 0, board_width, total_height), 8)
-    draw_rounded_rect(panel_surface, (80, 80, 100, bg_alpha // 2), (0, 0, board_width, total_height), 8)
-    
-    # 헤더 영역 (상단 강조)
-    draw_rounded_rect(panel_surface, (40, 40, 60, bg_alpha), (0, 0, board_width, header_height), 8)
-    
-    # 제목 텍스트
-    title_text = title_font.render("실시간 순위", True, (255, 215, 0, text_alpha))  # 골드색
-    title_rect = title_text.get_rect(center=(board_width // 2, header_height // 2))
-    panel_surface.blit(title_text, title_rect)
-    
-    # 순위 항목들
-    for i, snake in enumerate(sorted_snakes[:max_entries]):
-        row_y = header_height + i * row_height
-        
-        # 행 배경 (홀수/짝수 구분)
-        row_bg_alpha = bg_alpha // 3 if i % 2 == 0 else bg_alpha // 4
-        row_surface = pygame.Surface((board_width - 10, row_height - 2), pygame.SRCALPHA)
-        draw_rounded_rect(row_surface, (50, 50, 70, row_bg_alpha), (0, 0, board_width - 10, row_height - 2), 5)
-        panel_surface.blit(row_surface, (5, row_y + 1))
-        
-        # 순위 텍스트와 색상
-        rank_text = get_ordinal(i + 1)
-        
-        if i == 0:  # 1등
-            rank_color = (255, 215, 0, text_alpha)  # 골드
-        elif i == 1:  # 2등
-            rank_color = (192, 192, 192, text_alpha)  # 실버
-        elif i == 2:  # 3등
-            rank_color = (205, 127, 50, text_alpha)  # 브론즈
-        else:
-            rank_color = (180, 180, 180, text_alpha)  # 회색
+        for snake in dead:
+            self.remove(snake)
+        return result
+
+class LeaderboardPanel:
+    """실시간 순위 패널 - 상위 5위 또는 근접 투명도 상태가 바뀔 때만 패널을 다시 합성"""
+    def __init__(self, board_width=240, max_entries=5):
+        self.board_width = board_width
+        self.max_entries = max_entries
+        self.ranking = ScoreRanking()
+        self.snakes_ref = None    # 추적 중인 뱀 목록 (게임이 새로 시작되면 바뀜)
+        self.tracked_count = 0    # 목록에서 이미 등록한 뱀 수 (뱀 목록은 뒤에 추가만 됨)
+        self.surface = None
+        self.state = None
+
+    def sync(self, snakes):
+        """새로 추가된 뱀만 순위 구조에 등록"""
+        if snakes is not self.snakes_ref or len(snakes) < self.tracked_count:
+            self.ranking = ScoreRanking()
+            self.snakes_ref = snakes
+            self.tracked_count = 0
+        for snake in snakes[self.tracked_count:]:
+            self.ranking.track(snake)
+        self.tracked_count = len(snakes)
+
+    def draw(self, screen, snakes):
+        self.sync(snakes)
+        top_snakes = self.ranking.top(self.max_entries)
+        
+        # 리더보드 크기 및 위치 설정
+        header_height = 35
+        row_height = 28
+        total_height = header_height + len(top_snakes) * row_height + 10  # 하단 여백
+        
+        x = WIDTH - self.board_width - 15
+        y = 15
+        
+        # 뱀들의 머리 위치 확인 (근접 시 투명도 증가, 품질을 낮추면 생략)
+        any_snake_near = False
+        leaderboard_area = pygame.Rect(x, y, self.board_width, total_height)
+        for snake in snakes if get_quality_controller().leaderboard_fade else ():
+            if snake.alive:
+                head_x, head_y = snake.get_head()
+                if leaderboard_area.collidepoint(head_x, head_y):
+                    any_snake_near = True
+                    break
         
-        # 순위 렌더링
-        rank_surface = rank_font.render(rank_text, True, rank_color)
-        panel_surface.blit(rank_surface, (15, row_y + 6))
+        state = (tuple((s.name, s.score, tuple(s.color)) for s in top_snakes), any_snake_near)
+        if state != self.state:
+            self.state = state
+            self.surface = self.compose(top_snakes, total_height, header_height, row_height, any_snake_near)
         
-        # 플레이어 이름 (최대 8글자로 제한)
-        name = snake.name[:8] + "..." if len(snake.name) > 8 else snake.name
-        name_color = snake.color if hasattr(snake, 'color') else (255, 255, 255)
+        # 패널을 화면에 그리기
+        screen.blit(self.surface, (x, y))
+
+    def compose(self, top_snakes, total_height, header_height, row_height, any_snake_near):
+        """순위 패널 Surface 합성"""
+        fm = get_font_manager()
+        title_font = fm.get_font('small', 20)
+        rank_font = fm.get_font('small', 18)
+        board_width = self.board_width
         
-        # 플레이어 색상에 알파값 적용
-        if len(name_color) == 3:
-            name_color = (*name_color, text_alpha)
+        # 알파값 설정 (게임 방해 최소화)
+        bg_alpha = 200 if any_snake_near else 120
+        text_alpha = 255 if any_snake_near else 180
         
-        name_surface = rank_font.render(name, True, name_color)
-        panel_surface.blit(name_surface, (50, row_y + 6))
+        # 반투명 배경 패널
+        panel_surface = pygame.Surface((board_width, total_height), pygame.SRCALPHA)
         
-        # 점수 (우측 정렬)
-        score_text = f"{snake.score:,}"  # 천단위 콤마
-        score_surface = rank_font.render(score_text, True, (255, 255, 255, text_alpha))
-        score_rect = score_surface.get_rect()
-        panel_surface.blit(score_surface, (board_width - score_rect.width - 15, row_y + 6))
-    
-    # 패널을 화면에 그리기
-    screen.blit(panel_surface, (x, y))
+        # 둥근 모서리 배경
+        draw_rounded_rect(panel_surface, (20, 20, 30, bg_alpha), (0, 0, board_width, total_height), 8)
+        draw_rounded_rect(panel_surface, (80, 80, 100, bg_alpha // 2), (0, 0, board_width, total_height), 8)
+        
+        # 헤더 영역 (상단 강조)
+        draw_rounded_rect(panel_surface, (40, 40, 60, bg_alpha), (0, 0, board_width, header_height), 8)
+        
+        # 제목 텍스트
+        title_text = title_font.render("실시간 순위", True, (255, 215, 0, text_alpha))  # 골드색
+        title_rect = title_text.get_rect(center=(board_width // 2, header_height // 2))
+        panel_surface.blit(title_text, title_rect)
+        
+        # 순위 항목들
+        for i, snake in enumerate(top_snakes):
+            row_y = header_height + i * row_height
+            
+            # 행 배경 (홀수/짝수 구분)
+            row_bg_alpha = bg_alpha // 3 if i % 2 == 0 else bg_alpha // 4
+            row_surface = pygame.Surface((board_width - 10, row_height - 2), pygame.SRCALPHA)
+            draw_rounded_rect(row_surface, (50, 50, 70, row_bg_alpha), (0, 0, board_width - 10, row_height - 2), 5)
+            panel_surface.blit(row_surface, (5, row_y + 1))
+            
+            # 순위 텍스트와 색상
+            rank_text = get_ordinal(i + 1)
+            
+            if i == 0:  # 1등
+                rank_color = (255, 215, 0, text_alpha)  # 골드
+            elif i == 1:  # 2등
+                rank_color = (192, 192, 192, text_alpha)  # 실버
+            elif i == 2:  # 3등
+                rank_color = (205, 127, 50, text_alpha)  # 브론즈
+            else:
+                rank_color = (180, 180, 180, text_alpha)  # 회색
+            
+            # 순위 렌더링
+            rank_surface = rank_font.render(rank_text, True, rank_color)
+            panel_surface.blit(rank_surface, (15, row_y + 6))
+            
+            # 플레이어 이름 (최대 8글자로 제한)
+            name = snake.name[:8] + "..." if len(snake.name) > 8 else snake.name
+            name_color = snake.color if hasattr(snake, 'color') else (255, 255, 255)
+            
+            # 플레이어 색상에 알파값 적용
+            if len(name_color) == 3:
+                name_color = (*name_color, text_alpha)
+            
+            name_surface = rank_font.render(name, True, name_color)
+            panel_surface.blit(name_surface, (50, row_y + 6))
+            
+            # 점수 (우측 정렬)
+            score_text = f"{snake.score:,}"  # 천단위 콤마
+            score_surface = rank_font.render(score_text, True, (255, 255, 255, text_alpha))
+            score_rect = score_surface.get_rect()
+            panel_surface.blit(score_surface, (board_width - score_rect.width - 15, row_y + 6))
+        
+        return panel_surface
+
+def get_ordinal(n):
+    """숫자를 영어 서수로 변환하는 함수"""
+    if 10 <= n % 100 <= 20:  # 11th, 12th, 13th 등 예외 처리
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
 
-def draw_vision_cone(screen, x, y, angle, fov, dist, color=(255, 0, 0, 50)):
-    """시야 원뿔을 그리는 함수
+# 전역 리더보드 패널 인스턴스
+leaderboard_panel = None
+
+def get_leaderboard_panel():
+    """리더보드 패널 싱글톤 반환"""
+    global leaderboard_panel
+    if leaderboard_panel is None:
+        leaderboard_panel = LeaderboardPanel()
+    return leaderboard_panel
+
+def draw_leaderboard(screen, snakes):
+    """실시간 순위 그리기 (순위와 패널은 바뀐 경우에만 갱신)"""
+    get_leaderboard_panel().draw(screen, snakes)
+
+# 시야 원뿔 스프라이트 캐시 - (각도, 시야각, 거리, 색상) -> (Surface, 꼭짓점 오프셋)
+_vision_cone_cache = {}
+
+def get_vision_cone_sprite(angle, fov, dist, color=(255, 0, 0, 50)):
+    """시야 원뿔 스프라이트를 한 번만 그려서 캐시에 보관하고 반환
     Args:
-        screen: pygame.Surface, 시야를 그릴 대상 Surface
-        x, y: float, 시야의 시작점 좌표
         angle: float, 시야의 중심 각도 (도)
         fov: float, 시야각 (도)
         dist: float, 시야 거리
         color: tuple, 시야 색상 (RGBA)
+    Returns:
+        tuple, (원뿔 Surface, 스프라이트 안에서의 꼭짓점 좌표)
     """
-    # 시야 원뿔을 그릴 투명한 Surface 생성
-    cone_surface = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
+    angle = round(angle) % 360  # 1도 단위로 양자화해서 캐시 크기 제한
+    key = (angle, fov, dist, tuple(color))
+    cached = _vision_cone_cache.get(key)
+    if cached is not None:
+        return cached
     
     # 시작과 끝 각도 계산 (라디안)
     start_angle = math.radians(angle - fov/2)
     end_angle = math.radians(angle + fov/2)
     
-    # 원뿔의 꼭짓점들 계산
-    points = [(x, y)]
+    # 꼭짓점 (0, 0) 기준으로 원뿔의 점들 계산
+    points = [(0.0, 0.0)]
     step = math.radians(15)  # 15도 간격으로 점 생성
     
     current_angle = start_angle
     while current_angle <= end_angle:
-        px = x + math.cos(current_angle) * dist
-        py = y + math.sin(current_angle) * dist
-        points.append((px, py))
+        points.append((math.cos(current_angle) * dist, math.sin(current_angle) * dist))
         current_angle += step
     
     # 마지막 점 추가
-    px = x + math.cos(end_angle) * dist
-    py = y + math.sin(end_angle) * dist
-    points.append((px, py))
+    points.append((math.cos(end_angle) * dist, math.sin(end_angle) * dist))
+    
+    # 원뿔을 감싸는 최소 크기의 Surface 생성 (테두리 두께만큼 여유)
+    min_x = math.floor(min(px for px, _ in points)) - 2
+    min_y = math.floor(min(py for _, py in points)) - 2
+    max_x = math.ceil(max(px for px, _ in points)) + 2
+    max_y = math.ceil(max(py for _, py in points)) + 2
+    cone_surface = pygame.Surface((max_x - min_x, max_y - min_y), pygame.SRCALPHA)
+    local_points = [(px - min_x, py - min_y) for px, py in points]
     
     # 원뿔 그리기
-    pygame.draw.polygon(cone_surface, color, points)
-    pygame.draw.polygon(cone_surface, (color[0], color[1], color[2], 255), points, 2)
+    pygame.draw.polygon(cone_surface, color, local_points)
+    pygame.draw.polygon(cone_surface, (color[0], color[1], color[2], 255), local_points, 2)
     
-    # 화면에 블렌딩
-    screen.blit(cone_surface, (0, 0))
+    cached = (cone_surface, (-min_x, -min_y))
+    _vision_cone_cache[key] = cached
+    return cached
 
-def draw_snake(screen, snake, show_emotion=False):
-    if not snake.alive:
+def draw_vision_cone(screen, x, y, angle, fov, dist, color=(255, 0, 0, 50)):
+    """시야 원뿔을 그리는 함수 (미리 그려둔 스프라이트를 머리 위치에 블릿)
+    Args:
+        screen: pygame.Surface, 시야를 그릴 대상 Surface
+        x, y: float, 시야의 시작점 좌표
+        angle: float, 시야의 중심 각도 (도)
+        fov: float, 시야각 (도)
+        dist: float, 시야 거리
+        color: tuple, 시야 색상 (RGBA)
+    """
+    cone_surface, (apex_x, apex_y) = get_vision_cone_sprite(angle, fov, dist, color)
+    dest = pygame.Rect(int(x) - apex_x, int(y) - apex_y, cone_surface.get_width(), cone_surface.get_height())
+    
+    # 화면 밖에 있는 원뿔은 그리지 않음
+    if not dest.colliderect(screen.get_rect()):
         return
-        
+    
+    # 화면에 블렌딩
+    screen.blit(cone_surface, dest)
+
+def get_snake_alpha(snake):
+    """뱀 몸통을 그릴 때 사용할 알파값 반환 (255면 불투명)"""
+    # 렌더링 품질을 낮춘 상태에서는 블렌딩 없이 불투명하게 그림
+    if not get_quality_controller().segment_alpha:
+        return 255
     # 깜빡이는 효과는 Tank의 일회용 면역이 활성화되었을 때만 적용
     if snake.evolution_form == "TANK" and snake.tank_immunity_active:
         if pygame.time.get_ticks() % 200 < 100:  # 깜빡이는 효과
-            alpha = 128
-        else:
-            alpha = 255
+            return 128
+        return 255
     # 다른 무적 상태에서는 반투명 효과만 적용
-    elif snake.collision_immune:
-        alpha = 180
-    else:
-        alpha = 255
+    if snake.collision_immune:
+        return 180
+    return 255
+
+@profile_point("render.snake")
+def draw_snake(screen, snake, show_emotion=False):
+    if not snake.alive:
+        return
+        
+    alpha = get_snake_alpha(snake)
     
     # 시야 원뿔 그리기 (시뮬레이션 모드에서만)
     if show_emotion and snake.is_ai:
@@ -1033,12 +1402,16 @@ def draw_snake(screen, snake, show_emotion=False):
         angle = get_angle_from_direction(snake.direction)
         draw_vision_cone(screen, head_x, head_y, angle, snake.vision_angle, snake.vision_range)
     
-    # 뱀 그리기
-    for segment in snake.body:
-        s = pygame.Surface((CELL_SIZE, CELL_SIZE))
-        s.fill(snake.color)
-        s.set_alpha(alpha)
-        screen.blit(s, (segment[0], segment[1]))
+    # 뱀 그리기 (불투명하면 Surface 없이 바로 채움)
+    if alpha >= 255:
+        for segment in snake.body:
+            screen.fill(snake.color, (segment[0], segment[1], CELL_SIZE, CELL_SIZE))
+    else:
+        for segment in snake.body:
+            s = pygame.Surface((CELL_SIZE, CELL_SIZE))
+            s.fill(snake.color)
+            s.set_alpha(alpha)
+            screen.blit(s, (segment[0], segment[1]))
     
     if show_emotion:
         fm = get_font_manager()
@@ -1047,21 +1420,44 @@ def draw_snake(screen, snake, show_emotion=False):
         txt = font.render(snake.emotion, True, emotion_color)
         screen.blit(txt, (snake.get_head()[0] + 10, snake.get_head()[1] - 5))
 
+def plannable_ai_indices(snakes):
+    """
+    AI 계획 워커에 맡길 뱀 인덱스 (ai_decide_direction이 음식 찾기로 갈 AI 뱀만)
+
+    플레이어를 쫓는 중이거나 이번 틱에 추적을 시작할 뱀은 추적 상태를 갱신해야 하므로 기존 AI가 맡는다.
+    """
+    player = next((snake for snake in snakes if not snake.is_ai and snake.alive), None)
+    indices = []
+    for index, snake in enumerate(snakes):
+        if not snake.is_ai or not snake.alive or isinstance(snake, BossSnake) or snake.is_chasing:
+            continue
+        if player is not None and snake.energy > CHASE_ENERGY_THRESHOLD:
+            head_x, head_y = snake.get_head()
+            player_x, player_y = player.get_head()
+            if math.hypot(player_x - head_x, player_y - head_y) < PLAYER_DETECTION_RANGE:
+                continue
+        indices.append(index)
+    return indices
+
+@profile_point("collisions")
 def handle_collisions(snakes):
+    """뱀끼리의 머리-머리, 머리-몸통 충돌 처리"""
     for snake in snakes:
         if not snake.alive:
             continue
         head_x, head_y = snake.get_head()
+        # 머리 칸에 자기 머리 말고 아무 몸통도 없으면 부딪힐 상대가 없음
+        if snake.arena.count(BODIES, head_x, head_y) == 1:
+            continue
         for other in snakes:
             if not other.alive or snake == other:
                 continue
             # 보스(BossSnake)는 일반 충돌로 죽지 않음
             if isinstance(snake, BossSnake) or isinstance(other, BossSnake):
                 continue
-            # 머리끼리 충돌
+            # 머리끼리 충돌 (같은 칸)
             other_head_x, other_head_y = other.get_head()
-            head_distance = math.sqrt((head_x - other_head_x)**2 + (head_y - other_head_y)**2)
-            if head_distance < CELL_SIZE:
+            if head_x == other_head_x and head_y == other_head_y:
                 snake_immune = snake.handle_collision(other) if snake.tank_immunity_active else snake.collision_immune
                 other_immune = other.handle_collision(snake) if other.tank_immunity_active else other.collision_immune
                 if not snake_immune:
@@ -1069,11 +1465,9 @@ def handle_collisions(snakes):
                 if not other_immune:
                     other.alive = False
                 continue
-            # 몸통 충돌
+            # 몸통 충돌 (머리가 몸통 세그먼트와 같은 칸)
             for segment in other.body[1:]:
-                segment_x, segment_y = segment
-                distance = math.sqrt((head_x - segment_x)**2 + (head_y - segment_y)**2)
-                if distance < CELL_SIZE:
+                if segment[0] == head_x and segment[1] == head_y:
                     if snake.tank_immunity_active:
                         snake.handle_collision(other)
                         break
@@ -1084,23 +1478,9 @@ def handle_collisions(snakes):
                             other.add_exp(300)
                     break
 
-def save_score(name, score):
-    try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            board = json.load(f)
-    except:
-        board = []
-
-    board.append({
-        "name": name,
-        "score": score,
-        "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-
-    board = sorted(board, key=lambda x: x["score"], reverse=True)[:3]
-    
-    with open(LEADERBOARD_FILE, 'w') as f:
-        json.dump(board, f, indent=2)
+def save_score(name, score, mode="CLASSIC"):
+    """점수를 점수 저장소(SQLite)에 기록 (백그라운드 기록 큐로 넘기고 바로 반환)"""
+    get_background_writer().submit(get_score_store().add_score, name, score, mode)
 
 def get_angle_from_direction(direction):
     if direction == 'RIGHT': return 0
@@ -1115,47 +1495,145 @@ def angle_diff(a, b):
         d -= 360
     return d
 
-def draw_minimap(screen, snakes, food_list):
-    """미니맵 그리기"""
-    # 미니맵 크기와 위치 설정
-    map_size = 150
-    margin = 20
-    map_x = WIDTH - map_size - margin
-    map_y = HEIGHT - map_size - margin
-    
-    # 미니맵 배경
-    pygame.draw.rect(screen, (50, 50, 50), 
-                    (map_x, map_y, map_size, map_size))
-    pygame.draw.rect(screen, WHITE, 
-                    (map_x, map_y, map_size, map_size), 1)
-    
-    # 스케일 계산
-    scale_x = map_size / WIDTH
-    scale_y = map_size / HEIGHT
+class MinimapLayer:
+    """
+    미니맵 레이어
     
-    # 음식 그리기 (흰 점)
-    for food in food_list:
-        if isinstance(food, SpecialItem):
-            color = food.color
-            size = 3
+    점유/밀도 배열을 pygame.surfarray로 한 번에 Surface에 옮겨 낮은 주기로만 다시 만들고,
+    매 프레임에는 캐시된 Surface 하나만 블릿하므로 개체 수와 관계없이 그리기 비용이 일정하다.
+    numpy가 없으면 같은 주기로 draw 호출 방식으로 다시 만든다.
+    """
+    def __init__(self, map_size=MINIMAP_SIZE, refresh_interval=MINIMAP_REFRESH_INTERVAL,
+                 view_mode=MINIMAP_VIEW_MODE):
+        self.map_size = map_size
+        self.refresh_interval = refresh_interval  # 다시 만드는 주기 (프레임)
+        self.view_mode = view_mode  # "HEADS", "BODIES", "HEATMAP"
+        self.surface = pygame.Surface((map_size, map_size))
+        self.frames_until_refresh = 0
+        self.scale_x = map_size / WIDTH
+        self.scale_y = map_size / HEIGHT
+
+    def invalidate(self):
+        """다음 draw 호출에서 바로 다시 만들도록 표시"""
+        self.frames_until_refresh = 0
+
+    def draw(self, screen, snakes, food_list, margin=20):
+        """필요할 때만 레이어를 갱신하고 화면 오른쪽 아래에 블릿"""
+        if self.frames_until_refresh <= 0:
+            self.rebuild(snakes, food_list)
+            # 렌더링 품질을 낮춘 상태에서는 갱신 주기를 늘림
+            interval = self.refresh_interval * get_quality_controller().minimap_interval_factor
+            self.frames_until_refresh = max(1, interval)
+        self.frames_until_refresh -= 1
+        
+        map_x = WIDTH - self.map_size - margin
+        map_y = HEIGHT - self.map_size - margin
+        screen.blit(self.surface, (map_x, map_y))
+        pygame.draw.rect(screen, WHITE, (map_x, map_y, self.map_size, self.map_size), 1)
+
+    def rebuild(self, snakes, food_list):
+        """현재 월드 상태로 미니맵 Surface를 다시 만듦"""
+        if np is None:
+            self.rebuild_with_draw(snakes, food_list)
         else:
-            color = WHITE
-            size = 1
-        x = map_x + int(food.x * scale_x)
-        y = map_y + int(food.y * scale_y)
-        pygame.draw.circle(screen, color, (x, y), size)
-    
-    # 뱀 그리기
-    for snake in snakes:
-        if not snake.alive:
-            continue
-        head = snake.get_head()
-        x = map_x + int(head[0] * scale_x)
-        y = map_y + int(head[1] * scale_y)
-        color = snake.color
-        # 플레이어는 더 크게 표시
-        size = 4 if not snake.is_ai else 2
-        pygame.draw.circle(screen, color, (x, y), size)
+            self.rebuild_with_surfarray(snakes, food_list)
+
+    def to_map_indices(self, points):
+        """월드 좌표 배열 (N, 2)을 미니맵 픽셀 인덱스로 변환"""
+        xs = np.clip((points[:, 0] * self.scale_x).astype(np.int32), 0, self.map_size - 1)
+        ys = np.clip((points[:, 1] * self.scale_y).astype(np.int32), 0, self.map_size - 1)
+        return xs, ys
+
+    def stamp(self, grid, xs, ys, color, radius=0):
+        """미니맵 픽셀 위치에 (2 * radius + 1) 크기의 사각 점을 찍음"""
+        for ox in range(-radius, radius + 1):
+            for oy in range(-radius, radius + 1):
+                px = np.clip(xs + ox, 0, self.map_size - 1)
+                py = np.clip(ys + oy, 0, self.map_size - 1)
+                grid[px, py] = color
+
+    def rebuild_with_surfarray(self, snakes, food_list):
+        """numpy 배열에 미니맵을 그린 뒤 surfarray로 한 번에 옮김"""
+        grid = np.empty((self.map_size, self.map_size, 3), dtype=np.uint8)
+        grid[:] = MINIMAP_BACKGROUND
+        alive_snakes = [snake for snake in snakes if snake.alive]
+        
+        if self.view_mode == "HEATMAP":
+            # 모든 몸통 셀의 밀도를 로그 스케일로 색칠
+            counts = np.zeros((self.map_size, self.map_size), dtype=np.float32)
+            for snake in alive_snakes:
+                xs, ys = self.to_map_indices(np.asarray(snake.body, dtype=np.float32))
+                np.add.at(counts, (xs, ys), 1)
+            if counts.any():
+                heat = np.log1p(counts) / np.log1p(counts.max())
+                mask = counts > 0
+                grid[mask, 0] = (80 + 175 * heat[mask]).astype(np.uint8)
+                grid[mask, 1] = (200 * heat[mask] ** 2).astype(np.uint8)
+                grid[mask, 2] = 40
+        elif self.view_mode == "BODIES":
+            for snake in alive_snakes:
+                xs, ys = self.to_map_indices(np.asarray(snake.body, dtype=np.float32))
+                grid[xs, ys] = snake.color
+        
+        # 음식 (일반: 흰 점, 특수 아이템: 고유 색상의 큰 점)
+        if food_list:
+            foods = np.array([(food.x, food.y) for food in food_list], dtype=np.float32)
+            xs, ys = self.to_map_indices(foods)
+            self.stamp(grid, xs, ys, WHITE)
+            for food, x, y in zip(food_list, xs, ys):
+                if isinstance(food, SpecialItem):
+                    self.stamp(grid, x, y, food.color, radius=1)
+        
+        # 머리 위치 (플레이어는 더 크게 표시, 마지막에 찍어서 항상 위에 보이도록)
+        for snake in sorted(alive_snakes, key=lambda s: not s.is_ai):
+            xs, ys = self.to_map_indices(np.asarray([snake.get_head()], dtype=np.float32))
+            self.stamp(grid, xs, ys, snake.color, radius=1 if snake.is_ai else 2)
+        
+        pygame.surfarray.blit_array(self.surface, grid)
+
+    def rebuild_with_draw(self, snakes, food_list):
+        """numpy가 없을 때 draw 호출로 미니맵을 다시 만듦"""
+        self.surface.fill(MINIMAP_BACKGROUND)
+        
+        # 음식 그리기 (흰 점)
+        for food in food_list:
+            if isinstance(food, SpecialItem):
+                color = food.color
+                size = 3
+            else:
+                color = WHITE
+                size = 1
+            x = int(food.x * self.scale_x)
+            y = int(food.y * self.scale_y)
+            pygame.draw.circle(self.surface, color, (x, y), size)
+        
+        # 뱀 그리기
+        for snake in snakes:
+            if not snake.alive:
+                continue
+            if self.view_mode != "HEADS":
+                for segment in snake.body:
+                    self.surface.set_at((int(segment[0] * self.scale_x), int(segment[1] * self.scale_y)), snake.color)
+            head = snake.get_head()
+            x = int(head[0] * self.scale_x)
+            y = int(head[1] * self.scale_y)
+            # 플레이어는 더 크게 표시
+            size = 4 if not snake.is_ai else 2
+            pygame.draw.circle(self.surface, snake.color, (x, y), size)
+
+# 전역 미니맵 레이어 인스턴스
+minimap_layer = None
+
+def get_minimap_layer():
+    """미니맵 레이어 싱글톤 반환"""
+    global minimap_layer
+    if minimap_layer is None:
+        minimap_layer = MinimapLayer()
+    return minimap_layer
+
+def draw_minimap(screen, snakes, food_list):
+    """미니맵 그리기 (캐시된 레이어를 블릿하고 설정된 주기마다 갱신)"""
+    get_minimap_layer().draw(screen, snakes, food_list)
 
 def draw_stats(screen, snake):
     """스탯 UI 그리기"""
@@ -1209,12 +1687,13 @@ def draw_stats(screen, snake):
 
 def spawn_special_item(food_list, snakes):
     """특수 아이템 생성"""
-    while True:
-        x = random.randint(0, (WIDTH - CELL_SIZE) // CELL_SIZE) * CELL_SIZE
-        y = random.randint(0, (HEIGHT - CELL_SIZE) // CELL_SIZE) * CELL_SIZE
-        if all(not [x, y] in s.body for s in snakes):
-            food_list.append(SpecialItem(x, y))
-            break
+    arena = get_arena()
+    cell = arena.sample_free_cell()
+    if cell is None:
+        return
+    item = SPECIAL_ITEM_POOL.acquire(cell[0], cell[1])
+    food_list.append(item)
+    arena.add_food(item)
 
 def draw_game_ui(screen, player, snakes, game_mode, food_list=None):
     """게임 UI 그리기"""
@@ -1334,6 +1813,15 @@ BOSS_EVOLUTION_TIME = {
     "PHASE3": 5400   # 6분 (15fps * 360초) - 최종 페이즈
 }
 
+# 보스 투사체 발사 대기 시간 (틱, 페이즈별)
+BOSS_PROJECTILE_COOLDOWN = {
+    1: 75,  # 5초마다 단일 투사체
+    2: 45,  # 3초마다 2발
+    3: 45   # 3연발 후 3초 대기
+}
+BOSS_BURST_INTERVAL = 5  # 3페이즈 연속 발사 간격 (틱)
+BOSS_CHARGE_DAMAGE = 10  # 돌진(F) 적중 시 보스 피해량
+
 BOSS_PATTERNS = {
     "NORMAL": {
         "color": PURPLE,
@@ -1357,7 +1845,16 @@ BOSS_PATTERNS = {
 
 class Projectile:
     """보스의 투사체 클래스"""
+
+    __slots__ = ("x", "y", "dx", "dy", "speed", "size", "alive", "color", "serial")
+
+    serials = itertools.count(1)  # 풀에서 재사용돼도 발사마다 새 번호 (객체 id 대신 식별용)
+
     def __init__(self, x, y, target_x, target_y, speed=5, is_circular=False):
+        self.reset(x, y, target_x, target_y, speed, is_circular)
+
+    def reset(self, x, y, target_x, target_y, speed=5, is_circular=False):
+        self.serial = next(Projectile.serials)
         self.x = float(x)
         self.y = float(y)
         if is_circular:
@@ -1387,13 +1884,20 @@ class Projectile:
             self.y < 0 or self.y > HEIGHT):
             self.alive = False
 
+PROJECTILE_POOL = ObjectPool(Projectile)
+
 class BossSnake(Snake):
     """보스 스네이크 클래스"""
+
+    attack_cooldown = Countdown()
+    projectile_cooldown = Countdown()
+    global_attack_timer = Countdown(on_expire="end_global_attack")
+
     def __init__(self, x, y):
         super().__init__(x, y, color=PURPLE, name="BOSS", is_ai=True)
         self.init_boss_attributes()
         # 경고음 관련 속성 추가
-        self.warning_sound = pygame.mixer.Sound("warning_sound.mp3")
+        self.warning_sound = get_asset_manager().get_sound("warning")  # 공유 핸들 (믹서가 없으면 None)
         self.warning_duration = None  # 경고음 길이 (밀리초)
         self.warning_start_time = 0  # 경고음 시작 시간
         self.is_warning = False  # 경고음 재생 중 여부
@@ -1416,7 +1920,7 @@ class BossSnake(Snake):
         self.attack_cooldown = 0
         self.dash_cooldown = 0
         self.current_attack = None
-        self.projectile_cooldown = 75  # 5초 (15fps * 5)
+        self.projectile_cooldown = BOSS_PROJECTILE_COOLDOWN[1]  # 5초 (15fps * 5)
         self.projectiles = []  # 투사체 리스트
         self.circular_shot_count = 8  # 기본 원형 탄막 발사 수
         self.enhanced_circular_mode = False  # 강화된 원형 탄막 모드
@@ -1426,9 +1930,8 @@ class BossSnake(Snake):
         
         # 크기 증가
         self.size_multiplier = 2
-        self.body = [[self.body[0][0], self.body[0][1]]]  # 초기 크기는 1로 시작
-        self.body.append([self.body[0][0] - CELL_SIZE, self.body[0][1]])
-        self.body.append([self.body[0][0] - CELL_SIZE * 2, self.body[0][1]])
+        head_x, head_y = self.body[0]
+        self.set_body([[head_x, head_y], [head_x - CELL_SIZE, head_y], [head_x - CELL_SIZE * 2, head_y]])
         
         # 무한 스태미나
         self.energy = float('inf')
@@ -1436,6 +1939,7 @@ class BossSnake(Snake):
         # 이동 관련
         self.move_delay = 0
 
+    @profile_point("boss.update_state")
     def update_boss_state(self, player):
         """보스 상태 업데이트"""
         if not self.alive:
@@ -1465,30 +1969,22 @@ class BossSnake(Snake):
         elif self.survival_time >= BOSS_EVOLUTION_TIME["PHASE2"] and self.phase < 2:
             self.evolve_boss(2, player)
         
-        # 쿨다운 감소
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
-        if self.dash_cooldown > 0:
-            self.dash_cooldown -= 1
-            
-        # 투사체 발사
-        if self.projectile_cooldown > 0:
-            self.projectile_cooldown -= 1
-        else:
+        # 투사체 발사 (쿨다운은 타이머 휠이 줄임)
+        if self.projectile_cooldown <= 0:
             if self.phase == 1:  # 1페이즈: 5초마다 단일 투사체
                 self.shoot_projectile(player)
-                self.projectile_cooldown = 75  # 5초
+                self.reload(BOSS_PROJECTILE_COOLDOWN[1])  # 5초
             elif self.phase == 2:  # 2페이즈: 3초마다 2발씩 발사
                 self.shoot_projectile(player)
                 self.shoot_projectile(player)
-                self.projectile_cooldown = 45  # 3초
+                self.reload(BOSS_PROJECTILE_COOLDOWN[2])  # 3초
             elif self.phase >= 3:  # 3페이즈: 원형 탄막 + 전체 공격
                 self.shoot_projectile(player)  # 원형 탄막 발사
                 if self.burst_count >= self.max_bursts:
-                    self.projectile_cooldown = 45  # 3초 후 다음 3연발
+                    self.reload(BOSS_PROJECTILE_COOLDOWN[3])  # 3초 후 다음 3연발
                     self.burst_count = 0
                 else:
-                    self.projectile_cooldown = 5  # 연속 발사 간격
+                    self.reload(BOSS_BURST_INTERVAL)  # 연속 발사 간격
                     self.burst_count += 1
             
             # 60초마다 전체 공격
@@ -1504,21 +2000,31 @@ class BossSnake(Snake):
                 self.global_attack_timer = 30  # 2초간 공격 지속
                 self.message = "전체 공격 개시!"
                 self.message_duration = 30
-        
-        if self.is_global_attack:
-            self.global_attack_timer -= 1
-            if self.global_attack_timer <= 0:
-                self.is_global_attack = False
-                self.safe_zone = None
+
+    def reload(self, cooldown):
+        """발사 후 대기 - 발사한 틱 다음부터 cooldown틱이 지난 뒤 발사 (틱 도중 예약이라 이번 틱을 1틱 더함)"""
+        self.projectile_cooldown = cooldown + 1
+
+    def end_global_attack(self):
+        """전체 공격 시간 만료"""
+        self.is_global_attack = False
+        self.safe_zone = None
+
+    def dash_expired(self):
+        """보스 대시는 지속 시간이 끝나도 유지 (기존처럼 dash() 재호출이나 페이즈 전환 때만 해제)"""
 
     def play_warning(self):
         """경고음 재생 및 관련 상태 설정"""
         if not self.is_warning:
-            self.warning_sound.play()
-            self.warning_duration = int(self.warning_sound.get_length() * 1000)  # 밀리초 단위로 변환
+            if self.warning_sound is not None:
+                self.warning_sound.play()
+                self.warning_duration = int(self.warning_sound.get_length() * 1000)  # 밀리초 단위로 변환
+            else:
+                self.warning_duration = 0
             self.warning_start_time = pygame.time.get_ticks()
             self.is_warning = True
 
+    @profile_point("boss.global_attack")
     def start_global_attack(self, player):
         """전체 공격 시작"""
         if not self.is_warning and not self.is_global_attack:
@@ -1534,6 +2040,7 @@ class BossSnake(Snake):
             self.message = "전체 공격 준비 중! 안전 구역으로 이동하세요!"
             self.message_duration = 60
 
+    @profile_point("boss.shoot_projectile")
     def shoot_projectile(self, player):
         """투사체 발사 - 플레이어를 향해"""
         if not player.alive:
@@ -1543,7 +2050,7 @@ class BossSnake(Snake):
         if self.phase <= 2:
             # 1,2페이즈: 플레이어 추적 투사체
             player_x, player_y = player.get_head()
-            self.projectiles.append(Projectile(head_x, head_y, player_x, player_y, speed=3 + self.phase))
+            self.projectiles.append(PROJECTILE_POOL.acquire(head_x, head_y, player_x, player_y, speed=3 + self.phase))
         else:
             # 3페이즈: 회전하는 원형 탄막
             shot_count = self.enhanced_shot_count if self.enhanced_circular_mode else self.circular_shot_count
@@ -1553,15 +2060,19 @@ class BossSnake(Snake):
                 angle = (2 * math.pi * i) / shot_count + base_rotation  # 기본 회전 각도 추가
                 dx = math.cos(angle)
                 dy = math.sin(angle)
-                self.projectiles.append(Projectile(head_x, head_y, dx, dy, speed=4, is_circular=True))
+                self.projectiles.append(PROJECTILE_POOL.acquire(head_x, head_y, dx, dy, speed=4, is_circular=True))
 
+    @profile_point("boss.update_projectiles")
     def update_projectiles(self):
         """투사체 업데이트"""
         for projectile in self.projectiles[:]:  # 리스트 복사본으로 반복
             projectile.move()
             if not projectile.alive:
                 self.projectiles.remove(projectile)
+                PROJECTILE_POOL.release(projectile)
+        self.arena.set_projectiles(self.projectiles)
 
+    @profile_point("boss.evolve")
     def evolve_boss(self, new_phase, player=None):
         """보스 진화"""
         self.phase = new_phase
@@ -1577,28 +2088,28 @@ class BossSnake(Snake):
             if player is not None:
                 target_len = max(3, int(len(player.body) * 2))
                 if len(self.body) < target_len:
-                    while len(self.body) < target_len:
-                        self.body.append(self.body[-1][:])
+                    self.grow_tail(target_len - len(self.body))
                 elif len(self.body) > target_len:
-                    self.body = self.body[:target_len]
+                    self.set_body(self.body[:target_len])
         elif new_phase == 3:
             self.pattern = "EVOLVED2"
             self.size_multiplier = 2.5
             self.message = "보스가 최종 형태에 도달했습니다! 원형 탄막과 대시 능력 사용 시작작!"
             # 3페이즈 진입 시 경고음 재생
-            self.warning_sound.play()
+            if self.warning_sound is not None:
+                self.warning_sound.play()
             # 페이즈3 진입 시 플레이어 길이의 4배로 맞춤(최소 3)
             if player is not None:
                 target_len = max(3, int(len(player.body) * 4))
                 if len(self.body) < target_len:
-                    while len(self.body) < target_len:
-                        self.body.append(self.body[-1][:])
+                    self.grow_tail(target_len - len(self.body))
                 elif len(self.body) > target_len:
-                    self.body = self.body[:target_len]
+                    self.set_body(self.body[:target_len])
         # 진화 시 몸 크기 조정 메시지
-        self.body = [[x, y] for x, y in self.body]
+        self.set_body([[x, y] for x, y in self.body])
         self.message_duration = 60
 
+    @profile_point("boss.ai_behavior")
     def boss_ai_behavior(self, player, food_list):
         """보스 AI 행동 결정"""
         if not self.alive or not player.alive:
@@ -1657,6 +2168,7 @@ class BossSnake(Snake):
                 self.dash_duration = 45  # 대시 지속시간 증가(3초)
                 self.dash_cooldown = 30  # 더 짧은 쿨타임(2초)
 
+    @profile_point("boss.move")
     def move(self, food_list, snakes, tick):
         """보스 이동 처리"""
         if self.move_delay > 0:
@@ -1682,7 +2194,7 @@ class BossSnake(Snake):
         next_y = max(0, min(next_y, HEIGHT - CELL_SIZE))
         
         # 새로운 머리 위치 추가
-        self.body.insert(0, [next_x, next_y])
+        self.push_head([next_x, next_y])
         
         # 음식 충돌 체크
         foods_to_remove = []
@@ -1694,18 +2206,16 @@ class BossSnake(Snake):
                 foods_to_remove.append(food)
                 if self.phase == 1:  # 1페이즈에서만 성장
                     # 일반 음식은 1, 황금 음식은 2만큼 성장
-                    growth = 2 if food.is_item else 1
-                    for _ in range(growth):
-                        self.body.append(self.body[-1][:])
+                    self.grow_tail(2 if food.is_item else 1)
                 break
         
         # 음식 제거
         for food in foods_to_remove:
             if food in food_list:
-                food_list.remove(food)
+                remove_food(food_list, food)
         
         if not foods_to_remove:  # 음식을 먹지 않았을 때만 꼬리 제거
-            self.body.pop()
+            self.pop_tail()
         
         # 무한 스태미나 유지
         self.energy = float('inf')
@@ -1714,6 +2224,7 @@ class BossSnake(Snake):
         if self.phase == 2:
             self.move_delay = 1  # 1틱 대기
 
+@profile_point("boss.collision")
 def handle_boss_collision(boss, player):
     """보스 충돌 처리"""
     if not boss.alive or not player.alive:
@@ -1741,6 +2252,8 @@ def handle_boss_collision(boss, player):
             player.message = "보스의 투사체에 맞았습니다!"
             player.message_duration = 60
             boss.projectiles.remove(projectile)
+            PROJECTILE_POOL.release(projectile)
+            boss.arena.set_projectiles(boss.projectiles)
             return
     
     # 플레이어와 보스 충돌
@@ -1749,8 +2262,8 @@ def handle_boss_collision(boss, player):
         # 돌진 모드일 때만 보스에게 데미지
         if getattr(player, 'is_charging', False):
             prev_health = boss.health  # 이전 체력 저장
-            boss.health -= 10 
-            player.message = f"보스에게 10 데미지! (체력: {prev_health} -> {boss.health})"
+            boss.health -= BOSS_CHARGE_DAMAGE
+            player.message = f"보스에게 {BOSS_CHARGE_DAMAGE} 데미지! (체력: {prev_health} -> {boss.health})"
             player.message_duration = 45
             if boss.health <= 0:
                 boss.alive = False
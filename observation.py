@@ -0,0 +1,307 @@
+"""
+Snake Game - 격자 관측 텐서
+GameWorld 상태를 (채널, 행, 열) NumPy 배열로 유지하는 관측 빌더.
+
+매 틱 Snake.body 목록 전체로 배열을 다시 만들지 않고, 바뀐 부분만 갱신한다.
+    - 뱀: 몸통은 머리 쪽에 insert(0), 꼬리에서 pop()만 일어나므로
+          이전 머리 조각 객체의 위치로 추가된 머리 수를 찾고, 길이 차이로 꼬리 변화를 계산
+          (몸통 목록이 통째로 바뀐 경우만 그 뱀을 다시 그림)
+    - 음식/아이템: 객체 단위로 생김/없어짐만 반영
+                  (객체 풀에서 재사용된 객체는 위치/종류가 달라졌으면 없어졌다 생긴 것으로 처리)
+    - 투사체: 개수가 적으므로 이전 칸을 지우고 새 칸만 표시
+    - 안전 지대: 영역이 바뀔 때만 다시 칠함
+
+값은 칸에 있는 조각 수(0이면 비어 있음)이고, planes / plane() / crop()은 모두 복사 없는 view를 돌려준다.
+view는 다음 update() 때 내용이 바뀌므로 보관하려면 직접 복사해야 한다.
+
+사용 예:
+    builder = ObservationBuilder(world, player_id, crop_radius=15)
+    world.step()
+    planes = builder.update()        # (채널, 76, 102)
+    local = builder.crop()           # 플레이어 머리 중심 (채널, 31, 31)
+"""
+
+from collections import deque
+import numpy as np
+from module import CELL_SIZE, WIDTH, HEIGHT
+from world import SPECIAL_ITEM_TYPES, get_food_kind
+
+GRID_COLUMNS = WIDTH // CELL_SIZE
+GRID_ROWS = HEIGHT // CELL_SIZE
+
+# 채널 순서 (food, golden_items, special_*는 get_food_kind 번호 순서와 같게 연속 배치)
+CHANNELS = (
+    ("own_body", "other_bodies", "heads", "food", "golden_items")
+    + tuple("special_" + item_type.lower() for item_type in SPECIAL_ITEM_TYPES)
+    + ("projectiles", "boss_body", "safe_zone")
+)
+CHANNEL_INDEX = {name: index for index, name in enumerate(CHANNELS)}
+OWN_BODY = CHANNEL_INDEX["own_body"]
+OTHER_BODIES = CHANNEL_INDEX["other_bodies"]
+HEADS = CHANNEL_INDEX["heads"]
+FOOD = CHANNEL_INDEX["food"]
+GOLDEN_ITEMS = CHANNEL_INDEX["golden_items"]
+SPECIAL_ITEMS_START = CHANNEL_INDEX["golden_items"] + 1
+PROJECTILES = CHANNEL_INDEX["projectiles"]
+BOSS_BODY = CHANNEL_INDEX["boss_body"]
+SAFE_ZONE = CHANNEL_INDEX["safe_zone"]
+
+MAX_HEAD_PUSH = 4  # 한 번 갱신 사이에 머리가 이 개수보다 많이 추가되면 다시 그림
+
+def to_cell(x, y):
+    """픽셀 좌표를 (행, 열) 격자 칸으로 변환 (화면 밖은 가장자리 칸)"""
+    column = min(max(int(x) // CELL_SIZE, 0), GRID_COLUMNS - 1)
+    row = min(max(int(y) // CELL_SIZE, 0), GRID_ROWS - 1)
+    return row, column
+
+def food_channel(food):
+    """음식 종류별 채널 번호"""
+    return FOOD + get_food_kind(food)
+
+class SnakeTrack:
+    """관측 배열에 반영된 뱀 하나의 상태"""
+
+    __slots__ = ("snake", "channel", "body", "head", "cells", "head_cell")
+
+    def __init__(self, snake, channel):
+        self.snake = snake
+        self.channel = channel
+        self.body = None        # 반영한 몸통 목록 객체 (통째로 바뀌었는지 확인용)
+        self.head = None        # 반영한 머리 조각 객체
+        self.cells = deque()    # 몸통 순서대로의 칸
+        self.head_cell = None
+
+class ObservationBuilder:
+    """월드 하나의 채널 평면을 증분 갱신"""
+
+    def __init__(self, world, player_id=None, crop_radius=0):
+        """
+        Args:
+            world: GameWorld - 관측할 월드
+            player_id: int - own_body로 표시할 플레이어 번호 (None이면 모든 뱀이 other_bodies)
+            crop_radius: int - crop()에 쓸 최대 반경 (칸). 이만큼 가장자리를 0으로 덧대서 보관
+        """
+        self.world = world
+        self.player_id = player_id
+        self.crop_radius = crop_radius
+        pad = crop_radius
+        self.buffer = np.zeros((len(CHANNELS), GRID_ROWS + 2 * pad, GRID_COLUMNS + 2 * pad), dtype=np.uint16)
+        self.planes = self.buffer[:, pad:pad + GRID_ROWS, pad:pad + GRID_COLUMNS]
+        self.tracks = {}        # id(snake) -> SnakeTrack
+        self.food_cells = {}    # id(food) -> (food, 채널, 행, 열, x, y, 종류) - 풀에서 재사용된 객체 구분용
+        self.projectile_cells = []
+        self.safe_zone = None
+        self.rebuild()
+
+    def rebuild(self):
+        """전체를 처음부터 다시 채움 (월드를 통째로 바꿨을 때)"""
+        self.buffer[:] = 0
+        self.tracks.clear()
+        self.food_cells.clear()
+        self.projectile_cells = []
+        self.safe_zone = None
+        self.update()
+
+    def plane(self, name):
+        """채널 이름으로 (행, 열) view 반환"""
+        return self.planes[CHANNEL_INDEX[name]]
+
+    def player(self):
+        if self.player_id is None:
+            return None
+        return self.world.players.get(self.player_id)
+
+    def update(self):
+        """
+        월드의 현재 상태를 반영 (world.step() 뒤에 호출)
+
+        Returns:
+            numpy.ndarray: (채널, 행, 열) view
+        """
+        self.update_snakes()
+        self.update_food()
+        self.update_projectiles()
+        self.update_safe_zone()
+        return self.planes
+
+    def snake_channel(self, snake):
+        if snake is self.world.boss:
+            return BOSS_BODY
+        if self.player_id is not None and snake is self.player():
+            return OWN_BODY
+        return OTHER_BODIES
+
+    def update_snakes(self):
+        seen = set()
+        for snake in self.world.snakes:
+            if not snake.alive or not snake.body:
+                continue
+            key = id(snake)
+            seen.add(key)
+            track = self.tracks.get(key)
+            if track is None:
+                track = SnakeTrack(snake, self.snake_channel(snake))
+                self.tracks[key] = track
+            self.update_track(track)
+
+        for key in [key for key in self.tracks if key not in seen]:
+            self.clear_track(self.tracks.pop(key))
+
+    def update_track(self, track):
+        """뱀 하나의 바뀐 칸만 반영"""
+        snake = track.snake
+        body = snake.body
+        planes = self.planes
+        channel = planes[track.channel]
+        cells = track.cells
+
+        push = None
+        if body is track.body:
+            head = track.head
+            for index in range(min(len(body), MAX_HEAD_PUSH + 1)):
+                if body[index] is head:
+                    push = index
+                    break
+        if push is None:
+            # 처음 보는 뱀이거나 몸통 목록이 통째로 바뀜 - 이 뱀만 다시 그림
+            self.clear_track(track)
+            for x, y in body:
+                cell = to_cell(x, y)
+                cells.append(cell)
+                channel[cell] += 1
+        elif push or len(body) != len(cells):
+            # 머리 쪽 추가 push개
+            for index in range(push - 1, -1, -1):
+                cell = to_cell(*body[index])
+                cells.appendleft(cell)
+                channel[cell] += 1
+            # 꼬리 쪽 제거 또는 성장 (append로 늘어난 조각)
+            excess = len(cells) - len(body)
+            for _ in range(excess):
+                channel[cells.pop()] -= 1
+            for index in range(len(cells), len(body)):
+                cell = to_cell(*body[index])
+                cells.append(cell)
+                channel[cell] += 1
+
+        track.body = body
+        track.head = body[0]
+        head_cell = cells[0]
+        if head_cell != track.head_cell:
+            heads = planes[HEADS]
+            if track.head_cell is not None:
+                heads[track.head_cell] -= 1
+            heads[head_cell] += 1
+            track.head_cell = head_cell
+
+    def clear_track(self, track):
+        """뱀 하나를 배열에서 지움"""
+        channel = self.planes[track.channel]
+        for cell in track.cells:
+            channel[cell] -= 1
+        track.cells.clear()
+        if track.head_cell is not None:
+            self.planes[HEADS][track.head_cell] -= 1
+            track.head_cell = None
+        track.body = None
+        track.head = None
+
+    def update_food(self):
+        planes = self.planes
+        food_cells = self.food_cells
+        seen = set()
+        for food in self.world.food_list:
+            key = id(food)
+            seen.add(key)
+            entry = food_cells.get(key)
+            if entry is not None:
+                if entry[4] == food.x and entry[5] == food.y and entry[6] == getattr(food, "type", food.is_item):
+                    continue
+                planes[entry[1], entry[2], entry[3]] -= 1
+            channel = food_channel(food)
+            row, column = to_cell(food.x, food.y)
+            planes[channel, row, column] += 1
+            food_cells[key] = (food, channel, row, column, food.x, food.y, getattr(food, "type", food.is_item))
+        if len(seen) != len(food_cells):
+            for key in [key for key in food_cells if key not in seen]:
+                _, channel, row, column = food_cells.pop(key)[:4]
+                planes[channel, row, column] -= 1
+
+    def update_projectiles(self):
+        projectiles = self.planes[PROJECTILES]
+        for cell in self.projectile_cells:
+            projectiles[cell] -= 1
+        cells = []
+        boss = self.world.boss
+        if boss is not None:
+            for projectile in boss.projectiles:
+                if 0 <= projectile.x < WIDTH and 0 <= projectile.y < HEIGHT:
+                    cell = to_cell(projectile.x, projectile.y)
+                    projectiles[cell] += 1
+                    cells.append(cell)
+        self.projectile_cells = cells
+
+    def update_safe_zone(self):
+        boss = self.world.boss
+        safe_zone = boss.safe_zone if boss is not None and boss.alive else None
+        if safe_zone == self.safe_zone:
+            return
+        plane = self.planes[SAFE_ZONE]
+        plane[:] = 0
+        if safe_zone is not None:
+            x, y, width, height = safe_zone
+            top, left = to_cell(x, y)
+            bottom, right = to_cell(x + width - 1, y + height - 1)
+            plane[top:bottom + 1, left:right + 1] = 1
+        self.safe_zone = safe_zone
+
+    def crop(self, radius=None):
+        """
+        플레이어 머리 중심의 (채널, 2r+1, 2r+1) view (맵 밖은 0)
+
+        Args:
+            radius: int - 반경 (칸). None이면 crop_radius, crop_radius보다 클 수 없음
+        """
+        if radius is None:
+            radius = self.crop_radius
+        if radius > self.crop_radius:
+            raise ValueError(f"crop 반경 {radius}이 crop_radius {self.crop_radius}보다 큽니다")
+        player = self.player()
+        if player is not None and player.body:
+            row, column = to_cell(*player.body[0])
+        else:
+            row, column = GRID_ROWS // 2, GRID_COLUMNS // 2
+        pad = self.crop_radius
+        row += pad
+        column += pad
+        return self.buffer[:, row - radius:row + radius + 1, column - radius:column + radius + 1]
+
+def build_planes(world, player_id=None):
+    """Snake.body 목록으로 채널 평면을 처음부터 만듦 (검증/비교용)"""
+    planes = np.zeros((len(CHANNELS), GRID_ROWS, GRID_COLUMNS), dtype=np.uint16)
+    player = world.players.get(player_id) if player_id is not None else None
+    for snake in world.snakes:
+        if not snake.alive or not snake.body:
+            continue
+        if snake is world.boss:
+            channel = BOSS_BODY
+        elif snake is player:
+            channel = OWN_BODY
+        else:
+            channel = OTHER_BODIES
+        for x, y in snake.body:
+            planes[channel][to_cell(x, y)] += 1
+        planes[HEADS][to_cell(*snake.body[0])] += 1
+    for food in world.food_list:
+        planes[food_channel(food)][to_cell(food.x, food.y)] += 1
+    boss = world.boss
+    if boss is not None:
+        for projectile in boss.projectiles:
+            if 0 <= projectile.x < WIDTH and 0 <= projectile.y < HEIGHT:
+                planes[PROJECTILES][to_cell(projectile.x, projectile.y)] += 1
+        if boss.alive and boss.safe_zone is not None:
+            x, y, width, height = boss.safe_zone
+            top, left = to_cell(x, y)
+            bottom, right = to_cell(x + width - 1, y + height - 1)
+            planes[SAFE_ZONE, top:bottom + 1, left:right + 1] = 1
+    return planes
@@ -0,0 +1,234 @@
+"""
+Snake Game - 구간 계측 (profile_point)
+뜨거운 경로(뱀 이동, AI 판단, 충돌, 스폰, 그리기, 보스 행동)에 이름을 붙여 호출 수와 시간을 모은다.
+
+    @profile_point("collisions")        # 함수 데코레이터
+    def handle_collisions(snakes): ...
+
+    with profile_point("render.ui"):    # 코드 블록
+        ...
+
+계측 여부는 임포트 시점에 환경 변수 SNAKE_PROFILE로 정한다.
+    - 끔 (기본): 데코레이터가 원래 함수를 그대로 돌려주므로 호출 비용이 전혀 늘지 않음.
+      with 블록은 아무 일도 하지 않는 공용 객체를 씀
+    - 켬 (SNAKE_PROFILE=1 또는 SNAKE_PROFILE=출력파일): 구간별로 호출 수, 총 시간, 최대 시간,
+      소요 시간 히스토그램을 모으고, 호출 스택별 자기 시간(자식 구간 제외)을 모음.
+      프로세스가 끝날 때 요약표를 출력하고 스택별 시간을 flame graph용 collapsed 형식
+      ("바깥;안쪽;가장안쪽 마이크로초" 한 줄씩, flamegraph.pl / speedscope에서 열 수 있음)으로 저장
+        SNAKE_PROFILE=1 python3 main.py
+        SNAKE_PROFILE=boss.folded python3 boss_analyzer.py --fights 200
+
+프로세스 풀 워커는 환경 변수를 물려받아 각자 계측하고, 작업을 worker_job으로 감싸면
+작업마다 모은 통계를 결과와 함께 돌려준다. 부모가 collect_worker_results로 합쳐서 한 번에 저장한다.
+"""
+
+import atexit
+import functools
+import multiprocessing
+import os
+import time
+
+PROFILE_ENV = "SNAKE_PROFILE"
+DEFAULT_OUTPUT = "profile.folded"
+# 히스토그램 구간 상한 (마이크로초, 마지막 칸은 그 이상)
+HISTOGRAM_BOUNDS_US = (10, 50, 100, 500, 1000, 5000, 10000, 50000)
+
+_setting = os.environ.get(PROFILE_ENV, "")
+PROFILING = _setting not in ("", "0")
+
+class PointStats:
+    """구간 하나의 누적 통계"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0    # 초
+        self.max = 0.0      # 초
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+
+    def record(self, elapsed):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        elapsed_us = elapsed * 1e6
+        for bucket, bound in enumerate(HISTOGRAM_BOUNDS_US):
+            if elapsed_us < bound:
+                self.histogram[bucket] += 1
+                return
+        self.histogram[-1] += 1
+
+    def merge(self, calls, total, max_time, histogram):
+        """다른 프로세스에서 모은 같은 구간의 통계를 더함"""
+        self.calls += calls
+        self.total += total
+        if max_time > self.max:
+            self.max = max_time
+        for bucket, count in enumerate(histogram):
+            self.histogram[bucket] += count
+
+class Profiler:
+    """구간 통계와 호출 스택별 자기 시간"""
+
+    def __init__(self):
+        self.points = {}   # 이름 -> PointStats
+        self.stacks = {}   # (바깥 이름, ..., 이름) -> 자기 시간 합 (초)
+        self.frames = []   # 진행 중인 구간 [이름, 시작 시각, 자식 구간 시간]
+
+    def reset(self):
+        self.points.clear()
+        self.stacks.clear()
+        self.frames.clear()
+
+    def enter(self, name):
+        self.frames.append([name, time.perf_counter(), 0.0])
+
+    def exit(self):
+        end = time.perf_counter()
+        frames = self.frames
+        name, start, child_time = frames[-1]
+        elapsed = end - start
+        stack = tuple(frame[0] for frame in frames)
+        frames.pop()
+        if frames:
+            frames[-1][2] += elapsed
+        stats = self.points.get(name)
+        if stats is None:
+            stats = self.points[name] = PointStats(name)
+        stats.record(elapsed)
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + elapsed - child_time
+
+    def snapshot(self):
+        """프로세스 사이로 넘길 수 있는 형태의 구간 통계와 스택별 시간"""
+        return {
+            "points": {name: (stats.calls, stats.total, stats.max, stats.histogram[:])
+                       for name, stats in self.points.items()},
+            "stacks": dict(self.stacks),
+        }
+
+    def merge(self, snapshot):
+        """snapshot()으로 받은 다른 프로세스의 통계를 합침"""
+        for name, (calls, total, max_time, histogram) in snapshot["points"].items():
+            stats = self.points.get(name)
+            if stats is None:
+                stats = self.points[name] = PointStats(name)
+            stats.merge(calls, total, max_time, histogram)
+        for stack, seconds in snapshot["stacks"].items():
+            self.stacks[stack] = self.stacks.get(stack, 0.0) + seconds
+
+    def report(self):
+        """구간별 요약표 (총 시간이 큰 순서)"""
+        bounds = [f"<{bound}" for bound in HISTOGRAM_BOUNDS_US] + [f">={HISTOGRAM_BOUNDS_US[-1]}"]
+        lines = [f"{'구간':<28}{'호출':>9}{'총(ms)':>11}{'평균(us)':>11}{'최대(us)':>11}  히스토그램(us) {' '.join(bounds)}"]
+        for stats in sorted(self.points.values(), key=lambda stats: stats.total, reverse=True):
+            lines.append(f"{stats.name:<28}{stats.calls:>9}{stats.total * 1000:>11.1f}"
+                         f"{stats.total / stats.calls * 1e6:>11.1f}{stats.max * 1e6:>11.1f}  "
+                         f"{' '.join(str(count) for count in stats.histogram)}")
+        return "\n".join(lines)
+
+    def export_collapsed(self, path):
+        """
+        호출 스택별 자기 시간을 collapsed 형식으로 저장 (값은 마이크로초 정수)
+
+        Returns:
+            int: 저장한 스택 수
+        """
+        lines = [f"{';'.join(stack)} {round(seconds * 1e6)}"
+                 for stack, seconds in sorted(self.stacks.items()) if seconds > 0]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + ("\n" if lines else ""))
+        return len(lines)
+
+_profiler = Profiler()
+
+def get_profiler():
+    """구간 계측기 싱글톤 반환"""
+    return _profiler
+
+class ProfilePoint:
+    """계측 구간 (데코레이터와 with 블록 겸용)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self, func):
+        name = self.name
+        profiler = _profiler
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.exit()
+        return wrapper
+
+    def __enter__(self):
+        _profiler.enter(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        _profiler.exit()
+        return False
+
+class NullPoint:
+    """계측을 끈 구간 - 데코레이터는 원래 함수를 그대로 반환"""
+
+    def __call__(self, func):
+        return func
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_POINT = NullPoint()
+
+def profile_point(name):
+    """
+    이름 붙은 계측 구간 (SNAKE_PROFILE이 꺼져 있으면 아무 비용 없는 공용 객체)
+
+    Args:
+        name: str - 구간 이름 (collapsed 출력에서 스택 구분자 ';'는 쓰지 않음)
+    """
+    if not PROFILING:
+        return _NULL_POINT
+    return ProfilePoint(name)
+
+def worker_job(func, job):
+    """
+    프로세스 풀 작업 래퍼 (functools.partial(worker_job, func)로 pool.map에 넘김)
+
+    Returns:
+        tuple: (func(job) 결과, 이 작업 동안 워커에서 모은 통계 - 계측을 끄면 None)
+    """
+    result = func(job)
+    if not PROFILING:
+        return result, None
+    snapshot = _profiler.snapshot()
+    _profiler.points.clear()
+    _profiler.stacks.clear()
+    return result, snapshot
+
+def collect_worker_results(outputs):
+    """worker_job 출력에서 워커 통계는 현재 프로세스 계측기에 합치고 작업 결과 목록만 반환"""
+    results = []
+    for result, snapshot in outputs:
+        if snapshot is not None:
+            _profiler.merge(snapshot)
+        results.append(result)
+    return results
+
+def write_profile():
+    """프로세스 종료 시 요약표 출력과 collapsed 파일 저장 (워커 통계는 부모가 합쳐서 저장하므로 워커에서는 하지 않음)"""
+    if not _profiler.points or multiprocessing.parent_process() is not None:
+        return
+    path = DEFAULT_OUTPUT if _setting == "1" else _setting
+    count = _profiler.export_collapsed(path)
+    print(_profiler.report())
+    print(f"📊 계측 결과 저장: {path} (스택 {count}개)")
+
+if PROFILING:
+    atexit.register(write_profile)
@@ -0,0 +1,147 @@
+"""
+Snake Game - 적응형 렌더링 품질
+프레임 처리 시간을 지켜보다가 15fps 예산(약 66ms)을 넘기면 렌더링 품질을 한 단계씩 낮추고,
+여유가 생기면 다시 올리는 컨트롤러.
+
+시뮬레이션은 항상 매 틱 진행하고, 낮추는 것은 그리기 비용뿐이다.
+    0단계: 최고 품질
+    1단계: 미니맵 갱신 주기 늘림 (MINIMAP_SLOW_FACTOR배)
+    2단계: 뱀 몸통 알파 블렌딩 끔 (불투명 사각형으로 채움)
+    3단계: 리더보드 근접 페이드 끔 (뱀 머리 근접 검사 생략)
+    4단계: 한 프레임 건너 한 번만 그리기
+
+단계를 바꾸는 기준은 최근 프레임 시간의 지수 이동 평균이다.
+    - 평균이 예산의 DEGRADE_RATIO를 넘은 프레임이 DEGRADE_FRAMES번 이어지면 한 단계 낮춤
+    - 평균이 예산의 RECOVER_RATIO 아래인 프레임이 RECOVER_FRAMES번 이어지면 한 단계 올림
+    - 올리는 쪽을 더 보수적으로 잡아서 두 단계 사이를 오가며 깜빡이지 않도록 함
+4단계에서는 실제로 그린 프레임의 시간만 기록하므로, "매 프레임 그려도 예산 안에 들어오는가"를 기준으로 회복한다.
+"""
+
+import time
+
+FRAME_BUDGET_MS = 1000 / 15   # 15fps 한 프레임 예산
+SMOOTHING = 0.2               # 지수 이동 평균 가중치 (새 프레임 비중)
+DEGRADE_RATIO = 0.9           # 예산의 90%를 넘으면 낮출 후보
+RECOVER_RATIO = 0.5           # 예산의 50% 아래면 올릴 후보
+DEGRADE_FRAMES = 8            # 약 0.5초 연속으로 느리면 한 단계 낮춤
+RECOVER_FRAMES = 45           # 약 3초 연속으로 여유가 있으면 한 단계 올림
+MINIMAP_SLOW_FACTOR = 3       # 1단계 이상에서 미니맵 갱신 주기 배수
+
+QUALITY_LEVELS = ("FULL", "MINIMAP", "NO_ALPHA", "NO_FADE", "HALF_RATE")
+MAX_QUALITY_LEVEL = len(QUALITY_LEVELS) - 1
+
+class QualityController:
+    """프레임 시간에 따라 렌더링 품질 단계를 조절"""
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, enabled=True):
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.level = 0
+        self.average_ms = 0.0
+        self.slow_frames = 0      # 연속으로 느린 프레임 수
+        self.fast_frames = 0      # 연속으로 여유 있는 프레임 수
+        self.frame_started = None
+        self.frame_count = 0      # render_frame 판단 횟수 (건너뛰기 주기용)
+        self.skipped = 0          # 건너뛴 프레임 수
+        self.changes = 0          # 단계가 바뀐 횟수
+
+    def reset(self):
+        """새 판 시작 시 최고 품질로 되돌림"""
+        self.level = 0
+        self.average_ms = 0.0
+        self.slow_frames = self.fast_frames = 0
+        self.frame_started = None
+        self.frame_count = self.skipped = 0
+
+    @property
+    def level_name(self):
+        return QUALITY_LEVELS[self.level]
+
+    @property
+    def minimap_interval_factor(self):
+        """미니맵 갱신 주기 배수"""
+        return MINIMAP_SLOW_FACTOR if self.level >= 1 else 1
+
+    @property
+    def segment_alpha(self):
+        """뱀 몸통에 알파 블렌딩을 적용할지 여부"""
+        return self.level < 2
+
+    @property
+    def leaderboard_fade(self):
+        """리더보드 근접 페이드를 적용할지 여부"""
+        return self.level < 3
+
+    def render_frame(self):
+        """
+        이번 프레임을 그릴지 결정 (4단계에서는 두 프레임에 한 번)
+
+        Returns:
+            bool: 그려야 하면 True
+        """
+        self.frame_count += 1
+        if self.level < 4 or self.frame_count % 2 == 0:
+            return True
+        self.skipped += 1
+        return False
+
+    def begin_frame(self):
+        """프레임 처리 시작 시각 기록"""
+        self.frame_started = time.perf_counter()
+
+    def end_frame(self):
+        """
+        프레임 처리 종료 - 시작 이후 걸린 시간을 기록하고 품질 단계 조절
+
+        Returns:
+            float: 이번 프레임 처리 시간 (밀리초, 시작 기록이 없으면 0)
+        """
+        if self.frame_started is None:
+            return 0.0
+        elapsed_ms = (time.perf_counter() - self.frame_started) * 1000
+        self.frame_started = None
+        self.record(elapsed_ms)
+        return elapsed_ms
+
+    def discard_frame(self):
+        """일시정지 창처럼 입력을 기다린 프레임은 기록하지 않음"""
+        self.frame_started = None
+
+    def record(self, frame_ms):
+        """프레임 시간 하나를 반영해서 필요하면 단계를 한 칸 옮김"""
+        if self.average_ms == 0.0:
+            self.average_ms = frame_ms
+        else:
+            self.average_ms += SMOOTHING * (frame_ms - self.average_ms)
+        if not self.enabled:
+            return
+
+        if self.average_ms > self.budget_ms * DEGRADE_RATIO:
+            self.slow_frames += 1
+            self.fast_frames = 0
+            if self.slow_frames >= DEGRADE_FRAMES and self.level < MAX_QUALITY_LEVEL:
+                self.set_level(self.level + 1)
+        elif self.average_ms < self.budget_ms * RECOVER_RATIO:
+            self.fast_frames += 1
+            self.slow_frames = 0
+            if self.fast_frames >= RECOVER_FRAMES and self.level > 0:
+                self.set_level(self.level - 1)
+        else:
+            self.slow_frames = self.fast_frames = 0
+
+    def set_level(self, level):
+        """품질 단계 지정 (바꾼 뒤에는 새 단계 기준으로 다시 지켜봄)"""
+        level = max(0, min(MAX_QUALITY_LEVEL, level))
+        if level != self.level:
+            self.level = level
+            self.changes += 1
+        self.slow_frames = self.fast_frames = 0
+
+_quality_controller = None
+
+def get_quality_controller():
+    """렌더링 품질 컨트롤러 싱글톤 반환"""
+    global _quality_controller
+    if _quality_controller is None:
+        _quality_controller = QualityController()
+    return _quality_controller
@@ -0,0 +1,592 @@
+"""
+Snake Game - 상태 복제(replication) 모듈
+매 틱 전체 상태를 보내는 대신, 클라이언트가 마지막으로 확인(ack)한 틱과의 차이만 바이너리로 보낸다.
+
+- 뱀 몸통: 머리 추가(push) / 꼬리 제거(pop) / 꼬리 성장(append)만 전송
+- 음식: 생성/제거만 전송
+- 투사체: 생성 시 위치와 속도만 보내고 이후 위치는 클라이언트가 계산, 제거만 전송
+- 에너지/점수/효과 등 스칼라 값: 바뀐 필드만 비트 마스크로 표시해서 전송
+- 키프레임: 빈 상태 기준의 차이 = 전체 상태. 처음 접속, 확인 틱이 너무 오래됨, 일정 주기마다 전송
+- 정수는 모두 varint (음수는 zigzag)로 인코딩
+
+메시지 형식 (varint 길이 접두어 뒤에 본문):
+    [종류 1바이트][틱][기준 틱까지의 거리(델타만)][월드 스칼라][뱀 제거][뱀 전체][뱀 변경][음식][투사체]
+"""
+
+from collections import Counter
+from module import SPEED_UNITS_PER_CELL, MAX_STAT_LEVEL
+from world import get_food_kind, get_effect_mask
+
+MESSAGE_KEYFRAME = 1
+MESSAGE_DELTA = 2
+
+KEYFRAME_INTERVAL = 150   # 10초마다 키프레임 (15틱 기준)
+HISTORY_TICKS = 45        # 델타 기준으로 쓸 수 있는 과거 프레임 수 (3초)
+ENERGY_SCALE = 10         # 에너지는 소수 첫째 자리까지 정수로 전송
+MAX_ENERGY = 9999         # 보스의 무한 에너지 등은 이 값으로 제한
+VELOCITY_SCALE = 100      # 투사체 위치/속도 고정소수점 배율
+# Snake.speed_units의 최댓값 (최대 속도 스탯 x 대시 x 스피드 부스트 x 돌진)
+MAX_SPEED_UNITS = (SPEED_UNITS_PER_CELL + MAX_STAT_LEVEL - 1) * 2 * 2 * 2
+# 한 틱에 뱀 머리가 나아갈 수 있는 최대 칸 수 (이전 틱에서 넘어온 나머지 포함)
+MAX_CELLS_PER_TICK = (MAX_SPEED_UNITS + SPEED_UNITS_PER_CELL - 1) // SPEED_UNITS_PER_CELL
+
+# 뱀 변경 필드 비트
+FIELD_BODY = 1
+FIELD_ALIVE = 2
+FIELD_SCORE = 4
+FIELD_ENERGY = 8
+FIELD_LEVEL = 16
+FIELD_FORM = 32
+FIELD_EFFECTS = 64
+FIELD_COLOR = 128
+FIELD_NAME = 256
+
+# 월드 스칼라 비트
+WORLD_BOSS_HEALTH = 1
+WORLD_FINISHED = 2
+
+#############################################
+# varint 인코딩
+#############################################
+def write_varint(out, value):
+    """0 이상의 정수를 7비트씩 끊어서 기록"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def write_svarint(out, value):
+    """부호 있는 정수를 zigzag 변환 후 기록 (작은 음수도 1바이트)"""
+    write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+def write_string(out, text):
+    data = text.encode("utf-8")
+    write_varint(out, len(data))
+    out.extend(data)
+
+class ByteReader:
+    """varint 메시지 읽기"""
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def byte(self):
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def varint(self):
+        result = 0
+        shift = 0
+        data = self.data
+        while True:
+            value = data[self.pos]
+            self.pos += 1
+            result |= (value & 0x7F) << shift
+            if value < 0x80:
+                return result
+            shift += 7
+
+    def svarint(self):
+        value = self.varint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def string(self):
+        length = self.varint()
+        text = bytes(self.data[self.pos:self.pos + length]).decode("utf-8")
+        self.pos += length
+        return text
+
+def frame_message(payload):
+    """스트림 전송용 길이 접두어 추가"""
+    out = bytearray()
+    write_varint(out, len(payload))
+    out.extend(payload)
+    return bytes(out)
+
+#############################################
+# 프레임 (한 틱의 복제 상태)
+#############################################
+class SnakeFrame:
+    """뱀 하나의 복제 상태"""
+    __slots__ = ("name", "color", "ai", "alive", "score", "energy", "level", "form", "effects", "body")
+
+    def __init__(self, name, color, ai, alive, score, energy, level, form, effects, body):
+        self.name = name
+        self.color = color
+        self.ai = ai
+        self.alive = alive
+        self.score = score
+        self.energy = energy      # ENERGY_SCALE 배 정수
+        self.level = level
+        self.form = form
+        self.effects = effects
+        self.body = body          # [(x, y), ...] 머리부터
+
+    def copy(self):
+        return SnakeFrame(self.name, self.color, self.ai, self.alive, self.score, self.energy,
+                          self.level, self.form, self.effects, self.body)
+
+class Frame:
+    """한 틱의 복제 상태 전체"""
+
+    def __init__(self, tick=0, snakes=None, food=None, projectiles=None, boss_health=None, finished=False):
+        self.tick = tick
+        self.snakes = snakes if snakes is not None else {}            # id -> SnakeFrame
+        self.food = food if food is not None else Counter()           # (x, y, kind) -> 개수
+        self.projectiles = projectiles if projectiles is not None else {}  # id -> (x, y, dx, dy, tick)
+        self.boss_health = boss_health
+        self.finished = finished
+
+    def to_state(self):
+        """world.GameWorld.snapshot()과 같은 형태의 딕셔너리로 변환 (클라이언트 렌더링용)"""
+        snakes = []
+        for entity_id, snake in self.snakes.items():
+            body = []
+            for x, y in snake.body:
+                body.append(x)
+                body.append(y)
+            snakes.append({
+                "id": entity_id, "name": snake.name, "color": list(snake.color), "ai": snake.ai,
+                "alive": snake.alive, "score": snake.score, "energy": snake.energy / ENERGY_SCALE,
+                "level": snake.level, "form": snake.form, "effects": snake.effects, "body": body,
+            })
+        food = []
+        for (x, y, kind), count in self.food.items():
+            for _ in range(count):
+                food.extend((x, y, kind))
+        projectiles = []
+        for x, y, dx, dy, spawn_tick in self.projectiles.values():
+            elapsed = self.tick - spawn_tick
+            projectiles.append(int((x + dx * elapsed) / VELOCITY_SCALE))
+            projectiles.append(int((y + dy * elapsed) / VELOCITY_SCALE))
+        return {
+            "tick": self.tick, "snakes": snakes, "food": food, "projectiles": projectiles,
+            "boss_health": self.boss_health, "finished": self.finished,
+        }
+
+EMPTY_FRAME = Frame(tick=0)
+
+def capture_snake(snake):
+    """Snake 객체를 SnakeFrame으로 변환"""
+    return SnakeFrame(
+        snake.name, tuple(snake.color), snake.is_ai, snake.alive, snake.score,
+        int(round(min(snake.energy, MAX_ENERGY) * ENERGY_SCALE)), snake.level,
+        snake.evolution_form, get_effect_mask(snake),
+        [(int(segment[0]), int(segment[1])) for segment in snake.body])
+
+#############################################
+# 몸통 차이 계산
+#############################################
+def diff_body(old, new, max_push):
+    """
+    새 몸통을 (머리 추가 k개 + 기존 몸통 앞부분 + 꼬리 성장분)으로 표현할 수 있는지 확인
+
+    Returns:
+        (push, pop, append) 또는 None (전체 몸통을 다시 보내야 함)
+    """
+    if not old or not new:
+        return None
+    head = old[0]
+    for push in range(min(len(new), max_push + 1)):
+        if new[push] != head:
+            continue
+        kept = min(len(old), len(new) - push)
+        if new[push:push + kept] == old[:kept]:
+            return push, len(old) - kept, len(new) - push - kept
+    # 짧은 뱀이 몸 길이보다 멀리 나아가면 기존 머리가 남지 않으므로 몸통 전체를 머리 추가로 표현
+    if len(new) <= max_push:
+        return len(new), len(old), 0
+    return None
+
+def write_points(out, points, origin):
+    """점 목록을 직전 점 기준 상대 좌표로 기록 (보통 좌표당 1바이트)"""
+    px, py = origin
+    for x, y in points:
+        write_svarint(out, x - px)
+        write_svarint(out, y - py)
+        px, py = x, y
+
+def read_points(reader, count, origin):
+    px, py = origin
+    points = []
+    for _ in range(count):
+        px += reader.svarint()
+        py += reader.svarint()
+        points.append((px, py))
+    return points
+
+#############################################
+# 인코딩 / 디코딩
+#############################################
+def write_full_snake(out, entity_id, snake):
+    write_varint(out, entity_id)
+    write_string(out, snake.name)
+    out.extend(bytes(snake.color[:3]))
+    out.append((1 if snake.ai else 0) | (2 if snake.alive else 0))
+    write_svarint(out, snake.score)
+    write_svarint(out, snake.energy)
+    write_varint(out, snake.level)
+    write_string(out, snake.form)
+    write_varint(out, snake.effects)
+    write_varint(out, len(snake.body))
+    if snake.body:
+        write_points(out, snake.body, (0, 0))
+
+def read_full_snake(reader):
+    entity_id = reader.varint()
+    name = reader.string()
+    color = (reader.byte(), reader.byte(), reader.byte())
+    flags = reader.byte()
+    score = reader.svarint()
+    energy = reader.svarint()
+    level = reader.varint()
+    form = reader.string()
+    effects = reader.varint()
+    body = read_points(reader, reader.varint(), (0, 0))
+    return entity_id, SnakeFrame(name, color, bool(flags & 1), bool(flags & 2),
+                                 score, energy, level, form, effects, body)
+
+def encode_delta(base, frame, keyframe=False):
+    """
+    base 프레임에서 frame으로 가는 차이를 바이너리로 인코딩
+
+    Args:
+        base: Frame - 클라이언트가 가지고 있는 기준 프레임 (키프레임이면 EMPTY_FRAME)
+        frame: Frame - 현재 프레임
+        keyframe: bool - 키프레임 여부
+
+    Returns:
+        bytes
+    """
+    out = bytearray()
+    out.append(MESSAGE_KEYFRAME if keyframe else MESSAGE_DELTA)
+    write_varint(out, frame.tick)
+    if not keyframe:
+        write_varint(out, frame.tick - base.tick)
+
+    # 월드 스칼라
+    world_mask = 0
+    if keyframe or frame.boss_health != base.boss_health:
+        world_mask |= WORLD_BOSS_HEALTH
+    if frame.finished:
+        world_mask |= WORLD_FINISHED
+    write_varint(out, world_mask)
+    if world_mask & WORLD_BOSS_HEALTH:
+        # None은 0, 체력 h는 h + 1로 기록
+        write_varint(out, 0 if frame.boss_health is None else max(0, frame.boss_health) + 1)
+
+    # 사라진 뱀
+    removed = [entity_id for entity_id in base.snakes if entity_id not in frame.snakes]
+    write_varint(out, len(removed))
+    for entity_id in removed:
+        write_varint(out, entity_id)
+
+    # 전체를 보낼 뱀 (새 뱀, 또는 몸통 차이로 표현할 수 없는 뱀)과 바뀐 필드만 보낼 뱀
+    max_push = (frame.tick - base.tick) * MAX_CELLS_PER_TICK
+    full = []
+    changed = bytearray()
+    changed_count = 0
+    for entity_id, snake in frame.snakes.items():
+        old = base.snakes.get(entity_id)
+        if old is None:
+            full.append((entity_id, snake))
+            continue
+        if old is snake:
+            continue
+        body_diff = None
+        mask = 0
+        if snake.body is not old.body and snake.body != old.body:
+            body_diff = diff_body(old.body, snake.body, max_push)
+            if body_diff is None:
+                full.append((entity_id, snake))
+                continue
+            mask |= FIELD_BODY
+        if snake.alive != old.alive:
+            mask |= FIELD_ALIVE
+        if snake.score != old.score:
+            mask |= FIELD_SCORE
+        if snake.energy != old.energy:
+            mask |= FIELD_ENERGY
+        if snake.level != old.level:
+            mask |= FIELD_LEVEL
+        if snake.form != old.form:
+            mask |= FIELD_FORM
+        if snake.effects != old.effects:
+            mask |= FIELD_EFFECTS
+        if snake.color != old.color:
+            mask |= FIELD_COLOR
+        if snake.name != old.name:
+            mask |= FIELD_NAME
+        if not mask:
+            continue
+
+        changed_count += 1
+        write_varint(changed, entity_id)
+        write_varint(changed, mask)
+        if mask & FIELD_BODY:
+            push, pop, append = body_diff
+            write_varint(changed, push)
+            # 새 머리는 기존 머리에서 가까운 순서로 기록
+            write_points(changed, reversed(snake.body[:push]), old.body[0])
+            write_varint(changed, pop)
+            write_varint(changed, append)
+            if append:
+                write_points(changed, snake.body[-append:], snake.body[-append - 1])
+        if mask & FIELD_ALIVE:
+            changed.append(1 if snake.alive else 0)
+        if mask & FIELD_SCORE:
+            write_svarint(changed, snake.score - old.score)
+        if mask & FIELD_ENERGY:
+            write_svarint(changed, snake.energy - old.energy)
+        if mask & FIELD_LEVEL:
+            write_varint(changed, snake.level)
+        if mask & FIELD_FORM:
+            write_string(changed, snake.form)
+        if mask & FIELD_EFFECTS:
+            write_varint(changed, snake.effects)
+        if mask & FIELD_COLOR:
+            changed.extend(bytes(snake.color[:3]))
+        if mask & FIELD_NAME:
+            write_string(changed, snake.name)
+
+    write_varint(out, len(full))
+    for entity_id, snake in full:
+        write_full_snake(out, entity_id, snake)
+    write_varint(out, changed_count)
+    out.extend(changed)
+
+    # 음식 제거/생성
+    food_removed = base.food - frame.food
+    food_added = frame.food - base.food
+    write_varint(out, sum(food_removed.values()))
+    for (x, y, kind), count in food_removed.items():
+        for _ in range(count):
+            write_varint(out, x)
+            write_varint(out, y)
+            write_varint(out, kind)
+    write_varint(out, sum(food_added.values()))
+    for (x, y, kind), count in food_added.items():
+        for _ in range(count):
+            write_varint(out, x)
+            write_varint(out, y)
+            write_varint(out, kind)
+
+    # 투사체 제거/생성
+    projectiles_removed = [pid for pid in base.projectiles if pid not in frame.projectiles]
+    write_varint(out, len(projectiles_removed))
+    for pid in projectiles_removed:
+        write_varint(out, pid)
+    projectiles_added = [(pid, data) for pid, data in frame.projectiles.items() if pid not in base.projectiles]
+    write_varint(out, len(projectiles_added))
+    for pid, (x, y, dx, dy, spawn_tick) in projectiles_added:
+        write_varint(out, pid)
+        write_svarint(out, x)
+        write_svarint(out, y)
+        write_svarint(out, dx)
+        write_svarint(out, dy)
+        write_varint(out, frame.tick - spawn_tick)
+    return bytes(out)
+
+def decode_message(data, frames):
+    """
+    메시지를 디코딩해서 새 프레임 생성
+
+    Args:
+        data: bytes - encode_delta 결과
+        frames: dict - 클라이언트가 가진 틱 -> Frame (델타의 기준 프레임을 찾는 곳)
+
+    Returns:
+        (Frame, 기준 틱) - 키프레임이면 기준 틱은 None (기준 프레임이 없으면 KeyError)
+    """
+    reader = ByteReader(data)
+    kind = reader.byte()
+    tick = reader.varint()
+    if kind == MESSAGE_KEYFRAME:
+        base_tick = None
+        base = EMPTY_FRAME
+    else:
+        base_tick = tick - reader.varint()
+        base = frames[base_tick]
+
+    frame = Frame(tick, dict(base.snakes), Counter(base.food), dict(base.projectiles),
+                  base.boss_health, False)
+
+    world_mask = reader.varint()
+    if world_mask & WORLD_BOSS_HEALTH:
+        value = reader.varint()
+        frame.boss_health = None if value == 0 else value - 1
+    frame.finished = bool(world_mask & WORLD_FINISHED)
+
+    for _ in range(reader.varint()):
+        frame.snakes.pop(reader.varint(), None)
+    for _ in range(reader.varint()):
+        entity_id, snake = read_full_snake(reader)
+        frame.snakes[entity_id] = snake
+    for _ in range(reader.varint()):
+        entity_id = reader.varint()
+        mask = reader.varint()
+        snake = frame.snakes[entity_id].copy()
+        frame.snakes[entity_id] = snake
+        if mask & FIELD_BODY:
+            old_body = snake.body
+            heads = read_points(reader, reader.varint(), old_body[0])
+            heads.reverse()
+            pop = reader.varint()
+            append = reader.varint()
+            body = heads
+            body.extend(old_body[:len(old_body) - pop] if pop else old_body)
+            if append:
+                body.extend(read_points(reader, append, body[-1]))
+            snake.body = body
+        if mask & FIELD_ALIVE:
+            snake.alive = bool(reader.byte())
+        if mask & FIELD_SCORE:
+            snake.score += reader.svarint()
+        if mask & FIELD_ENERGY:
+            snake.energy += reader.svarint()
+        if mask & FIELD_LEVEL:
+            snake.level = reader.varint()
+        if mask & FIELD_FORM:
+            snake.form = reader.string()
+        if mask & FIELD_EFFECTS:
+            snake.effects = reader.varint()
+        if mask & FIELD_COLOR:
+            snake.color = (reader.byte(), reader.byte(), reader.byte())
+        if mask & FIELD_NAME:
+            snake.name = reader.string()
+
+    food = frame.food
+    for _ in range(reader.varint()):
+        key = (reader.varint(), reader.varint(), reader.varint())
+        food[key] -= 1
+        if food[key] <= 0:
+            del food[key]
+    for _ in range(reader.varint()):
+        food[(reader.varint(), reader.varint(), reader.varint())] += 1
+
+    for _ in range(reader.varint()):
+        frame.projectiles.pop(reader.varint(), None)
+    for _ in range(reader.varint()):
+        pid = reader.varint()
+        x, y, dx, dy = reader.svarint(), reader.svarint(), reader.svarint(), reader.svarint()
+        frame.projectiles[pid] = (x, y, dx, dy, tick - reader.varint())
+    return frame, base_tick
+
+#############################################
+# 서버/클라이언트 측 상태 관리
+#############################################
+class Replicator:
+    """서버 측 복제기 - 방마다 하나, 틱마다 프레임을 만들고 기준 틱별 인코딩 결과를 공유"""
+
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL, history_ticks=HISTORY_TICKS):
+        self.keyframe_interval = keyframe_interval
+        self.history_ticks = history_ticks
+        self.history = {}           # tick -> Frame
+        self.frame = None
+        self.encoded = {}           # 이번 틱의 기준 틱(None=키프레임) -> bytes
+        self.projectile_ids = {}    # Projectile.serial -> 복제 번호 (투사체 객체는 풀에서 재사용되므로 serial로 구분)
+        self.next_projectile_id = 1
+
+    def capture(self, world):
+        """현재 월드 상태로 이번 틱 프레임 생성 (틱마다 한 번)"""
+        previous = self.frame
+        snakes = {}
+        for snake in world.snakes:
+            if not snake.alive and snake.is_ai:
+                continue
+            snakes[snake.entity_id] = capture_snake(snake)
+        # 바뀌지 않은 뱀은 이전 프레임 객체를 그대로 써서 델타 계산을 건너뜀
+        if previous is not None:
+            for entity_id, snake in snakes.items():
+                old = previous.snakes.get(entity_id)
+                if old is not None and _same_snake(old, snake):
+                    snakes[entity_id] = old
+
+        food = Counter((int(item.x), int(item.y), get_food_kind(item)) for item in world.food_list)
+
+        projectiles = {}
+        if world.boss is not None:
+            ids = {}
+            for projectile in world.boss.projectiles:
+                pid = self.projectile_ids.get(projectile.serial)
+                if pid is None:
+                    pid = self.next_projectile_id
+                    self.next_projectile_id += 1
+                    projectiles[pid] = (int(projectile.x * VELOCITY_SCALE), int(projectile.y * VELOCITY_SCALE),
+                                        int(projectile.dx * VELOCITY_SCALE), int(projectile.dy * VELOCITY_SCALE),
+                                        world.tick)
+                else:
+                    projectiles[pid] = previous.projectiles[pid]
+                ids[projectile.serial] = pid
+            self.projectile_ids = ids
+
+        frame = Frame(world.tick, snakes, food, projectiles,
+                      world.boss.health if world.boss is not None else None, world.finished)
+        self.frame = frame
+        self.history[frame.tick] = frame
+        self.history.pop(frame.tick - self.history_ticks, None)
+        self.encoded = {}
+        return frame
+
+    def message_for(self, replica):
+        """
+        클라이언트 하나에 보낼 이번 틱 메시지 (같은 기준 틱을 쓰는 클라이언트끼리 인코딩 결과 공유)
+
+        Args:
+            replica: ClientReplica - 클라이언트의 확인 상태
+        """
+        frame = self.frame
+        base = self.history.get(replica.acked_tick) if replica.acked_tick is not None else None
+        keyframe = (base is None or base is frame or
+                    frame.tick - replica.keyframe_tick >= self.keyframe_interval)
+        key = None if keyframe else base.tick
+        data = self.encoded.get(key)
+        if data is None:
+            data = frame_message(encode_delta(EMPTY_FRAME if keyframe else base, frame, keyframe))
+            self.encoded[key] = data
+        if keyframe:
+            replica.keyframe_tick = frame.tick
+        return data
+
+def _same_snake(old, new):
+    return (old.body == new.body and old.alive == new.alive and old.score == new.score and
+            old.energy == new.energy and old.level == new.level and old.form == new.form and
+            old.effects == new.effects and old.color == new.color and old.name == new.name)
+
+class ClientReplica:
+    """서버가 클라이언트별로 보관하는 확인(ack) 상태"""
+
+    def __init__(self):
+        self.acked_tick = None
+        self.keyframe_tick = 0
+
+    def acknowledge(self, tick):
+        if self.acked_tick is None or tick > self.acked_tick:
+            self.acked_tick = tick
+
+class ReplicaReceiver:
+    """클라이언트 측 수신기 - 받은 프레임을 보관하고 델타를 적용"""
+
+    def __init__(self, max_frames=HISTORY_TICKS):
+        self.max_frames = max_frames
+        self.frames = {}    # tick -> Frame (델타 기준으로 쓰일 수 있는 프레임)
+        self.latest = None
+
+    def receive(self, data):
+        """
+        메시지 하나 적용
+
+        Returns:
+            Frame: 새 프레임 (이후 서버에 frame.tick을 ack로 보냄)
+        """
+        frame, base_tick = decode_message(data, self.frames)
+        frames = self.frames
+        frames[frame.tick] = frame
+        # 델타의 기준 틱은 서버가 이미 받은 ack이므로, 이후 델타는 그보다 오래된 프레임을 쓰지 않음
+        oldest = base_tick if base_tick is not None else frame.tick - self.max_frames
+        for tick in [t for t in frames if t < oldest]:
+            del frames[tick]
+        self.latest = frame
+        return frame
@@ -0,0 +1,525 @@
+"""
+Snake Game - 강화학습 환경
+화면 없는 GameWorld 한 판을 Gymnasium 방식(reset/step)으로 감싼 환경.
+
+- SnakeEnv: 플레이어 뱀 하나를 조종하는 단일 환경
+- SyncVectorSnakeEnv: 같은 프로세스에서 N개 월드를 한 번에 진행
+- SubprocVectorSnakeEnv: N개 월드를 워커 프로세스에 나눠서 진행 (CPU 코어 활용)
+
+보상 = 점수 증가량 x score + 경험치 증가량 x exp + 틱당 survival
+      (+ 보스 피해량 x boss_damage, 사망 시 death, 보스 처치 시 victory)
+
+gymnasium이 설치되어 있으면 gymnasium.Env를 상속하고 observation_space/action_space를 제공한다.
+없어도 reset/step 인터페이스는 같게 동작한다.
+
+사용 예:
+    env = SnakeEnv("EVOLUTION")
+    observation, info = env.reset(seed=1)
+    observation, reward, terminated, truncated, info = env.step(env.action_space.sample())
+
+    envs = SubprocVectorSnakeEnv(16, num_workers=4, game_mode="BOSS")
+    observations, infos = envs.reset(seed=0)
+    observations, rewards, terminated, truncated, infos = envs.step(actions)
+"""
+
+import multiprocessing
+import os
+import random
+import signal
+import numpy as np
+from module import CELL_SIZE, WIDTH, HEIGHT, DIRECTION_STEPS
+from world import GameWorld, DIRECTIONS, start_charge
+from arena import BODIES
+
+try:
+    import gymnasium as gym
+    from gymnasium import spaces
+except ImportError:  # gymnasium이 없으면 공간 정의 없이 같은 인터페이스로 동작
+    gym = None
+    spaces = None
+
+# 행동 번호: 0 유지, 1~4 방향, 5 대시, 6 돌진 (보스 모드에서만 효과)
+ACTIONS = (None,) + DIRECTIONS + ("DASH", "CHARGE")
+
+# 기본 보상 가중치
+REWARD_WEIGHTS = {
+    "score": 0.1,         # 점수 1점당 (일반 음식 1점, 황금 아이템 10점)
+    "exp": 0.001,         # 경험치 1당 (일반 음식 100, 황금 아이템 500)
+    "survival": 0.001,    # 살아있는 틱마다
+    "death": -1.0,        # 사망
+    "boss_damage": 0.05,  # 보스 체력 1 감소당
+    "victory": 5.0,       # 보스 처치
+}
+
+DEFAULT_MAX_STEPS = 3000  # 에피소드 최대 행동 수 (frame_skip=1이면 200초)
+
+# 관측 벡터 구성 (모두 -1~1 범위로 정규화)
+OBSERVATION_FEATURES = (
+    "head_x", "head_y",
+    "dir_up", "dir_down", "dir_left", "dir_right",
+    "length", "energy", "level", "exp_ratio",
+    "dash_ready", "dashing",
+    "food_dx", "food_dy",
+    "item_dx", "item_dy",
+    "enemy_dx", "enemy_dy", "enemy_length",
+    "danger_up", "danger_down", "danger_left", "danger_right",
+    "boss_dx", "boss_dy", "boss_health",
+    "projectile_dx", "projectile_dy",
+)
+OBSERVATION_SIZE = len(OBSERVATION_FEATURES)
+
+def total_exp(snake):
+    """레벨업으로 차감된 경험치까지 합친 누적 경험치"""
+    total = snake.exp
+    threshold = 100
+    for _ in range(snake.level - 1):
+        total += threshold
+        threshold = int(threshold * 1.5)
+    return total
+
+def nearest_offset(head_x, head_y, points):
+    """가장 가까운 점까지의 (dx, dy) 정규화 값 - 점이 없으면 (0, 0)"""
+    best = None
+    best_distance = None
+    for x, y in points:
+        distance = (x - head_x) ** 2 + (y - head_y) ** 2
+        if best_distance is None or distance < best_distance:
+            best, best_distance = (x, y), distance
+    if best is None:
+        return 0.0, 0.0
+    return (best[0] - head_x) / WIDTH, (best[1] - head_y) / HEIGHT
+
+class SnakeEnv(gym.Env if gym is not None else object):
+    """
+    플레이어 뱀 하나를 조종하는 강화학습 환경
+
+    한 번의 step은 frame_skip 틱 동안 같은 행동을 유지하며, 그동안의 보상을 합해서 돌려준다.
+    월드는 전역 random 모듈을 쓰므로 환경마다 난수 상태를 따로 보관해서,
+    같은 프로세스에 환경이 여러 개 있어도 시드별로 같은 게임이 재현된다.
+    """
+
+    metadata = {"render_modes": []}
+
+    def __init__(self, game_mode="EVOLUTION", max_steps=DEFAULT_MAX_STEPS, frame_skip=1,
+                 reward_weights=None, initial_ai=None, auto_evolve=None):
+        """
+        Args:
+            game_mode: str - 게임 모드 ("CLASSIC", "EVOLUTION", "BOSS")
+            max_steps: int - 이 행동 수를 넘기면 truncated
+            frame_skip: int - 행동 하나를 유지할 틱 수
+            reward_weights: dict - REWARD_WEIGHTS 중 바꿀 항목
+            initial_ai: int - 처음 생성할 AI 뱀 수 (None이면 모드별 기본값)
+            auto_evolve: str - 진화 가능해지면 자동으로 진화할 형태 (None이면 진화하지 않음)
+        """
+        self.game_mode = game_mode
+        self.max_steps = max_steps
+        self.frame_skip = max(1, frame_skip)
+        self.reward_weights = dict(REWARD_WEIGHTS)
+        if reward_weights:
+            self.reward_weights.update(reward_weights)
+        self.initial_ai = initial_ai
+        self.auto_evolve = auto_evolve
+
+        if spaces is not None:
+            self.observation_space = spaces.Box(-1.0, 1.0, shape=(OBSERVATION_SIZE,), dtype=np.float32)
+            self.action_space = spaces.Discrete(len(ACTIONS))
+
+        self.world = None
+        self.player_id = None
+        self.steps = 0
+        self.episode_return = 0.0
+        self._seed_rng = random.Random()
+        self._rng_state = None
+        self._observation = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+    @property
+    def player(self):
+        return self.world.players[self.player_id]
+
+    def reset(self, seed=None, options=None):
+        """
+        새 게임 시작
+
+        Args:
+            seed: int - 게임 시드 (None이면 이전 시드에서 이어지는 시드 사용)
+            options: dict - {"game_mode": ...}로 이번 에피소드의 모드 변경
+
+        Returns:
+            tuple: (관측, info)
+        """
+        if gym is not None:
+            super().reset(seed=seed)
+        if seed is not None:
+            self._seed_rng.seed(seed)
+        if options and "game_mode" in options:
+            self.game_mode = options["game_mode"]
+
+        saved_state = random.getstate()
+        if self.world is not None:
+            self.world.release_entities()
+        self.world = GameWorld(self.game_mode, seed=self._seed_rng.getrandbits(32),
+                               initial_ai=self.initial_ai)
+        self.player_id = self.world.add_player("Agent")
+        self._rng_state = random.getstate()
+        random.setstate(saved_state)
+
+        self.steps = 0
+        self.episode_return = 0.0
+        return self.observe().copy(), self.get_info()
+
+    def step(self, action):
+        """
+        행동 하나를 frame_skip 틱 동안 적용
+
+        Returns:
+            tuple: (관측, 보상, terminated, truncated, info)
+        """
+        world = self.world
+        player = self.player
+        weights = self.reward_weights
+        name = ACTIONS[int(action)]
+        reward = 0.0
+
+        saved_state = random.getstate()
+        random.setstate(self._rng_state)
+        for skip in range(self.frame_skip):
+            score, exp = player.score, total_exp(player)
+            boss_health = world.boss.health if world.boss is not None else 0
+            if skip == 0:
+                self.apply_action(name)
+            if self.auto_evolve is not None:
+                world.apply_input(self.player_id, evolve=self.auto_evolve)
+            world.step()
+
+            reward += (player.score - score) * weights["score"]
+            reward += (total_exp(player) - exp) * weights["exp"]
+            if world.boss is not None:
+                reward += max(0, boss_health - world.boss.health) * weights["boss_damage"]
+            if not player.alive:
+                reward += weights["death"]
+                break
+            reward += weights["survival"]
+            if world.finished:
+                reward += weights["victory"]
+                break
+        self._rng_state = random.getstate()
+        random.setstate(saved_state)
+
+        self.steps += 1
+        self.episode_return += reward
+        terminated = not player.alive or world.finished
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observe().copy(), reward, terminated, truncated, self.get_info()
+
+    def apply_action(self, name):
+        """행동 이름을 월드 입력으로 변환"""
+        if name is None:
+            return
+        if name in DIRECTIONS:
+            self.world.apply_input(self.player_id, direction=name)
+        elif name == "DASH":
+            self.world.apply_input(self.player_id, dash=True)
+        elif name == "CHARGE" and self.game_mode == "BOSS":
+            start_charge(self.player)
+
+    def get_info(self):
+        player = self.player
+        return {
+            "tick": self.world.tick,
+            "score": player.score,
+            "level": player.level,
+            "length": len(player.body),
+            "episode_return": self.episode_return,
+            "episode_length": self.steps,
+        }
+
+    def observe(self):
+        """현재 상태를 관측 벡터로 변환 (내부 버퍼를 채워서 반환)"""
+        world = self.world
+        player = self.player
+        obs = self._observation
+        obs[:] = 0.0
+        if not player.alive:
+            return obs
+
+        head_x, head_y = player.get_head()
+        obs[0] = head_x / WIDTH
+        obs[1] = head_y / HEIGHT
+        obs[2 + DIRECTIONS.index(player.direction)] = 1.0
+        obs[6] = min(len(player.body) / 100, 1.0)
+        obs[7] = min(player.energy / 100, 1.0)
+        obs[8] = min(player.level / 20, 1.0)
+        obs[9] = player.exp / player.exp_to_level
+        obs[10] = 1.0 if player.dash_cooldown == 0 and not player.is_dashing else 0.0
+        obs[11] = 1.0 if player.is_dashing else 0.0
+
+        obs[12:14] = nearest_offset(head_x, head_y,
+                                    ((food.x, food.y) for food in world.food_list if not food.is_item))
+        obs[14:16] = nearest_offset(head_x, head_y,
+                                    ((food.x, food.y) for food in world.food_list if food.is_item))
+
+        # 다른 뱀: 가장 가까운 머리와 위험 칸 (월드 점유 격자에서 몸통이 있는 칸)
+        enemy = None
+        enemy_distance = None
+        for snake in world.snakes:
+            if not snake.alive or snake is player or snake is world.boss:
+                continue
+            x, y = snake.get_head()
+            distance = (x - head_x) ** 2 + (y - head_y) ** 2
+            if enemy_distance is None or distance < enemy_distance:
+                enemy, enemy_distance = snake, distance
+        if enemy is not None:
+            x, y = enemy.get_head()
+            obs[16] = (x - head_x) / WIDTH
+            obs[17] = (y - head_y) / HEIGHT
+            obs[18] = max(-1.0, min((len(enemy.body) - len(player.body)) / 50, 1.0))
+
+        cell_x, cell_y = int(head_x) // CELL_SIZE, int(head_y) // CELL_SIZE
+        columns, rows = WIDTH // CELL_SIZE, HEIGHT // CELL_SIZE
+        for index, direction in enumerate(DIRECTIONS):
+            step_x, step_y = DIRECTION_STEPS[direction]
+            x, y = cell_x + step_x, cell_y + step_y
+            if not (0 <= x < columns and 0 <= y < rows) or world.arena.count(BODIES, x * CELL_SIZE, y * CELL_SIZE):
+                obs[19 + index] = 1.0
+
+        boss = world.boss
+        if boss is not None and boss.alive:
+            x, y = boss.get_head()
+            obs[23] = (x - head_x) / WIDTH
+            obs[24] = (y - head_y) / HEIGHT
+            obs[25] = boss.health / boss.max_health
+            obs[26:28] = nearest_offset(head_x, head_y,
+                                        ((projectile.x, projectile.y) for projectile in boss.projectiles))
+        return obs
+
+    def close(self):
+        self.world = None
+
+#############################################
+# 벡터 환경
+#############################################
+def make_vector_info(envs):
+    """환경별 info를 키별 배열로 모음 (Gymnasium 벡터 환경 형식)"""
+    return {
+        "score": np.array([env.player.score for env in envs], dtype=np.int64),
+        "level": np.array([env.player.level for env in envs], dtype=np.int64),
+        "length": np.array([len(env.player.body) for env in envs], dtype=np.int64),
+    }
+
+class SyncVectorSnakeEnv:
+    """
+    같은 프로세스에서 N개 월드를 한 번에 진행하는 벡터 환경
+
+    끝난 환경은 같은 step 안에서 바로 reset되며, 끝나기 직전 관측과 에피소드 결과는
+    info의 "final_observation" / "episode_return" / "episode_length"에 (마스크 "_final_observation"와 함께) 담긴다.
+    """
+
+    def __init__(self, num_envs, **env_kwargs):
+        """
+        Args:
+            num_envs: int - 환경 수
+            env_kwargs: SnakeEnv 생성 인자
+        """
+        self.num_envs = num_envs
+        self.envs = [SnakeEnv(**env_kwargs) for _ in range(num_envs)]
+        if spaces is not None:
+            self.single_observation_space = self.envs[0].observation_space
+            self.single_action_space = self.envs[0].action_space
+            self.observation_space = spaces.Box(-1.0, 1.0, shape=(num_envs, OBSERVATION_SIZE), dtype=np.float32)
+            self.action_space = spaces.MultiDiscrete([len(ACTIONS)] * num_envs)
+        self.observations = np.zeros((num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed=None, options=None):
+        """
+        모든 환경 reset
+
+        Args:
+            seed: int 또는 list - 정수면 환경 i는 seed + i 사용
+        """
+        if seed is None or isinstance(seed, int):
+            seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+        for index, env in enumerate(self.envs):
+            self.observations[index], _ = env.reset(seed=seeds[index], options=options)
+        return self.observations.copy(), make_vector_info(self.envs)
+
+    def step(self, actions):
+        """
+        모든 환경을 한 step씩 진행
+
+        Returns:
+            tuple: (관측 배열, 보상 배열, terminated 배열, truncated 배열, info)
+        """
+        final_observations = {}
+        final_results = {}
+        for index, env in enumerate(self.envs):
+            observation, reward, terminated, truncated, info = env.step(actions[index])
+            self.rewards[index] = reward
+            self.terminated[index] = terminated
+            self.truncated[index] = truncated
+            if terminated or truncated:
+                final_observations[index] = observation
+                final_results[index] = (info["episode_return"], info["episode_length"])
+                observation, _ = env.reset()
+            self.observations[index] = observation
+
+        infos = make_vector_info(self.envs)
+        if final_observations:
+            infos.update(make_final_info(self.num_envs, final_observations, final_results))
+        return (self.observations.copy(), self.rewards.copy(),
+                self.terminated.copy(), self.truncated.copy(), infos)
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+def make_final_info(num_envs, final_observations, final_results):
+    """끝난 환경의 마지막 관측과 에피소드 결과를 info 형식으로 변환"""
+    mask = np.zeros(num_envs, dtype=bool)
+    observations = np.empty(num_envs, dtype=object)
+    returns = np.zeros(num_envs, dtype=np.float32)
+    lengths = np.zeros(num_envs, dtype=np.int64)
+    for index, observation in final_observations.items():
+        mask[index] = True
+        observations[index] = observation
+        returns[index], lengths[index] = final_results[index]
+    return {
+        "final_observation": observations, "_final_observation": mask,
+        "episode_return": returns, "episode_length": lengths,
+    }
+
+def vector_worker_main(conn, num_envs, env_kwargs):
+    """워커 프로세스 진입점 - 환경 num_envs개를 SyncVectorSnakeEnv로 진행"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    envs = SyncVectorSnakeEnv(num_envs, **env_kwargs)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "step":
+                conn.send(envs.step(data))
+            elif command == "reset":
+                seeds, options = data
+                conn.send(envs.reset(seed=seeds, options=options))
+            elif command == "close":
+                break
+    except (KeyboardInterrupt, EOFError, BrokenPipeError):
+        pass
+    finally:
+        envs.close()
+        conn.close()
+
+class SubprocVectorSnakeEnv:
+    """
+    N개 월드를 워커 프로세스에 나눠서 진행하는 벡터 환경
+
+    워커 하나가 환경 여러 개를 맡아서 한 번의 메시지로 함께 진행하므로,
+    환경 수가 코어 수보다 많아도 프로세스 간 통신 횟수는 워커 수만큼만 든다.
+    인터페이스와 자동 reset 규칙은 SyncVectorSnakeEnv와 같다.
+    """
+
+    def __init__(self, num_envs, num_workers=None, **env_kwargs):
+        """
+        Args:
+            num_envs: int - 전체 환경 수
+            num_workers: int - 워커 프로세스 수 (None이면 CPU 코어 수, 환경 수보다 많지 않게)
+            env_kwargs: SnakeEnv 생성 인자
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, num_envs))
+        self.num_envs = num_envs
+        # 환경을 워커에 최대한 고르게 나눔
+        base, extra = divmod(num_envs, num_workers)
+        self.counts = [base + (1 if i < extra else 0) for i in range(num_workers)]
+        self.offsets = [sum(self.counts[:i]) for i in range(num_workers)]
+
+        if spaces is not None:
+            self.single_observation_space = spaces.Box(-1.0, 1.0, shape=(OBSERVATION_SIZE,), dtype=np.float32)
+            self.single_action_space = spaces.Discrete(len(ACTIONS))
+            self.observation_space = spaces.Box(-1.0, 1.0, shape=(num_envs, OBSERVATION_SIZE), dtype=np.float32)
+            self.action_space = spaces.MultiDiscrete([len(ACTIONS)] * num_envs)
+
+        context = multiprocessing.get_context("spawn")
+        self.conns = []
+        self.processes = []
+        for count in self.counts:
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=vector_worker_main, args=(child_conn, count, env_kwargs),
+                                      daemon=True)
+            process.start()
+            child_conn.close()
+            self.conns.append(parent_conn)
+            self.processes.append(process)
+        self.closed = False
+
+    def reset(self, seed=None, options=None):
+        """모든 환경 reset (seed 규칙은 SyncVectorSnakeEnv와 같음)"""
+        if seed is None or isinstance(seed, int):
+            seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        else:
+            seeds = list(seed)
+        for conn, offset, count in zip(self.conns, self.offsets, self.counts):
+            conn.send(("reset", (seeds[offset:offset + count], options)))
+        results = [conn.recv() for conn in self.conns]
+        observations = np.concatenate([result[0] for result in results])
+        return observations, merge_infos([result[1] for result in results], self.counts)
+
+    def step_async(self, actions):
+        """행동을 워커에 보내기만 함 (그동안 학습 쪽 계산을 할 수 있음)"""
+        actions = np.asarray(actions)
+        for conn, offset, count in zip(self.conns, self.offsets, self.counts):
+            conn.send(("step", actions[offset:offset + count]))
+
+    def step_wait(self):
+        """step_async 결과를 모아서 반환"""
+        results = [conn.recv() for conn in self.conns]
+        observations, rewards, terminated, truncated, infos = zip(*results)
+        return (np.concatenate(observations), np.concatenate(rewards),
+                np.concatenate(terminated), np.concatenate(truncated),
+                merge_infos(infos, self.counts))
+
+    def step(self, actions):
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        if getattr(self, "closed", True):
+            return
+        self.closed = True
+        for conn in self.conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self.conns:
+            conn.close()
+
+    def __del__(self):
+        self.close()
+
+def merge_infos(infos, counts):
+    """워커별 info를 전체 환경 기준 배열로 합침 (없는 키는 빈 값으로 채움)"""
+    keys = set()
+    for info in infos:
+        keys.update(info)
+    merged = {}
+    for key in keys:
+        parts = []
+        for info, count in zip(infos, counts):
+            if key in info:
+                parts.append(info[key])
+            elif key == "final_observation":
+                parts.append(np.empty(count, dtype=object))
+            else:
+                dtype = np.asarray(next(i[key] for i in infos if key in i)).dtype
+                parts.append(np.zeros(count, dtype=dtype))
+        merged[key] = np.concatenate(parts)
+    return merged
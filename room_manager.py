@@ -0,0 +1,465 @@
+"""
+Snake Game - 방 관리자 (멀티 프로세스)
+GIL 때문에 한 프로세스가 동시에 돌릴 수 있는 게임 방 수에는 한계가 있으므로,
+방(GameWorld)을 여러 워커 프로세스에 나눠서 돌린다.
+
+- 워커: 자기 방들을 초당 15틱으로 진행하고, 틱마다 클라이언트별 전송 데이터를 한 번에 부모에게 보냄
+- 배치: 새 방은 측정된 부하(틱 처리에 쓴 시간 비율)가 가장 낮은 워커에 배치
+- 균형: 워커 간 부하 차이가 크면 방 하나를 통째로(pickle) 다른 워커로 옮김 (접속은 끊기지 않음)
+- 지표: 방별 틱 처리 시간, 예산 초과 횟수, 워커가 늦어서 밀린 틱 수
+- 드레인: 새 방/입장을 막고 기존 방이 끝날 때까지 기다린 뒤 종료. 워커 하나만 드레인하면 방을 다른 워커로 옮김
+
+부모(게이트웨이)는 server.py의 asyncio 루프에서 동작하며, 클라이언트 소켓은 부모만 가진다.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import pickle
+import signal
+import time
+from world import TICK_RATE
+
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)   # 게이트웨이용으로 코어 하나 남김
+METRICS_INTERVAL = TICK_RATE        # 워커 지표 보고 주기 (틱, 1초)
+REBALANCE_GAP = 0.3                 # 워커 간 부하 차이가 이 이상이면 방 이동
+REBALANCE_MIN_LOAD = 0.5            # 가장 바쁜 워커 부하가 이 이상일 때만 이동
+REBALANCE_COOLDOWN = 5.0            # 방 이동 후 다음 이동까지 대기 (초)
+NEW_ROOM_LOAD = 0.01                # 지표가 오기 전 새 방의 예상 부하
+JOIN_TIMEOUT = 5.0                  # 워커의 입장 응답 대기 시간 (초)
+DRAIN_TIMEOUT = 30.0                # 드레인 시 방이 끝나길 기다리는 최대 시간 (초)
+
+#############################################
+# 워커 프로세스 측
+#############################################
+class RelayClient:
+    """워커 안의 클라이언트 대리 객체 - Room.tick()이 보내는 데이터를 틱 결과 목록에 모음"""
+
+    def __init__(self, room_name, player_id, protocol, outbox):
+        from replication import ClientReplica
+        self.room_name = room_name
+        self.player_id = player_id
+        self.protocol = protocol
+        self.replica = ClientReplica()
+        self.outbox = outbox
+
+    def send(self, data):
+        self.outbox.append((self.room_name, self.player_id, data))
+        return True
+
+    def __getstate__(self):
+        # 방을 다른 워커로 옮길 때 결과 목록은 새 워커 것으로 다시 연결
+        state = self.__dict__.copy()
+        state["outbox"] = None
+        return state
+
+class RoomWorker:
+    """워커 프로세스 하나에서 도는 방 묶음"""
+
+    def __init__(self, index, conn):
+        self.index = index
+        self.conn = conn
+        self.rooms = {}
+        self.outbox = []
+        self.draining = False
+        self.running = True
+        self.busy_time = 0.0
+        self.late_ticks = 0
+
+    def handle(self, command):
+        kind = command[0]
+        if kind == "batch":
+            for item in command[1]:
+                self.handle(item)
+        elif kind == "join":
+            self.join(*command[1:])
+        elif kind == "input":
+            _, room_name, player_id, message = command
+            room = self.rooms.get(room_name)
+            if room is not None:
+                room.queue_input(player_id, message)
+        elif kind == "ack":
+            _, room_name, player_id, tick = command
+            room = self.rooms.get(room_name)
+            client = room.clients.get(player_id) if room is not None else None
+            if client is not None:
+                client.replica.acknowledge(tick)
+        elif kind == "respawn":
+            room = self.rooms.get(command[1])
+            if room is not None:
+                room.pending_respawns.add(command[2])
+        elif kind == "leave":
+            self.leave(command[1], command[2])
+        elif kind == "export":
+            room = self.rooms.pop(command[1], None)
+            blob = pickle.dumps(room, pickle.HIGHEST_PROTOCOL) if room is not None else None
+            self.conn.send(("exported", command[1], blob))
+        elif kind == "import":
+            room = pickle.loads(command[2])
+            for client in room.clients.values():
+                client.outbox = self.outbox
+            self.rooms[command[1]] = room
+        elif kind == "drain":
+            self.draining = True
+        elif kind == "stop":
+            self.running = False
+
+    def join(self, request_id, room_name, game_mode, name, protocol, initial_ai):
+        from server import Room
+        room = self.rooms.get(room_name)
+        if room is None:
+            if self.draining:
+                self.conn.send(("joined", request_id, None, "서버 점검 중입니다."))
+                return
+            room = Room(room_name, game_mode, initial_ai=initial_ai)
+            self.rooms[room_name] = room
+        if room.is_full():
+            self.conn.send(("joined", request_id, None, "방이 가득 찼습니다."))
+            return
+        player_id = room.world.add_player(name)
+        client = RelayClient(room_name, player_id, protocol, self.outbox)
+        room.clients[player_id] = client
+        self.conn.send(("joined", request_id, player_id, room.game_mode))
+
+    def leave(self, room_name, player_id):
+        room = self.rooms.get(room_name)
+        if room is None:
+            return
+        client = room.clients.get(player_id)
+        if client is not None:
+            room.leave(client)
+        if not room.clients:
+            del self.rooms[room_name]
+            self.conn.send(("room_closed", room_name))
+
+    def tick_rooms(self, lateness):
+        """모든 방을 한 틱 진행하고 결과를 부모에게 한 번에 전송"""
+        started = time.perf_counter()
+        late = lateness > 1.0 / TICK_RATE
+        if late:
+            self.late_ticks += 1
+        for room in self.rooms.values():
+            room_started = time.perf_counter()
+            room.tick()
+            room.metrics.record(time.perf_counter() - room_started)
+            if late:
+                room.metrics.late += 1
+        if self.outbox:
+            self.conn.send(("frames", self.outbox[:]))
+            self.outbox.clear()
+        self.busy_time += time.perf_counter() - started
+
+    def report_metrics(self, elapsed):
+        rooms = {}
+        for name, room in self.rooms.items():
+            summary = room.metrics.summary()
+            summary["players"] = len(room.clients)
+            summary["mode"] = room.game_mode
+            rooms[name] = summary
+            room.metrics.reset()
+        load = self.busy_time / elapsed if elapsed > 0 else 0.0
+        self.conn.send(("metrics", self.index, load, self.late_ticks, rooms))
+        self.busy_time = 0.0
+        self.late_ticks = 0
+
+    def run(self):
+        interval = 1.0 / TICK_RATE
+        next_tick = time.perf_counter()
+        report_started = next_tick
+        tick_count = 0
+        while self.running:
+            timeout = next_tick - time.perf_counter()
+            # 다음 틱까지는 명령만 처리 (늦었으면 쌓인 명령만 처리하고 바로 틱 진행)
+            if self.conn.poll(max(0.0, timeout)):
+                while self.running and self.conn.poll(0):
+                    self.handle(self.conn.recv())
+                if timeout > 0:
+                    continue
+            now = time.perf_counter()
+            self.tick_rooms(now - next_tick)
+            tick_count += 1
+            if tick_count % METRICS_INTERVAL == 0:
+                self.report_metrics(now - report_started)
+                report_started = now
+            next_tick += interval
+            if next_tick < time.perf_counter() - interval:
+                next_tick = time.perf_counter()  # 크게 밀렸으면 따라잡지 않고 다시 맞춤
+            if self.draining and not self.rooms:
+                break
+        self.conn.send(("stopped", self.index))
+
+def worker_main(index, conn):
+    """워커 프로세스 진입점"""
+    # Ctrl+C는 부모가 받아서 드레인하므로 워커는 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        RoomWorker(index, conn).run()
+    except (KeyboardInterrupt, EOFError, BrokenPipeError):
+        pass
+
+#############################################
+# 부모(게이트웨이) 측
+#############################################
+class WorkerHandle:
+    """부모가 관리하는 워커 프로세스 정보"""
+
+    def __init__(self, index, process, conn):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.rooms = set()
+        self.load = 0.0
+        self.late_ticks = 0
+        self.room_metrics = {}
+        self.draining = False
+        self.stopped = False
+        self.pending = []   # 다음 flush 때 보낼 명령
+
+    def estimated_load(self):
+        """측정 부하 + 아직 지표가 없는 방의 예상 부하"""
+        unmeasured = sum(1 for name in self.rooms if name not in self.room_metrics)
+        return self.load + unmeasured * NEW_ROOM_LOAD
+
+class RoomManager:
+    """방 배치/이동/드레인을 담당하는 부모 측 관리자"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, initial_ai=None, on_frames=None, on_room_closed=None):
+        """
+        Args:
+            workers: int - 워커 프로세스 수
+            initial_ai: int - 방마다 처음 생성할 AI 뱀 수
+            on_frames: callable(room_name, player_id, data) - 클라이언트에게 보낼 데이터 처리
+            on_room_closed: callable(room_name) - 방이 닫혔을 때
+        """
+        self.worker_count = workers
+        self.initial_ai = initial_ai
+        self.on_frames = on_frames
+        self.on_room_closed = on_room_closed
+        self.workers = []
+        self.room_workers = {}      # room_name -> WorkerHandle
+        self.moving = {}            # room_name -> (대상 워커, 이동 중 쌓인 명령)
+        self.join_requests = {}     # request_id -> Future
+        self.request_ids = itertools.count(1)
+        self.draining = False
+        self.last_rebalance = 0.0
+        self.loop = None
+        self.flush_scheduled = False
+
+    def start(self):
+        """워커 프로세스 시작 (asyncio 루프 안에서 호출)"""
+        self.loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        for index in range(self.worker_count):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=worker_main, args=(index, child_conn),
+                                      name=f"room-worker-{index}", daemon=True)
+            process.start()
+            child_conn.close()
+            handle = WorkerHandle(index, process, parent_conn)
+            self.workers.append(handle)
+            self.loop.add_reader(parent_conn.fileno(), self.on_readable, handle)
+        return self
+
+    # ----- 명령 전송 (이벤트 루프 한 바퀴에 워커별로 한 번만 전송) -----
+    def send(self, handle, command):
+        handle.pending.append(command)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.loop.call_soon(self.flush)
+
+    def flush(self):
+        self.flush_scheduled = False
+        for handle in self.workers:
+            if handle.pending and not handle.stopped:
+                commands = handle.pending
+                handle.pending = []
+                try:
+                    handle.conn.send(("batch", commands) if len(commands) > 1 else commands[0])
+                except (BrokenPipeError, OSError):
+                    handle.stopped = True
+
+    def send_room(self, room_name, command):
+        """방이 있는 워커로 명령 전송 (이동 중이면 도착할 때까지 보관)"""
+        moving = self.moving.get(room_name)
+        if moving is not None:
+            moving[1].append(command)
+            return
+        handle = self.room_workers.get(room_name)
+        if handle is not None:
+            self.send(handle, command)
+
+    # ----- 배치 -----
+    def place_room(self, room_name):
+        """새 방을 가장 한가한 워커에 배치"""
+        candidates = [handle for handle in self.workers if not handle.draining and not handle.stopped]
+        if not candidates:
+            return None
+        handle = min(candidates, key=lambda h: (h.estimated_load(), len(h.rooms)))
+        handle.rooms.add(room_name)
+        self.room_workers[room_name] = handle
+        return handle
+
+    async def join(self, room_name, game_mode, name, protocol):
+        """
+        방 입장 (방이 없으면 배치 후 생성)
+
+        Returns:
+            (player_id, 방 모드) 또는 (None, 오류 메시지)
+        """
+        if self.draining:
+            return None, "서버 점검 중입니다."
+        if room_name not in self.room_workers and self.place_room(room_name) is None:
+            return None, "사용 가능한 워커가 없습니다."
+        request_id = next(self.request_ids)
+        future = self.loop.create_future()
+        self.join_requests[request_id] = future
+        self.send_room(room_name, ("join", request_id, room_name, game_mode, name, protocol, self.initial_ai))
+        try:
+            return await asyncio.wait_for(future, JOIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.join_requests.pop(request_id, None)
+            return None, "워커가 응답하지 않습니다."
+
+    def queue_input(self, room_name, player_id, message):
+        self.send_room(room_name, ("input", room_name, player_id, message))
+
+    def acknowledge(self, room_name, player_id, tick):
+        self.send_room(room_name, ("ack", room_name, player_id, tick))
+
+    def respawn(self, room_name, player_id):
+        self.send_room(room_name, ("respawn", room_name, player_id))
+
+    def leave(self, room_name, player_id):
+        self.send_room(room_name, ("leave", room_name, player_id))
+
+    # ----- 워커 메시지 처리 -----
+    def on_readable(self, handle):
+        try:
+            while handle.conn.poll():
+                self.dispatch(handle, handle.conn.recv())
+        except (EOFError, OSError):
+            self.loop.remove_reader(handle.conn.fileno())
+            handle.stopped = True
+
+    def dispatch(self, handle, message):
+        kind = message[0]
+        if kind == "frames":
+            if self.on_frames is not None:
+                for room_name, player_id, data in message[1]:
+                    self.on_frames(room_name, player_id, data)
+        elif kind == "joined":
+            _, request_id, player_id, detail = message
+            future = self.join_requests.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result((player_id, detail))
+        elif kind == "metrics":
+            _, _, load, late_ticks, rooms = message
+            handle.load = load
+            handle.late_ticks = late_ticks
+            handle.room_metrics = rooms
+            self.rebalance()
+        elif kind == "room_closed":
+            room_name = message[1]
+            if self.room_workers.get(room_name) is handle:
+                del self.room_workers[room_name]
+            handle.rooms.discard(room_name)
+            handle.room_metrics.pop(room_name, None)
+            if self.on_room_closed is not None:
+                self.on_room_closed(room_name)
+        elif kind == "exported":
+            self.finish_move(handle, message[1], message[2])
+        elif kind == "stopped":
+            handle.stopped = True
+
+    # ----- 부하 균형 / 방 이동 -----
+    def rebalance(self):
+        """가장 바쁜 워커의 방 하나를 가장 한가한 워커로 이동"""
+        now = time.monotonic()
+        if self.moving or now - self.last_rebalance < REBALANCE_COOLDOWN:
+            return
+        active = [handle for handle in self.workers if not handle.stopped and not handle.draining]
+        if len(active) < 2:
+            return
+        busiest = max(active, key=lambda h: h.load)
+        idlest = min(active, key=lambda h: h.estimated_load())
+        gap = busiest.load - idlest.estimated_load()
+        if busiest.load < REBALANCE_MIN_LOAD or gap < REBALANCE_GAP:
+            return
+        # 부하 차이의 절반에 가장 가까운 방을 옮김
+        costs = {name: metrics["avg_ms"] * TICK_RATE / 1000 for name, metrics in busiest.room_metrics.items()
+                 if name in busiest.rooms}
+        if not costs:
+            return
+        room_name = min(costs, key=lambda name: abs(costs[name] - gap / 2))
+        self.last_rebalance = now
+        self.move_room(room_name, idlest)
+
+    def move_room(self, room_name, target):
+        """방을 다른 워커로 이동 (상태를 pickle로 옮김, 이동 중 명령은 보관했다가 대상 워커로 전달)"""
+        source = self.room_workers.get(room_name)
+        if source is None or source is target or room_name in self.moving:
+            return False
+        self.moving[room_name] = (target, [])
+        self.send(source, ("export", room_name))
+        return True
+
+    def finish_move(self, source, room_name, blob):
+        target, pending = self.moving.pop(room_name)
+        source.rooms.discard(room_name)
+        source.room_metrics.pop(room_name, None)
+        if blob is None:
+            # 이동 요청 전에 방이 닫혔음
+            self.room_workers.pop(room_name, None)
+            return
+        if target.stopped:
+            target = self.place_room(room_name) or source
+        target.rooms.add(room_name)
+        self.room_workers[room_name] = target
+        self.send(target, ("import", room_name, blob))
+        for command in pending:
+            self.send(target, command)
+
+    # ----- 지표 / 드레인 -----
+    def summary(self):
+        """워커별 부하와 방별 지표"""
+        return [{
+            "worker": handle.index,
+            "load": round(handle.load, 3),
+            "late_ticks": handle.late_ticks,
+            "rooms": len(handle.rooms),
+            "draining": handle.draining,
+            "room_metrics": handle.room_metrics,
+        } for handle in self.workers if not handle.stopped]
+
+    def drain_worker(self, index):
+        """워커 하나를 비움 - 새 방을 받지 않고 기존 방은 다른 워커로 옮긴 뒤 종료"""
+        handle = self.workers[index]
+        handle.draining = True
+        for room_name in list(handle.rooms):
+            candidates = [h for h in self.workers if not h.draining and not h.stopped]
+            if candidates:
+                self.move_room(room_name, min(candidates, key=lambda h: h.estimated_load()))
+        self.send(handle, ("drain",))
+
+    async def shutdown(self, timeout=DRAIN_TIMEOUT):
+        """전체 드레인 - 새 입장을 막고 진행 중인 방이 끝나길 기다린 뒤 워커 종료"""
+        self.draining = True
+        for handle in self.workers:
+            handle.draining = True
+            self.send(handle, ("drain",))
+        deadline = time.monotonic() + timeout
+        while self.room_workers and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        for handle in self.workers:
+            self.send(handle, ("stop",))
+        self.flush()
+        for handle in self.workers:
+            await self.loop.run_in_executor(None, handle.process.join, 2.0)
+            if handle.process.is_alive():
+                handle.process.terminate()
+            try:
+                self.loop.remove_reader(handle.conn.fileno())
+            except (ValueError, OSError):
+                pass
+            handle.stopped = True
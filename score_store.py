@@ -0,0 +1,175 @@
+"""
+Snake Game - 점수 저장소 모듈
+SQLite(WAL 모드)에 점수를 저장해서 여러 게임 프로세스가 동시에 기록해도 안전하고,
+기록 도중 프로세스가 죽어도 파일이 깨지지 않도록 한다.
+모드별/날짜별 인덱스로 상위 N개 조회를 지원하며, 기존 leaderboard.json은 처음 한 번만 가져온다.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+SCORE_DB_FILE = "scores.db"
+LEGACY_LEADERBOARD_FILE = "leaderboard.json"
+LEGACY_MODE = "LEGACY"  # 모드 정보가 없는 기존 JSON 기록용
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    name  TEXT    NOT NULL,
+    score INTEGER NOT NULL,
+    mode  TEXT    NOT NULL,
+    day   TEXT    NOT NULL,
+    time  TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_mode_score ON scores (mode, score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_day_score ON scores (day, score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+def normalize_name(name):
+    """저장할 이름 정리 (문자열이 아니거나 비어 있으면 UNKNOWN)"""
+    if isinstance(name, str) and name.strip():
+        return name.strip()
+    return "UNKNOWN"
+
+class ScoreStore:
+    """SQLite 기반 점수 저장소"""
+
+    def __init__(self, path=SCORE_DB_FILE, legacy_path=LEGACY_LEADERBOARD_FILE):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.initialized = False
+
+    def connect(self):
+        """
+        새 연결 생성 (연결은 작업마다 열고 닫아서 스레드/프로세스 간 공유하지 않음)
+
+        Returns:
+            sqlite3.Connection
+        """
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")    # 읽기와 쓰기가 서로 막지 않음
+        conn.execute("PRAGMA synchronous=FULL")    # 커밋된 기록은 크래시 후에도 유지
+        conn.execute("PRAGMA busy_timeout=5000")   # 다른 프로세스가 쓰는 중이면 대기
+        return conn
+
+    def initialize(self):
+        """스키마 생성 및 기존 JSON 리더보드 가져오기 (프로세스당 한 번)"""
+        if self.initialized:
+            return
+        conn = self.connect()
+        try:
+            conn.executescript(SCHEMA)
+            self.import_legacy_json(conn)
+        finally:
+            conn.close()
+        self.initialized = True
+
+    def import_legacy_json(self, conn):
+        """기존 leaderboard.json 기록을 한 번만 가져옴 (동시에 실행돼도 한 프로세스만 가져감)"""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            imported = conn.execute(
+                "SELECT value FROM meta WHERE key = 'legacy_json_imported'").fetchone()
+            if imported is None:
+                for entry in self.read_legacy_json():
+                    conn.execute(
+                        "INSERT INTO scores (name, score, mode, day, time) VALUES (?, ?, ?, ?, ?)",
+                        entry)
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('legacy_json_imported', ?)",
+                    (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def read_legacy_json(self):
+        """기존 JSON 리더보드를 (name, score, mode, day, time) 목록으로 읽기"""
+        try:
+            with open(self.legacy_path, 'r') as f:
+                board = json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            print("기존 리더보드 파일을 읽을 수 없어 가져오기를 건너뜁니다:", e)
+            return []
+
+        entries = []
+        for item in board if isinstance(board, list) else []:
+            try:
+                score = int(item["score"])
+                time_text = str(item.get("time") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            except (KeyError, TypeError, ValueError):
+                continue
+            entries.append((normalize_name(item.get("name")), score, LEGACY_MODE, time_text[:10], time_text))
+        return entries
+
+    def add_score(self, name, score, mode):
+        """
+        점수 기록 추가 (단일 트랜잭션으로 원자적으로 기록)
+
+        Args:
+            name: str - 플레이어 이름
+            score: int - 점수
+            mode: str - 게임 모드 ("CLASSIC", "EVOLUTION", "BOSS")
+        """
+        self.initialize()
+        now = datetime.now()
+        conn = self.connect()
+        try:
+            conn.execute(
+                "INSERT INTO scores (name, score, mode, day, time) VALUES (?, ?, ?, ?, ?)",
+                (normalize_name(name), int(score), mode,
+                 now.strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d %H:%M:%S")))
+        finally:
+            conn.close()
+
+    def top_scores(self, limit=3, mode=None, day=None):
+        """
+        상위 점수 조회 (모드/날짜 조건은 인덱스로 처리)
+
+        Args:
+            limit: int - 가져올 개수
+            mode: str - 특정 모드만 조회 (None이면 전체)
+            day: str - 특정 날짜만 조회 ("YYYY-MM-DD", None이면 전체)
+
+        Returns:
+            list: [{"name", "score", "mode", "time"}, ...] 점수 내림차순
+        """
+        self.initialize()
+        conditions = []
+        params = []
+        if mode is not None:
+            conditions.append("mode = ?")
+            params.append(mode)
+        if day is not None:
+            conditions.append("day = ?")
+            params.append(day)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
+        conn = self.connect()
+        try:
+            rows = conn.execute(
+                f"SELECT name, score, mode, time FROM scores {where} ORDER BY score DESC, id ASC LIMIT ?",
+                params).fetchall()
+        finally:
+            conn.close()
+        return [{"name": name, "score": score, "mode": mode, "time": time_text}
+                for name, score, mode, time_text in rows]
+
+# 전역 점수 저장소 인스턴스
+score_store = None
+
+def get_score_store():
+    """점수 저장소 싱글톤 반환"""
+    global score_store
+    if score_store is None:
+        score_store = ScoreStore()
+    return score_store
@@ -0,0 +1,415 @@
+"""
+Snake Game - 멀티플레이 서버
+asyncio 기반의 권한 서버(authoritative server).
+서버가 방마다 GameWorld를 초당 15틱으로 진행하고, 클라이언트는 입력(방향/대시/돌진 등)만 보낸다.
+매 틱이 끝나면 상태를 클라이언트에게 보낸다 (JSON 전체 상태 또는 바이너리 델타).
+
+프로토콜: TCP. 클라이언트가 보내는 메시지는 모두 줄 단위 JSON (한 줄 = 메시지 하나)
+    클라이언트 -> 서버
+        {"type": "join", "name": "YOU", "room": "main", "mode": "EVOLUTION", "protocol": "binary"}
+        {"type": "input", "direction": "UP", "dash": true, "charge": false,
+         "tank": false, "evolve": "SPEEDER", "upgrade": "SPEED"}
+        {"type": "respawn"}
+        {"type": "ack", "tick": 120}     (binary 프로토콜: 마지막으로 적용한 틱)
+    서버 -> 클라이언트
+        {"type": "welcome", "player_id": 3, "room": "main", "mode": "EVOLUTION", "tick_rate": 15, ...}
+        {"type": "state", "tick": 120, "snakes": [...], "food": [...], "projectiles": [...], ...}
+        {"type": "error", "message": "..."}
+    welcome 이후 상태 전송은 protocol에 따라
+        "json": 매 틱 전체 상태 {"type": "state", ...} 한 줄
+        "binary": replication.py의 길이 접두어 + 키프레임/델타 메시지 (ack 기준 차이만 전송)
+
+실행: python server.py --host 127.0.0.1 --port 8765
+      python server.py --workers 4   (방을 워커 프로세스 4개에 나눠서 실행, room_manager.py)
+"""
+
+import argparse
+import asyncio
+import json
+import signal
+import time
+from world import GameWorld, TICK_RATE
+from replication import Replicator, ClientReplica
+from module import WIDTH, HEIGHT, CELL_SIZE
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_ROOM = "main"
+DEFAULT_MODE = "EVOLUTION"
+GAME_MODES = ("CLASSIC", "EVOLUTION", "BOSS")
+PROTOCOLS = ("json", "binary")
+
+MAX_PLAYERS_PER_ROOM = 64
+MAX_MESSAGE_SIZE = 4096             # 클라이언트가 보내는 한 줄의 최대 길이
+SEND_BUFFER_LIMIT = 256 * 1024      # 송신 버퍼가 이만큼 밀린 클라이언트는 이번 틱 상태를 건너뜀
+SLOW_CLIENT_LIMIT = 4 * 1024 * 1024 # 이 이상 밀리면 연결 종료
+STATS_INTERVAL = 10.0               # 틱 통계 출력 주기 (초)
+
+def encode_message(message):
+    """메시지를 줄 단위 JSON 바이트로 변환"""
+    return (json.dumps(message, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+class TickMetrics:
+    """틱 처리 시간 통계 (틱 예산 초과 횟수 포함)"""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.overruns = 0
+        self.late = 0   # 예정 시각보다 한 틱 이상 늦게 시작한 틱 수
+
+    def record(self, duration):
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        if duration > self.budget:
+            self.overruns += 1
+
+    def summary(self):
+        average = self.total / self.count if self.count else 0.0
+        return {
+            "ticks": self.count,
+            "avg_ms": round(average * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+            "overruns": self.overruns,
+            "late": self.late,
+        }
+
+class ClientConnection:
+    """접속한 클라이언트 하나"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.peer = writer.get_extra_info("peername")
+        self.player_id = None
+        self.room = None
+        self.room_name = None
+        self.protocol = "json"
+        self.replica = ClientReplica()  # binary 프로토콜의 ack 상태
+        self.skipped_states = 0
+        self.closed = False
+
+    def send(self, data):
+        """
+        버퍼에 쓰기만 하고 기다리지 않음 (느린 클라이언트가 틱 루프를 막지 않도록)
+
+        Returns:
+            bool: 실제로 보냈는지 여부
+        """
+        if self.closed:
+            return False
+        transport = self.writer.transport
+        if transport.is_closing():
+            self.closed = True
+            return False
+        buffered = transport.get_write_buffer_size()
+        if buffered > SLOW_CLIENT_LIMIT:
+            print(f"클라이언트 {self.peer} 응답이 너무 느려 연결을 종료합니다.")
+            self.close()
+            return False
+        if buffered > SEND_BUFFER_LIMIT:
+            self.skipped_states += 1
+            return False
+        self.writer.write(data)
+        return True
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.writer.close()
+
+class Room:
+    """게임 방 - GameWorld 하나와 그 방의 클라이언트들"""
+
+    def __init__(self, name, game_mode=DEFAULT_MODE, initial_ai=None, seed=None):
+        self.name = name
+        self.game_mode = game_mode
+        self.world = GameWorld(game_mode, seed=seed, initial_ai=initial_ai)
+        self.clients = {}           # player_id -> ClientConnection
+        self.pending_inputs = {}    # player_id -> 다음 틱에 적용할 입력
+        self.pending_respawns = set()
+        self.replicator = Replicator()
+        self.metrics = TickMetrics(1.0 / TICK_RATE)
+        self.task = None
+
+    def is_full(self):
+        return len(self.clients) >= MAX_PLAYERS_PER_ROOM
+
+    def join(self, client, name):
+        player_id = self.world.add_player(name)
+        client.player_id = player_id
+        client.room = self
+        self.clients[player_id] = client
+        return player_id
+
+    def leave(self, client):
+        if self.clients.pop(client.player_id, None) is not None:
+            self.pending_inputs.pop(client.player_id, None)
+            self.pending_respawns.discard(client.player_id)
+            self.world.remove_player(client.player_id)
+
+    def queue_input(self, player_id, message):
+        """
+        입력을 다음 틱까지 모아둠 (한 틱 사이에 여러 번 오면 방향은 마지막 값, 버튼은 한 번이라도 눌렸으면 적용)
+        """
+        pending = self.pending_inputs.setdefault(player_id, {})
+        for key in ("direction", "evolve", "upgrade"):
+            if isinstance(message.get(key), str):
+                pending[key] = message[key]
+        for key in ("dash", "charge", "tank"):
+            if message.get(key):
+                pending[key] = True
+
+    def tick(self):
+        """입력 적용 -> 월드 한 틱 진행 -> 상태 전송"""
+        world = self.world
+        for player_id in self.pending_respawns:
+            world.respawn_player(player_id)
+        self.pending_respawns.clear()
+        for player_id, pending in self.pending_inputs.items():
+            world.apply_input(player_id, **pending)
+        self.pending_inputs.clear()
+
+        world.step()
+
+        # 전체 상태 JSON은 틱마다 한 번만 직렬화, 바이너리는 같은 기준 틱끼리 인코딩 결과 공유
+        self.replicator.capture(world)
+        json_data = None
+        for client in list(self.clients.values()):
+            if client.protocol == "binary":
+                client.send(self.replicator.message_for(client.replica))
+            else:
+                if json_data is None:
+                    state = world.snapshot()
+                    state["type"] = "state"
+                    json_data = encode_message(state)
+                client.send(json_data)
+
+    async def run(self):
+        """고정 간격 틱 루프 - 늦어진 틱은 몰아서 따라잡지 않고 다음 간격부터 다시 맞춤"""
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / TICK_RATE
+        next_tick = loop.time()
+        while True:
+            started = time.perf_counter()
+            self.tick()
+            self.metrics.record(time.perf_counter() - started)
+
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+class GameServer:
+    """방 관리 + 클라이언트 접속 처리"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, initial_ai=None, verbose=True, workers=0):
+        """
+        Args:
+            workers: int - 0이면 이 프로세스에서 방을 돌리고, 1 이상이면 워커 프로세스에 나눠서 실행
+        """
+        self.host = host
+        self.port = port
+        self.initial_ai = initial_ai
+        self.verbose = verbose
+        self.workers = workers
+        self.rooms = {}
+        self.manager = None
+        self.remote_clients = {}    # (room_name, player_id) -> ClientConnection (워커 모드)
+        self.server = None
+
+    def get_room(self, name, game_mode):
+        """방 조회, 없으면 만들고 틱 루프 시작 (모드는 처음 만든 사람 기준)"""
+        room = self.rooms.get(name)
+        if room is None:
+            room = Room(name, game_mode, initial_ai=self.initial_ai)
+            room.task = asyncio.get_running_loop().create_task(room.run())
+            self.rooms[name] = room
+        return room
+
+    def close_room_if_empty(self, room):
+        if not room.clients and self.rooms.get(room.name) is room:
+            room.task.cancel()
+            del self.rooms[room.name]
+
+    async def handle_client(self, reader, writer):
+        client = ClientConnection(reader, writer)
+        try:
+            message = await self.read_message(client)
+            if message is None or message.get("type") != "join":
+                client.send(encode_message({"type": "error", "message": "join 메시지가 필요합니다."}))
+                return
+            room_name = str(message.get("room") or DEFAULT_ROOM)
+            game_mode = message.get("mode") if message.get("mode") in GAME_MODES else DEFAULT_MODE
+            name = str(message.get("name") or "Player")[:12]
+            if message.get("protocol") in PROTOCOLS:
+                client.protocol = message["protocol"]
+
+            if self.manager is not None:
+                player_id, detail = await self.manager.join(room_name, game_mode, name, client.protocol)
+                if player_id is None:
+                    client.send(encode_message({"type": "error", "message": detail}))
+                    return
+                game_mode = detail
+                client.player_id = player_id
+                client.room_name = room_name
+                self.remote_clients[(room_name, player_id)] = client
+                room = None
+            else:
+                room = self.get_room(room_name, game_mode)
+                if room.is_full():
+                    client.send(encode_message({"type": "error", "message": "방이 가득 찼습니다."}))
+                    return
+                player_id = room.join(client, name)
+                game_mode = room.game_mode
+            client.send(encode_message({
+                "type": "welcome",
+                "player_id": player_id,
+                "room": room_name,
+                "mode": game_mode,
+                "tick_rate": TICK_RATE,
+                "width": WIDTH,
+                "height": HEIGHT,
+                "cell_size": CELL_SIZE,
+                "protocol": client.protocol,
+            }))
+
+            while not client.closed:
+                message = await self.read_message(client)
+                if message is None:
+                    break
+                kind = message.get("type")
+                if room is None:
+                    self.route_message(client, kind, message)
+                elif kind == "input":
+                    room.queue_input(player_id, message)
+                elif kind == "respawn":
+                    room.pending_respawns.add(player_id)
+                elif kind == "ack" and isinstance(message.get("tick"), int):
+                    client.replica.acknowledge(message["tick"])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if client.room is not None:
+                client.room.leave(client)
+                self.close_room_if_empty(client.room)
+            elif client.room_name is not None:
+                self.remote_clients.pop((client.room_name, client.player_id), None)
+                self.manager.leave(client.room_name, client.player_id)
+            client.close()
+
+    def route_message(self, client, kind, message):
+        """워커 모드 - 클라이언트 메시지를 방이 있는 워커로 전달"""
+        if kind == "input":
+            self.manager.queue_input(client.room_name, client.player_id, message)
+        elif kind == "respawn":
+            self.manager.respawn(client.room_name, client.player_id)
+        elif kind == "ack" and isinstance(message.get("tick"), int):
+            self.manager.acknowledge(client.room_name, client.player_id, message["tick"])
+
+    def deliver(self, room_name, player_id, data):
+        """워커가 만든 전송 데이터를 해당 클라이언트에게 전달"""
+        client = self.remote_clients.get((room_name, player_id))
+        if client is not None:
+            client.send(data)
+
+    async def read_message(self, client):
+        """한 줄을 읽어 JSON 메시지로 변환 (연결 종료 시 None)"""
+        while True:
+            try:
+                line = await client.reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError:
+                return None
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # 잘못된 메시지는 무시
+            if isinstance(message, dict):
+                return message
+
+    async def report_stats(self):
+        """방별 틱 처리 시간 주기적 출력"""
+        while True:
+            await asyncio.sleep(STATS_INTERVAL)
+            if self.manager is not None:
+                for worker in self.manager.summary():
+                    overrun_rooms = sum(1 for metrics in worker["room_metrics"].values() if metrics["overruns"])
+                    print(f"[워커 {worker['worker']}] 방 {worker['rooms']}개, 부하 {worker['load']:.0%}, "
+                          f"밀린 틱 {worker['late_ticks']}회, 예산 초과 방 {overrun_rooms}개"
+                          + (" (드레인 중)" if worker["draining"] else ""))
+                continue
+            for room in list(self.rooms.values()):
+                stats = room.metrics.summary()
+                print(f"[{room.name}] 플레이어 {len(room.clients)}명, 뱀 {len(room.world.snakes)}마리, "
+                      f"틱 평균 {stats['avg_ms']}ms / 최대 {stats['max_ms']}ms, 예산 초과 {stats['overruns']}회")
+                room.metrics.reset()
+
+    async def start(self):
+        if self.workers > 0:
+            from room_manager import RoomManager
+            self.manager = RoomManager(self.workers, initial_ai=self.initial_ai, on_frames=self.deliver).start()
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, limit=MAX_MESSAGE_SIZE)
+        self.port = self.server.sockets[0].getsockname()[1]
+        if self.verbose:
+            workers = f", 워커 {self.workers}개" if self.workers > 0 else ""
+            print(f"서버 시작: {self.host}:{self.port} (초당 {TICK_RATE}틱{workers})")
+            asyncio.get_running_loop().create_task(self.report_stats())
+        return self
+
+    async def serve_forever(self):
+        """종료 신호(Ctrl+C, SIGTERM)를 받을 때까지 실행 후 드레인"""
+        await self.start()
+        stop_requested = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_requested.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows 등에서는 KeyboardInterrupt로 종료
+        await stop_requested.wait()
+        print("서버를 종료합니다. 진행 중인 게임이 끝나길 기다립니다...")
+        await self.stop()
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()   # 새 접속부터 막음
+        if self.manager is not None:
+            await self.manager.shutdown()
+            for client in list(self.remote_clients.values()):
+                client.close()
+            self.remote_clients.clear()
+        for room in list(self.rooms.values()):
+            room.task.cancel()
+            for client in list(room.clients.values()):
+                client.close()
+        self.rooms.clear()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake Game 멀티플레이 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--ai", type=int, default=None, help="방마다 처음 생성할 AI 뱀 수")
+    parser.add_argument("--workers", type=int, default=0, help="방을 나눠 돌릴 워커 프로세스 수 (0: 단일 프로세스)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(GameServer(args.host, args.port, initial_ai=args.ai, workers=args.workers).serve_forever())
+    except KeyboardInterrupt:
+        print("서버를 종료합니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Snake Game - 시작 처리 모듈
+실행할 때마다 pip을 호출하지 않도록 설치된 패키지 버전을 프로세스 안에서 확인하고,
+시작 단계별 소요 시간(임포트, pygame.init, 폰트 로드, 에셋 로드, 첫 프레임)을 기록한다.
+"""
+
+import sys
+import json
+import time
+import hashlib
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+from importlib import metadata
+
+# 프로세스 시작 기준 시각 (main.py가 가장 먼저 임포트함)
+PROCESS_START = time.perf_counter()
+
+REQUIREMENTS_FILE = "requirements.txt"
+REQUIREMENTS_STAMP_FILE = ".requirements_stamp"  # 마지막으로 확인한 설치 상태
+STARTUP_LOG_FILE = "startup_timing.jsonl"       # 시작 시간 기록 (한 줄에 한 번의 실행)
+
+def read_requirements(path=REQUIREMENTS_FILE):
+    """
+    requirements 파일을 읽어 (패키지 이름, 고정 버전) 목록으로 반환
+    
+    Returns:
+        list: [(name, version 또는 None), ...]
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    # Windows 메모장 등에서 저장한 UTF-16 파일도 지원
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        text = raw.decode("utf-16")
+    else:
+        text = raw.decode("utf-8-sig")
+    
+    requirements = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if "==" in line:
+            name, version = line.split("==", 1)
+            requirements.append((name.strip(), version.strip()))
+        else:
+            requirements.append((line, None))
+    return requirements
+
+def get_installed_versions(requirements):
+    """요구 패키지별 설치된 버전 반환 (설치되지 않았으면 None)"""
+    installed = {}
+    for name, _ in requirements:
+        try:
+            installed[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            installed[name] = None
+    return installed
+
+def requirements_satisfied(requirements, installed):
+    """설치된 버전이 요구사항을 모두 만족하는지 확인"""
+    for name, version in requirements:
+        if installed[name] is None:
+            return False
+        if version is not None and installed[name] != version:
+            return False
+    return True
+
+def build_stamp(path=REQUIREMENTS_FILE):
+    """requirements 파일 내용과 현재 설치 상태로 스탬프 생성"""
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    requirements = read_requirements(path)
+    return {
+        "requirements": digest,
+        "python": sys.version.split()[0],
+        "executable": sys.executable,
+        "installed": get_installed_versions(requirements)
+    }, requirements
+
+def load_stamp():
+    """저장된 스탬프 읽기 (없거나 손상되었으면 None)"""
+    try:
+        with open(REQUIREMENTS_STAMP_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_stamp(stamp):
+    """스탬프 저장 (실패해도 게임 실행에는 영향 없음)"""
+    try:
+        with open(REQUIREMENTS_STAMP_FILE, "w") as f:
+            json.dump(stamp, f, indent=2)
+    except OSError as e:
+        print("설치 상태 스탬프 저장 실패:", e)
+
+def install_requirements():
+    """
+    게임 실행에 필요한 패키지 설치
+    
+    Returns:
+        None
+    """
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_FILE])
+    except subprocess.CalledProcessError as e:
+        print("패키지 설치 중 오류 발생:", e)
+        sys.exit(1)
+
+def ensure_requirements(force_install=False):
+    """
+    필요한 패키지가 설치되어 있는지 프로세스 안에서 확인하고, 부족할 때만 pip 설치 실행
+    
+    Args:
+        force_install: bool - True면 확인 없이 pip 설치 실행
+        
+    Returns:
+        str: "cached" (스탬프 일치), "checked" (버전 확인 통과), "installed" (pip 설치 실행)
+    """
+    stamp, requirements = build_stamp()
+    if not force_install:
+        if stamp == load_stamp():
+            return "cached"
+        if requirements_satisfied(requirements, stamp["installed"]):
+            save_stamp(stamp)
+            return "checked"
+    
+    install_requirements()
+    new_stamp, _ = build_stamp()
+    save_stamp(new_stamp)
+    return "installed"
+
+class StartupTimer:
+    """시작 단계별 소요 시간 측정 및 첫 프레임까지의 시간 보고"""
+    
+    def __init__(self, start=PROCESS_START):
+        self.start = start
+        self.last = start
+        self.phases = []  # [(단계 이름, 소요 시간(초)), ...]
+        self.reported = False
+
+    def mark(self, name):
+        """직전 기록 시점부터 지금까지를 하나의 단계로 기록"""
+        now = time.perf_counter()
+        if not self.reported:
+            self.phases.append((name, now - self.last))
+        self.last = now
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록 안에서 걸린 시간을 하나의 단계로 기록"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if not self.reported:
+                self.phases.append((name, end - begin))
+            self.last = end
+
+    def first_frame(self):
+        """첫 프레임이 화면에 표시된 시점에 한 번만 보고서 출력 및 기록"""
+        if self.reported:
+            return
+        self.reported = True
+        total = time.perf_counter() - self.start
+        
+        print("⏱️ 시작 시간 보고")
+        for name, seconds in self.phases:
+            print(f"  {name:<20} {seconds * 1000:8.1f} ms")
+        print(f"  {'첫 프레임까지':<20} {total * 1000:8.1f} ms")
+        
+        record = {
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in self.phases},
+            "time_to_first_frame_ms": round(total * 1000, 2)
+        }
+        try:
+            with open(STARTUP_LOG_FILE, "a") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print("시작 시간 기록 실패:", e)
+
+# 전역 시작 타이머 인스턴스
+startup_timer = None
+
+def get_startup_timer():
+    """시작 타이머 싱글톤 반환"""
+    global startup_timer
+    if startup_timer is None:
+        startup_timer = StartupTimer()
+    return startup_timer
@@ -0,0 +1,196 @@
+"""
+Snake Game - 타이머 휠
+틱 단위 만료 이벤트를 관리하는 계층형 타이밍 휠.
+
+효과 지속 시간과 쿨다운을 매 틱 1씩 줄이지 않고, 만료 틱을 한 번 예약해 두었다가
+그 틱이 되면 콜백(효과 종료 처리 등)을 부른다. 틱마다 하는 일은 현재 칸의 타이머를 꺼내는 것뿐이라
+진행 중인 타이머가 없는 뱀은 타이머 관리 비용이 들지 않는다.
+
+    - 휠 한 단계는 WHEEL_SIZE(64)칸이고, 단계 l의 한 칸은 64^l 틱 구간
+    - 남은 시간이 짧은 타이머는 0단계, 먼 타이머는 위 단계에 넣었다가 구간이 다가오면 아래 단계로 내림
+    - 취소는 표시만 하고, 칸을 꺼낼 때 버림
+
+Countdown 속성은 기존 코드처럼 "남은 틱 수" 정수로 읽고 쓸 수 있다.
+    class Snake:
+        dash_duration = Countdown(on_expire="end_dash")
+    snake.dash_duration = 60      # 60틱 뒤 end_dash() 호출
+    snake.dash_duration           # 남은 틱 수 (끝났으면 0)
+    snake.dash_duration = 0       # 취소
+
+Countdown을 쓰는 객체는 생성 시 self.timers에 휠을 지정해야 한다 (보통 get_timer_wheel()).
+"""
+
+import math
+
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4  # 64^4 틱 (15틱 기준 약 13일)까지 한 번에 예약, 그보다 먼 타이머는 맨 위 단계에서 다시 배치
+
+class Timer:
+    """예약된 만료 이벤트 하나"""
+
+    __slots__ = ("deadline", "callback", "args", "wheel", "cancelled")
+
+    def __init__(self, wheel, deadline, callback, args):
+        self.wheel = wheel
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    @property
+    def remaining(self):
+        """만료까지 남은 틱 수 (취소됐거나 지났으면 0)"""
+        if self.cancelled:
+            return 0
+        return max(0, self.deadline - self.wheel.now)
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            self.wheel.pending -= 1
+
+class TimerWheel:
+    """계층형 타이밍 휠 (advance() 한 번이 1틱)"""
+
+    def __init__(self, now=0):
+        self.now = now
+        self.levels = [[[] for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+        self.pending = 0   # 취소되지 않은 대기 타이머 수
+        self.fired = 0     # 지금까지 만료 처리한 타이머 수
+
+    def __len__(self):
+        return self.pending
+
+    def schedule(self, delay, callback, *args):
+        """
+        delay틱 뒤(advance()를 delay번 부른 시점)에 callback(*args) 호출 예약
+
+        Args:
+            delay: int - 1 이상 (소수는 올림)
+            callback: callable - 만료 시 호출할 함수
+
+        Returns:
+            Timer: 취소용 핸들
+        """
+        delay = max(1, math.ceil(delay))
+        timer = Timer(self, self.now + delay, callback, args)
+        self.insert(timer)
+        self.pending += 1
+        return timer
+
+    def insert(self, timer):
+        delta = timer.deadline - self.now
+        for level in range(WHEEL_LEVELS):
+            if delta < WHEEL_SIZE << (WHEEL_BITS * level):
+                slot = (timer.deadline >> (WHEEL_BITS * level)) & WHEEL_MASK
+                break
+        else:
+            # 맨 위 단계보다 먼 타이머 - 한 바퀴 뒤에 다시 배치
+            level = WHEEL_LEVELS - 1
+            slot = (self.now >> (WHEEL_BITS * level)) & WHEEL_MASK
+        self.levels[level][slot].append(timer)
+
+    def cascade(self, level, slot):
+        """위 단계 칸의 타이머를 남은 시간에 맞는 단계로 다시 배치"""
+        timers = self.levels[level][slot]
+        if not timers:
+            return
+        self.levels[level][slot] = []
+        for timer in timers:
+            if not timer.cancelled:
+                self.insert(timer)
+
+    def advance(self, ticks=1):
+        """
+        ticks틱 진행하면서 만료된 타이머의 콜백 호출
+
+        Returns:
+            int: 호출한 콜백 수
+        """
+        fired = 0
+        level0 = self.levels[0]
+        for _ in range(ticks):
+            self.now += 1
+            now = self.now
+            index = now & WHEEL_MASK
+            level = 1
+            while index == 0 and level < WHEEL_LEVELS:
+                index = (now >> (WHEEL_BITS * level)) & WHEEL_MASK
+                self.cascade(level, index)
+                level += 1
+
+            slot = now & WHEEL_MASK
+            timers = level0[slot]
+            if not timers:
+                continue
+            level0[slot] = []
+            for timer in timers:
+                if timer.cancelled:
+                    continue
+                timer.cancelled = True  # 만료 후 cancel()이 불려도 pending이 줄지 않도록
+                self.pending -= 1
+                fired += 1
+                timer.callback(*timer.args)
+        self.fired += fired
+        return fired
+
+def expire_countdown(obj, name):
+    """Countdown 만료 처리 (모듈 함수라 객체와 함께 pickle 가능)"""
+    countdown = getattr(type(obj), name)
+    obj.__dict__[countdown.slot] = None
+    if countdown.on_expire is not None:
+        getattr(obj, countdown.on_expire)()
+
+class Countdown:
+    """남은 틱 수로 읽고 쓰는 타이머 속성 (디스크립터)"""
+
+    def __init__(self, on_expire=None):
+        """
+        Args:
+            on_expire: str - 만료 시 호출할 메서드 이름 (None이면 값만 0이 됨)
+        """
+        self.on_expire = on_expire
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = "_" + name + "_timer"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        timer = obj.__dict__.get(self.slot)
+        if timer is None:
+            return 0
+        return timer.remaining
+
+    def __set__(self, obj, value):
+        timer = obj.__dict__.get(self.slot)
+        if timer is not None:
+            timer.cancel()
+        if value is None or value <= 0:
+            obj.__dict__[self.slot] = None
+        else:
+            obj.__dict__[self.slot] = obj.timers.schedule(value, expire_countdown, obj, self.name)
+
+_timer_wheel = None
+
+def get_timer_wheel():
+    """새로 만드는 객체가 사용할 현재 타이머 휠 (없으면 기본 휠 생성)"""
+    global _timer_wheel
+    if _timer_wheel is None:
+        _timer_wheel = TimerWheel()
+    return _timer_wheel
+
+def set_timer_wheel(wheel):
+    """
+    현재 타이머 휠 지정 (GameWorld가 자기 뱀을 만들기 전에 호출)
+
+    Returns:
+        TimerWheel: 이전 휠
+    """
+    global _timer_wheel
+    previous = _timer_wheel
+    _timer_wheel = wheel
+    return previous
@@ -0,0 +1,457 @@
+"""
+Snake Game - AI 정책 토너먼트
+여러 AI 정책을 1:1 리그전(라운드 로빈)으로 겨루게 해서 승률, 킬 수, 평균 생존 시간을 비교한다.
+
+- 정책: Policy를 상속해서 act(snake, world)로 매 틱 입력을 돌려주는 클래스
+        (기본 제공: greedy - 기존 ai_decide_direction, cautious - 위험 칸 회피, random)
+- 경기: 시드를 고정한 GameWorld에 두 정책의 뱀을 넣고 한쪽이 죽거나 제한 틱이 될 때까지 진행
+        (시드가 홀수면 출발 위치를 바꿔서 자리 유불리를 상쇄)
+- 병렬: 경기들을 프로세스 풀에 나눠서 실행
+- 캐시: (정책 키, 상대 정책 키, 모드, 제한 틱, 시드)별 결과를 SQLite에 저장해서
+        다시 실행하면 새 조합만 계산. 정책 동작을 바꾸면 version을 올려서 캐시를 무효화
+
+실행:
+    python3 tournament.py --policies greedy cautious random --seeds 40
+    python3 tournament.py --policies "greedy" "greedy(detection_range=250, chase_duration=60)" --seeds 100
+    python3 tournament.py --policies greedy mypolicies.SmartPolicy --workers 4
+"""
+
+import argparse
+import ast
+import functools
+import importlib
+import json
+import math
+import os
+import random
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import multiprocessing
+import module
+from module import CELL_SIZE, WIDTH, HEIGHT, DIRECTION_STEPS, OPPOSITE
+from world import GameWorld, DIRECTIONS
+from arena import BODIES
+from profiler import worker_job, collect_worker_results
+
+TOURNAMENT_DB_FILE = "tournament_cache.db"
+DEFAULT_MAX_TICKS = 3000   # 경기당 제한 틱 (200초)
+DEFAULT_SEEDS = 20         # 조합당 경기 수
+Z_95 = 1.96                # 95% 신뢰구간
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    policy_a  TEXT    NOT NULL,
+    policy_b  TEXT    NOT NULL,
+    mode      TEXT    NOT NULL,
+    max_ticks INTEGER NOT NULL,
+    seed      INTEGER NOT NULL,
+    result    TEXT    NOT NULL,
+    PRIMARY KEY (policy_a, policy_b, mode, max_ticks, seed)
+);
+"""
+
+#############################################
+# 정책
+#############################################
+class Policy:
+    """
+    AI 정책 기본 클래스
+
+    name: 정책 이름, version: 동작을 바꾸면 올릴 번호 (캐시 구분용)
+    생성 인자는 params로 보관해서 캐시 키와 다른 프로세스로 보낼 때 사용한다.
+    """
+
+    name = "policy"
+    version = 1
+
+    def __init__(self, **params):
+        self.params = params
+
+    def key(self):
+        """캐시 키 (이름 + 인자 + 버전)"""
+        if self.params:
+            args = ", ".join(f"{k}={self.params[k]!r}" for k in sorted(self.params))
+            return f"{self.name}({args})@{self.version}"
+        return f"{self.name}@{self.version}"
+
+    def label(self):
+        return self.key().rsplit("@", 1)[0]
+
+    def reset(self, snake, seed):
+        """경기 시작 시 호출 (seed: 정책 자체 난수용)"""
+
+    def act(self, snake, world):
+        """
+        매 틱 입력 결정
+
+        Returns:
+            dict: GameWorld.apply_input 인자 (direction, dash 등) 또는 None
+        """
+        raise NotImplementedError
+
+class GreedyPolicy(Policy):
+    """
+    기존 AI (Snake.ai_decide_direction) - 가까운 상대를 추적하고 아니면 가장 가까운 음식으로 이동
+
+    detection_range / chase_duration을 주면 그 경기 동안 module의
+    PLAYER_DETECTION_RANGE / CHASE_DURATION 값을 바꿔서 실행한다.
+    """
+
+    name = "greedy"
+    version = 2
+
+    def __init__(self, detection_range=None, chase_duration=None):
+        params = {}
+        if detection_range is not None:
+            params["detection_range"] = detection_range
+        if chase_duration is not None:
+            params["chase_duration"] = chase_duration
+        super().__init__(**params)
+
+    def reset(self, snake, seed):
+        snake.init_ai_attributes()
+
+    def act(self, snake, world):
+        # ai_decide_direction은 목록에서 처음 만나는 플레이어 뱀을 추적하므로 자기 자신은 뺀다
+        others = [other for other in world.snakes if other is not snake]
+        saved = (module.PLAYER_DETECTION_RANGE, module.CHASE_DURATION)
+        module.PLAYER_DETECTION_RANGE = self.params.get("detection_range", saved[0])
+        module.CHASE_DURATION = self.params.get("chase_duration", saved[1])
+        try:
+            snake.ai_decide_direction(world.food_list, others)
+        finally:
+            module.PLAYER_DETECTION_RANGE, module.CHASE_DURATION = saved
+        return None
+
+class CautiousPolicy(Policy):
+    """가장 가까운 음식으로 가되, 다음 칸이 몸통/벽이면 안전한 방향을 고름"""
+
+    name = "cautious"
+    version = 2
+
+    def act(self, snake, world):
+        head_x, head_y = snake.get_head()
+        arena = world.arena  # 다음 칸은 머리 칸이 아니므로 칸 개수만 보면 됨
+        cell_x, cell_y = int(head_x) // CELL_SIZE, int(head_y) // CELL_SIZE
+        columns, rows = WIDTH // CELL_SIZE, HEIGHT // CELL_SIZE
+
+        target = None
+        best_distance = None
+        for food in world.food_list:
+            distance = abs(food.x - head_x) + abs(food.y - head_y)
+            if best_distance is None or distance < best_distance:
+                target, best_distance = food, distance
+
+        best = None
+        best_score = None
+        for direction in DIRECTIONS:
+            if direction == OPPOSITE[snake.direction]:
+                continue
+            step_x, step_y = DIRECTION_STEPS[direction]
+            x, y = cell_x + step_x, cell_y + step_y
+            if not (0 <= x < columns and 0 <= y < rows) or arena.count(BODIES, x * CELL_SIZE, y * CELL_SIZE):
+                continue
+            score = 0 if target is None else abs(target.x / CELL_SIZE - x) + abs(target.y / CELL_SIZE - y)
+            if best_score is None or score < best_score:
+                best, best_score = direction, score
+        return {"direction": best} if best is not None else None
+
+class RandomPolicy(Policy):
+    """기준선 - 일정 확률로 무작위 방향 전환 (반대 방향 제외)"""
+
+    name = "random"
+    version = 2
+
+    def __init__(self, turn_chance=0.1):
+        super().__init__(turn_chance=turn_chance)
+        self.rng = random.Random()
+
+    def reset(self, snake, seed):
+        self.rng.seed(seed)
+
+    def act(self, snake, world):
+        if self.rng.random() < self.params["turn_chance"]:
+            choices = [d for d in DIRECTIONS if d != OPPOSITE[snake.direction]]
+            return {"direction": self.rng.choice(choices)}
+        return None
+
+POLICIES = {
+    GreedyPolicy.name: GreedyPolicy,
+    CautiousPolicy.name: CautiousPolicy,
+    RandomPolicy.name: RandomPolicy,
+}
+
+def parse_policy(spec):
+    """
+    정책 지정 문자열 해석
+
+    "greedy", "greedy(detection_range=250)", "mypolicies.SmartPolicy(depth=2)" 형식
+    (점이 있으면 모듈 경로로 가져옴)
+    """
+    match = re.fullmatch(r"\s*([\w.]+)\s*(?:\((.*)\))?\s*", spec)
+    if match is None:
+        raise ValueError(f"정책 지정 형식 오류: {spec}")
+    name, args = match.groups()
+    if "." in name:
+        module_name, class_name = name.rsplit(".", 1)
+        policy_class = getattr(importlib.import_module(module_name), class_name)
+    elif name in POLICIES:
+        policy_class = POLICIES[name]
+    else:
+        raise ValueError(f"알 수 없는 정책: {name} (사용 가능: {', '.join(POLICIES)})")
+    params = {}
+    if args and args.strip():
+        call = ast.parse(f"f({args})", mode="eval").body
+        params = {keyword.arg: ast.literal_eval(keyword.value) for keyword in call.keywords}
+    return policy_class(**params)
+
+#############################################
+# 경기
+#############################################
+def find_killer(victim, candidates):
+    """죽은 뱀의 머리가 몸통(머리 제외)과 같은 칸인 상대 반환 (머리끼리 충돌, 자기 충돌, 에너지 고갈이면 None)"""
+    head = victim.get_head()
+    for other in candidates:
+        if other is victim:
+            continue
+        if head in other.body[1:]:
+            return other
+    return None
+
+def play_match(policy_a, policy_b, seed, mode="CLASSIC", max_ticks=DEFAULT_MAX_TICKS):
+    """
+    두 정책의 1:1 경기
+
+    Returns:
+        dict: {"winner": 0/1/None, "kills": [a, b], "survival": [a, b], "score": [a, b], "ticks"}
+    """
+    world = GameWorld(mode, seed=seed, initial_ai=0)
+    policies = [policy_a, policy_b]
+    # 시드가 홀수면 b가 먼저(고정 출발 위치) 들어감
+    order = [1, 0] if seed % 2 else [0, 1]
+    player_ids = [None, None]
+    for side in order:
+        player_ids[side] = world.add_player(f"{policies[side].label()}#{side}")
+    snakes = [world.players[player_id] for player_id in player_ids]
+    for side in (0, 1):
+        policies[side].reset(snakes[side], seed * 2 + side)
+
+    kills = [0, 0]
+    survival = [max_ticks, max_ticks]
+    while world.tick < max_ticks and not world.finished:
+        for side in (0, 1):
+            if snakes[side].alive:
+                action = policies[side].act(snakes[side], world)
+                if action:
+                    world.apply_input(player_ids[side], **action)
+        alive_before = [snake.alive for snake in snakes]
+        world.step()
+        for side in (0, 1):
+            if alive_before[side] and not snakes[side].alive:
+                survival[side] = world.tick
+                killer = find_killer(snakes[side], world.snakes)
+                if killer is snakes[1 - side]:
+                    kills[1 - side] += 1
+        if not all(snake.alive for snake in snakes):
+            break
+
+    alive = [snake.alive for snake in snakes]
+    scores = [snake.score for snake in snakes]
+    if alive[0] != alive[1]:
+        winner = 0 if alive[0] else 1
+    elif scores[0] != scores[1]:
+        winner = 0 if scores[0] > scores[1] else 1
+    else:
+        winner = None
+    return {"winner": winner, "kills": kills, "survival": survival, "score": scores, "ticks": world.tick}
+
+def run_match(job):
+    """프로세스 풀 작업 단위 (정책은 pickle로 전달)"""
+    policy_a, policy_b, seed, mode, max_ticks = job
+    return play_match(policy_a, policy_b, seed, mode, max_ticks)
+
+#############################################
+# 캐시
+#############################################
+class MatchCache:
+    """경기 결과 캐시 (SQLite)"""
+
+    def __init__(self, path=TOURNAMENT_DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def get(self, key_a, key_b, mode, max_ticks, seed):
+        row = self.conn.execute(
+            "SELECT result FROM matches WHERE policy_a=? AND policy_b=? AND mode=? AND max_ticks=? AND seed=?",
+            (key_a, key_b, mode, max_ticks, seed)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key_a, key_b, mode, max_ticks, seed, result):
+        self.conn.execute("INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?)",
+                          (key_a, key_b, mode, max_ticks, seed, json.dumps(result)))
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+#############################################
+# 통계
+#############################################
+def wilson_interval(successes, total, z=Z_95):
+    """비율의 Wilson 신뢰구간 (표본이 적거나 0%/100%에 가까워도 안정적)"""
+    if total == 0:
+        return 0.0, 0.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return center - margin, center + margin
+
+def mean_interval(values, z=Z_95):
+    """평균과 신뢰구간 반폭 (정규 근사)"""
+    count = len(values)
+    if count == 0:
+        return 0.0, 0.0
+    mean = sum(values) / count
+    if count == 1:
+        return mean, 0.0
+    variance = sum((value - mean) ** 2 for value in values) / (count - 1)
+    return mean, z * math.sqrt(variance / count)
+
+class PolicyStats:
+    """정책 하나의 누적 결과"""
+
+    def __init__(self):
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.kills = []
+        self.survival = []
+        self.scores = []
+
+    @property
+    def matches(self):
+        return self.wins + self.draws + self.losses
+
+    def add(self, result, side):
+        winner = result["winner"]
+        if winner is None:
+            self.draws += 1
+        elif winner == side:
+            self.wins += 1
+        else:
+            self.losses += 1
+        self.kills.append(result["kills"][side])
+        self.survival.append(result["survival"][side])
+        self.scores.append(result["score"][side])
+
+#############################################
+# 토너먼트
+#############################################
+def run_tournament(policies, seeds, mode="CLASSIC", max_ticks=DEFAULT_MAX_TICKS,
+                   workers=None, cache_path=TOURNAMENT_DB_FILE):
+    """
+    라운드 로빈 토너먼트 실행
+
+    Args:
+        policies: list - Policy 객체 목록
+        seeds: iterable - 조합마다 치를 경기 시드
+        workers: int - 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+
+    Returns:
+        tuple: (정책 키별 PolicyStats, (키 a, 키 b)별 [a 승, 무, b 승], 새로 계산한 경기 수)
+    """
+    cache = MatchCache(cache_path)
+    seeds = list(seeds)
+    results = []
+    jobs = []
+    for policy_a, policy_b in combinations(policies, 2):
+        key_a, key_b = policy_a.key(), policy_b.key()
+        for seed in seeds:
+            cached = cache.get(key_a, key_b, mode, max_ticks, seed)
+            if cached is not None:
+                results.append((key_a, key_b, cached))
+            else:
+                jobs.append((policy_a, policy_b, seed, mode, max_ticks))
+
+    if jobs:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                # 계측 중이면 워커별 구간 통계도 함께 받아서 이 프로세스의 결과에 합침
+                outputs = pool.map(functools.partial(worker_job, run_match), jobs,
+                                   chunksize=max(1, len(jobs) // (workers * 4)))
+                computed = collect_worker_results(outputs)
+        else:
+            computed = [run_match(job) for job in jobs]
+        for job, result in zip(jobs, computed):
+            policy_a, policy_b, seed = job[:3]
+            cache.put(policy_a.key(), policy_b.key(), mode, max_ticks, seed, result)
+            results.append((policy_a.key(), policy_b.key(), result))
+        cache.commit()
+    cache.close()
+
+    stats = {policy.key(): PolicyStats() for policy in policies}
+    head_to_head = {}
+    for key_a, key_b, result in results:
+        stats[key_a].add(result, 0)
+        stats[key_b].add(result, 1)
+        record = head_to_head.setdefault((key_a, key_b), [0, 0, 0])
+        winner = result["winner"]
+        record[1 if winner is None else (0 if winner == 0 else 2)] += 1
+    return stats, head_to_head, len(jobs)
+
+def print_report(policies, stats, head_to_head):
+    """정책별 결과와 상대 전적 출력"""
+    labels = {policy.key(): policy.label() for policy in policies}
+    width = max(len(label) for label in labels.values()) + 2
+    print(f"{'정책':<{width}}{'경기':>6}{'승':>5}{'무':>5}{'패':>5}"
+          f"{'승률 [95% CI]':>22}{'킬/경기':>16}{'생존 틱':>18}{'점수':>14}")
+    ranked = sorted(policies, key=lambda p: -stats[p.key()].wins / max(1, stats[p.key()].matches))
+    for policy in ranked:
+        s = stats[policy.key()]
+        low, high = wilson_interval(s.wins, s.matches)
+        rate = s.wins / s.matches if s.matches else 0.0
+        kills, kills_ci = mean_interval(s.kills)
+        survival, survival_ci = mean_interval(s.survival)
+        score, score_ci = mean_interval(s.scores)
+        print(f"{labels[policy.key()]:<{width}}{s.matches:>6}{s.wins:>5}{s.draws:>5}{s.losses:>5}"
+              f"{rate:>9.1%} [{low:.2f}, {high:.2f}]"
+              f"{kills:>9.2f} ±{kills_ci:<5.2f}{survival:>10.0f} ±{survival_ci:<6.0f}{score:>7.1f} ±{score_ci:<5.1f}")
+
+    print("\n상대 전적 (a 승 / 무 / b 승)")
+    for (key_a, key_b), (wins_a, draws, wins_b) in head_to_head.items():
+        print(f"  {labels[key_a]} vs {labels[key_b]}: {wins_a} / {draws} / {wins_b}")
+
+def main():
+    parser = argparse.ArgumentParser(description="AI 정책 토너먼트")
+    parser.add_argument("--policies", nargs="+", default=["greedy", "cautious", "random"],
+                        help='정책 지정 (예: greedy "greedy(detection_range=250)" mypolicies.SmartPolicy)')
+    parser.add_argument("--seeds", type=int, default=DEFAULT_SEEDS, help="조합당 경기 수")
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--mode", default="CLASSIC", choices=("CLASSIC", "EVOLUTION"))
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--cache", default=TOURNAMENT_DB_FILE, help="결과 캐시 파일")
+    args = parser.parse_args()
+
+    policies = [parse_policy(spec) for spec in args.policies]
+    keys = [policy.key() for policy in policies]
+    if len(set(keys)) != len(keys):
+        parser.error("같은 정책이 두 번 지정되었습니다")
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    stats, head_to_head, computed = run_tournament(policies, seeds, args.mode, args.max_ticks,
+                                                   args.workers, args.cache)
+    total = sum(sum(record) for record in head_to_head.values())
+    print(f"경기 {total}개 (새로 계산 {computed}, 캐시 {total - computed}), 모드 {args.mode}, 제한 {args.max_ticks}틱\n")
+    print_report(policies, stats, head_to_head)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+"""
+Snake Game - 게임 월드 모듈
+화면 없이 한 판의 게임 상태(뱀, 음식, 보스)를 한 틱씩 진행하는 시뮬레이션.
+main.game_loop의 상태 업데이트 규칙을 그대로 따르며,
+멀티플레이 서버처럼 여러 플레이어 입력을 받아 진행하는 곳에서 사용한다.
+"""
+
+import random
+from module import (
+    Snake, BossSnake, SpecialItem, spawn_food, spawn_ai_snake, spawn_special_item,
+    find_safe_spawn_location, handle_collisions, handle_boss_collision, release_food, PROJECTILE_POOL,
+    set_arena, plannable_ai_indices, WIDTH, HEIGHT, CELL_SIZE, GREEN, EVOLUTION_FORMS, SPECIAL_ITEMS, CHARGE_DURATION
+)
+from timer_wheel import TimerWheel, set_timer_wheel
+from arena import Arena
+from ai_planner import AIPlanner
+
+TICK_RATE = 15  # 초당 시뮬레이션 틱 수 (game_loop의 clock.tick(15)와 동일)
+MIN_FOOD = 10   # 음식 보충 기준
+
+# 원격 플레이어 색상 (입장 순서대로 돌아가며 사용)
+PLAYER_COLORS = [
+    GREEN, (0, 200, 200), (255, 105, 180), (240, 230, 140),
+    (255, 140, 0), (173, 255, 47), (135, 206, 250), (221, 160, 221)
+]
+
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+# 음식 종류 번호: 0 일반, 1 황금 아이템, 2~ 특수 아이템 (SPECIAL_ITEMS 순서)
+FOOD_NORMAL = 0
+FOOD_ITEM = 1
+SPECIAL_ITEM_TYPES = list(SPECIAL_ITEMS)
+
+# 효과 비트 순서 (active_effects 이름 + 대시/돌진 상태)
+EFFECT_NAMES = ("SHIELD", "SPEED_BOOST", "GHOST", "INVINCIBLE", "STUN")
+EFFECT_DASHING = 1 << len(EFFECT_NAMES)
+EFFECT_CHARGING = EFFECT_DASHING << 1
+
+def get_food_kind(food):
+    """음식 종류 번호 반환"""
+    if isinstance(food, SpecialItem):
+        return 2 + SPECIAL_ITEM_TYPES.index(food.type)
+    return FOOD_ITEM if food.is_item else FOOD_NORMAL
+
+def get_effect_mask(snake):
+    """활성 효과를 비트 마스크로 변환"""
+    mask = 0
+    effects = snake.active_effects
+    for bit, name in enumerate(EFFECT_NAMES):
+        if effects.get(name, 0) > 0:
+            mask |= 1 << bit
+    if snake.is_dashing:
+        mask |= EFFECT_DASHING
+    if getattr(snake, 'is_charging', False):
+        mask |= EFFECT_CHARGING
+    return mask
+
+def update_ai_population(snakes, ai_check_timer, ai_timer):
+    """
+    AI 뱀 개체 수를 관리하는 함수
+
+    매개변수:
+        snakes: list - 게임 내 모든 뱀 목록
+        ai_check_timer: int - AI 체크 타이머
+        ai_timer: int - AI 생성 타이머
+
+    기능:
+        - 현재 AI 뱀 개체 수 확인
+        - 필요한 경우 새로운 AI 뱀 생성
+        - 최소 AI 개체 수 유지
+    """
+    current_ai_count = sum(1 for s in snakes if s.is_ai and s.alive)
+
+    if ai_check_timer >= 150:
+        if current_ai_count < 7:
+            spawn_ai_snake(snakes)
+        ai_check_timer = 0
+
+    if current_ai_count < 3:
+        spawn_ai_snake(snakes)
+        ai_timer = 0
+        ai_check_timer = 0
+
+def update_items(food_list, snakes, item_timer, special_item_timer):
+    """
+    아이템 생성을 관리하는 함수
+
+    매개변수:
+        food_list: list - 게임 내 모든 음식/아이템 목록
+        snakes: list - 게임 내 모든 뱀 목록
+        item_timer: int - 일반 아이템 생성 타이머
+        special_item_timer: int - 특수 아이템 생성 타이머
+    """
+    # 일반 아이템과 특수 아이템 개수 확인
+    normal_item_count = sum(1 for food in food_list if food.is_item and not isinstance(food, SpecialItem))
+    special_item_count = sum(1 for food in food_list if isinstance(food, SpecialItem))
+
+    # 일반 아이템 생성 (최대 3개)
+    if item_timer >= 225:  # 15초 (15fps * 15)
+        if normal_item_count < 3:
+            spawn_food(food_list, snakes, is_item=True)
+        item_timer = 0
+
+    # 특수 아이템 생성 (최대 3개)
+    if special_item_timer >= 225:  # 15초
+        if special_item_count < 3:
+            spawn_special_item(food_list, snakes)
+        special_item_timer = 0
+
+def update_snakes(snakes, food_list, tick, game_mode):
+    """
+    모든 뱀의 상태를 업데이트하는 함수
+
+    매개변수:
+        snakes: list - 게임 내 모든 뱀 목록
+        food_list: list - 게임 내 모든 음식/아이템 목록
+        tick: int - 현재 게임 틱
+        game_mode: str - 현재 게임 모드
+
+    기능:
+        - 각 뱀의 이동 처리 (효과/쿨다운 만료는 타이머 휠이 처리)
+    """
+    for snake in snakes:
+        if snake.alive:
+            snake.move(food_list, snakes, tick)
+
+def start_charge(player):
+    """보스 모드 돌진 시작 (F 키) - 에너지 30 소모, 1초 돌진 + 5초 무적"""
+    if getattr(player, 'is_charging', False) or player.energy < 30:
+        return False
+    player.energy -= 30
+    player.is_charging = True
+    player.charge_timer = CHARGE_DURATION
+    player.collision_immune = True  # 5초 무적 시작
+    player.invincible_time = 75
+    return True
+
+class GameWorld:
+    """화면 없이 진행되는 게임 한 판 (여러 플레이어 지원)"""
+
+    def __init__(self, game_mode="EVOLUTION", seed=None, initial_ai=None, ai_workers=0):
+        """
+        Args:
+            game_mode: str - 게임 모드 ("CLASSIC", "EVOLUTION", "BOSS")
+            seed: int - 난수 시드 (None이면 시드를 건드리지 않음)
+            initial_ai: int - 처음 생성할 AI 뱀 수 (None이면 game_loop와 동일한 모드별 기본값)
+            ai_workers: int - AI 계획 워커 프로세스 수 (0이면 끔, 켜면 진행이 시간에 따라 달라지고
+                              pickle로 옮길 수 없음. 다 쓴 뒤 release_entities로 워커 정리)
+        """
+        if seed is not None:
+            random.seed(seed)
+        # 효과/쿨다운 만료 타이머 (step 끝에서 1틱씩 진행, 이 월드의 뱀은 생성 시 이 휠을 사용)
+        self.timers = TimerWheel()
+        set_timer_wheel(self.timers)
+        # 뱀 몸통/음식/투사체 점유 격자 (이 월드의 뱀과 음식 생성은 이 격자를 사용)
+        # AI 계획 워커를 쓰면 워커가 읽을 수 있도록 공유 메모리 위에 둠
+        self.planner = AIPlanner(ai_workers) if ai_workers else None
+        self.arena = self.planner.new_arena() if self.planner is not None else Arena(WIDTH, HEIGHT, CELL_SIZE)
+        set_arena(self.arena)
+        self.game_mode = game_mode
+        self.snakes = []
+        self.food_list = []
+        self.players = {}           # player_id -> Snake
+        self.next_entity_id = 1
+        self.boss = None
+        self.finished = False
+
+        # game_loop와 같은 타이머 초기값
+        self.tick = 0
+        self.ai_timer = 0
+        self.ai_check_timer = 0
+        self.item_timer = 225
+        self.special_item_timer = 225
+
+        if game_mode == "BOSS":
+            self.boss = BossSnake(WIDTH * 3 // 4, HEIGHT // 2)
+            self.snakes.append(self.boss)
+        if initial_ai is None:
+            initial_ai = {"CLASSIC": 1, "EVOLUTION": 3}.get(game_mode, 0)
+        for _ in range(initial_ai):
+            spawn_ai_snake(self.snakes)
+        for _ in range(MIN_FOOD):
+            spawn_food(self.food_list, self.snakes)
+        self.assign_entity_ids()
+
+    def assign_entity_ids(self):
+        """새로 생긴 뱀에 고유 번호 부여 (AI 자동 생성분 포함)"""
+        for snake in self.snakes:
+            if snake.entity_id is None:
+                snake.entity_id = self.next_entity_id
+                self.next_entity_id += 1
+
+    def add_player(self, name):
+        """
+        플레이어 뱀 추가
+
+        Returns:
+            int: 플레이어 번호 (뱀의 entity_id)
+        """
+        set_timer_wheel(self.timers)
+        set_arena(self.arena)
+        if self.players:
+            x, y = find_safe_spawn_location(self.snakes)
+        else:
+            x, y = WIDTH // 4, HEIGHT // 2  # 첫 플레이어는 game_loop와 같은 위치
+        color = PLAYER_COLORS[len(self.players) % len(PLAYER_COLORS)]
+        player = Snake(x, y, color=color, name=name, is_ai=False)
+        self.snakes.append(player)
+        self.assign_entity_ids()
+        self.players[player.entity_id] = player
+        return player.entity_id
+
+    def remove_player(self, player_id):
+        """플레이어 퇴장 - 뱀은 죽은 것으로 처리하고 목록에서 제거"""
+        player = self.players.pop(player_id, None)
+        if player is not None:
+            player.alive = False
+            if player in self.snakes:
+                self.snakes.remove(player)
+            player.leave_arena()
+
+    def respawn_player(self, player_id):
+        """죽은 플레이어를 같은 번호로 새 위치에 다시 생성"""
+        old = self.players.get(player_id)
+        if old is None or old.alive:
+            return False
+        set_timer_wheel(self.timers)
+        set_arena(self.arena)
+        old.leave_arena()
+        x, y = find_safe_spawn_location(self.snakes)
+        player = Snake(x, y, color=old.color, name=old.name, is_ai=False)
+        player.entity_id = player_id
+        self.snakes[self.snakes.index(old)] = player
+        self.players[player_id] = player
+        return True
+
+    def apply_input(self, player_id, direction=None, dash=False, charge=False,
+                    tank=False, evolve=None, upgrade=None):
+        """
+        플레이어 입력 적용 (game_loop의 키 입력 처리와 같은 규칙)
+
+        Args:
+            player_id: int - 플레이어 번호
+            direction: str - "UP", "DOWN", "LEFT", "RIGHT" 중 하나
+            dash: bool - 대시 (SPACE)
+            charge: bool - 돌진 (보스 모드 F)
+            tank: bool - 탱크 면역 (E)
+            evolve: str - 진화 형태 ("SPEEDER", "TANK", "HUNTER", "ULTIMATE")
+            upgrade: str - 스탯 업그레이드 ("SPEED", "ENERGY")
+        """
+        player = self.players.get(player_id)
+        if player is None or not player.alive:
+            return
+        if direction in DIRECTIONS:
+            player.direction = direction
+        if dash:
+            player.dash()
+        if self.game_mode in ("EVOLUTION", "BOSS"):
+            if tank:
+                player.activate_tank_immunity()
+            if evolve in EVOLUTION_FORMS and evolve != "NORMAL" and player.can_evolve():
+                if (evolve == "ULTIMATE") == (player.level >= 10):
+                    player.evolve(evolve)
+            if upgrade is not None:
+                player.upgrade_stat(upgrade)
+        if charge and self.game_mode == "BOSS":
+            start_charge(player)
+
+    def nearest_player(self, x, y):
+        """(x, y)에서 가장 가까운 살아있는 플레이어 (보스 목표 선택용)"""
+        best = None
+        best_distance = None
+        for player in self.players.values():
+            if not player.alive:
+                continue
+            head_x, head_y = player.get_head()
+            distance = (head_x - x) ** 2 + (head_y - y) ** 2
+            if best_distance is None or distance < best_distance:
+                best, best_distance = player, distance
+        return best
+
+    def step(self):
+        """한 틱 진행 (game_loop의 게임 상태 업데이트 부분과 같은 순서)"""
+        if self.finished:
+            return
+        set_timer_wheel(self.timers)  # 번식/AI 보충으로 생기는 뱀용
+        set_arena(self.arena)
+        self.tick += 1
+        self.ai_timer += 1
+        self.ai_check_timer += 1
+
+        if self.game_mode == "EVOLUTION":
+            update_ai_population(self.snakes, self.ai_check_timer, self.ai_timer)
+            self.item_timer += 1
+            self.special_item_timer += 1
+            # 진화 모드 아이템 생성 (일반: 15초, 특수: 30초)
+            if self.item_timer >= 225:
+                normal_item_count = sum(1 for food in self.food_list
+                                        if food.is_item and not isinstance(food, SpecialItem))
+                if normal_item_count < 3:
+                    spawn_food(self.food_list, self.snakes, is_item=True)
+                self.item_timer = 0
+            if self.special_item_timer >= 450:
+                special_item_count = sum(1 for food in self.food_list if isinstance(food, SpecialItem))
+                if special_item_count < 3:
+                    spawn_special_item(self.food_list, self.snakes)
+                self.special_item_timer = 0
+        elif self.game_mode == "BOSS":
+            # game_loop는 보스 모드 타이머를 두 번 올림
+            self.item_timer += 2
+            self.special_item_timer += 2
+            update_items(self.food_list, self.snakes, self.item_timer, self.special_item_timer)
+
+        if self.boss is not None:
+            boss = self.boss
+            target = self.nearest_player(*boss.get_head())
+            if target is not None:
+                boss.update_boss_state(target)
+                boss.boss_ai_behavior(target, self.food_list)
+                boss.update_projectiles()
+                for player in list(self.players.values()):
+                    handle_boss_collision(boss, player)
+            if not boss.alive:
+                self.finished = True
+                return
+
+        if self.planner is not None:
+            self.planner.plan(self.snakes, plannable_ai_indices(self.snakes), self.tick)
+        update_snakes(self.snakes, self.food_list, self.tick, self.game_mode)
+        handle_collisions(self.snakes)
+        if len(self.food_list) < MIN_FOOD:
+            spawn_food(self.food_list, self.snakes)
+
+        self.prune_dead_ai()
+        self.assign_entity_ids()
+        self.timers.advance()
+
+    def prune_dead_ai(self):
+        """죽은 AI 뱀 제거 (오래 도는 서버에서 목록이 계속 커지지 않도록)"""
+        if any(snake.is_ai and not snake.alive and snake is not self.boss for snake in self.snakes):
+            kept = []
+            for snake in self.snakes:
+                if snake.alive or not snake.is_ai or snake is self.boss:
+                    kept.append(snake)
+                else:
+                    snake.leave_arena()
+            self.snakes[:] = kept
+
+    def release_entities(self):
+        """다 쓴 월드의 음식/아이템/투사체를 객체 풀에 반환 (이후 이 월드는 사용하지 않음)"""
+        for food in self.food_list:
+            release_food(food)
+        self.food_list.clear()
+        if self.boss is not None:
+            for projectile in self.boss.projectiles:
+                PROJECTILE_POOL.release(projectile)
+            self.boss.projectiles.clear()
+        if self.planner is not None:
+            self.planner.close()
+            self.planner = None
+
+    def snapshot(self):
+        """
+        현재 상태를 직렬화 가능한 딕셔너리로 변환 (전체 상태)
+
+        Returns:
+            dict: {"tick", "mode", "snakes", "food", "projectiles", "finished"}
+        """
+        snakes = []
+        for snake in self.snakes:
+            if not snake.alive and snake.is_ai:
+                continue
+            body = []
+            for segment in snake.body:
+                body.append(int(segment[0]))
+                body.append(int(segment[1]))
+            snakes.append({
+                "id": snake.entity_id,
+                "name": snake.name,
+                "color": list(snake.color),
+                "ai": snake.is_ai,
+                "alive": snake.alive,
+                "score": snake.score,
+                "energy": round(min(snake.energy, 9999), 1),
+                "level": snake.level,
+                "form": snake.evolution_form,
+                "effects": get_effect_mask(snake),
+                "body": body,
+            })
+        food = []
+        for item in self.food_list:
+            food.extend((int(item.x), int(item.y), get_food_kind(item)))
+        projectiles = []
+        if self.boss is not None:
+            for projectile in self.boss.projectiles:
+                projectiles.extend((int(projectile.x), int(projectile.y)))
+        return {
+            "tick": self.tick,
+            "mode": self.game_mode,
+            "snakes": snakes,
+            "food": food,
+            "projectiles": projectiles,
+            "boss_health": self.boss.health if self.boss is not None else None,
+            "finished": self.finished,
+        }